@@ -0,0 +1,103 @@
+"""
+Reloading stored kasko extractions: json.loads plus one constructor call per node against batch validate_json.
+
+The batch file holds ``--nodes`` nodes spread over every kasko node class, grouped by class as written by
+:func:`dump_nodes`. With ``--memory`` the peak of temporary allocations (tracemalloc peak minus what the loaded nodes
+retain) is reported too, which slows both loaders down considerably. ``--pause-gc`` disables the cyclic garbage
+collector around every load, the tuning a caller loading large batches can apply itself.
+
+Run with ``uv run python -m benchmarks.bench_bulk_load --nodes 1000000``.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from pydantic_core import to_json
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import sample_payload
+from sw_onto_generation.extraction.bulk import load_nodes
+from sw_onto_generation.utils import get_ontology_registry
+
+LIB_NAME, ONTOLOGY_NAME = "LegalContract", "kasko_police"
+
+
+def build_batch(count: int) -> bytes:
+    node_classes = get_ontology_registry().node_classes(LIB_NAME, ONTOLOGY_NAME)
+    groups: dict[str, list[dict[str, Any]]] = {node_cls.__name__: [] for node_cls in node_classes}
+    for i in range(count):
+        node_cls = node_classes[i % len(node_classes)]
+        groups[node_cls.__name__].append(sample_payload(node_cls, i))
+    return to_json(groups)
+
+
+def load_with_dicts(data: bytes) -> dict[type, list[Any]]:
+    registry = get_ontology_registry()
+    return {
+        registry.get_class(LIB_NAME, ONTOLOGY_NAME, class_name): [registry.get_class(LIB_NAME, ONTOLOGY_NAME, class_name)(**item) for item in items] for class_name, items in json.loads(data).items()
+    }
+
+
+def paused_gc(loader: Callable[[bytes], dict[type, list[Any]]]) -> Callable[[bytes], dict[type, list[Any]]]:
+    def load(data: bytes) -> dict[type, list[Any]]:
+        gc.disable()
+        try:
+            return loader(data)
+        finally:
+            gc.enable()
+
+    return load
+
+
+def measure(loader: Callable[[bytes], dict[type, list[Any]]], data: bytes, memory: bool) -> tuple[float, int, float | None]:
+    gc.collect()
+    start = time.perf_counter()
+    result = loader(data)
+    elapsed = time.perf_counter() - start
+    count = sum(map(len, result.values()))
+    del result
+
+    temporary = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        result = loader(data)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        temporary = (peak - retained) / 1e6
+        del result
+    return elapsed, count, temporary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--memory", action="store_true", help="also report temporary allocations with tracemalloc")
+    parser.add_argument("--pause-gc", action="store_true", help="disable the cyclic garbage collector while loading")
+    args = parser.parse_args()
+
+    data = build_batch(args.nodes)
+    table = Table(title=f"{args.nodes:,} kasko nodes, {len(data) / 1e6:.0f} MB batch")
+    for column in ("loader", "nodes", "seconds", "nodes/s", "temporary MB"):
+        table.add_column(column, justify="right")
+
+    loaders = {
+        "json.loads + Node(**data)": load_with_dicts,
+        "batch validate_json": lambda batch: load_nodes(batch, LIB_NAME, ONTOLOGY_NAME),
+    }
+    for name, loader in loaders.items():
+        if args.pause_gc:
+            loader = paused_gc(loader)
+        elapsed, count, temporary = measure(loader, data, args.memory)
+        table.add_row(name, f"{count:,}", f"{elapsed:.2f}", f"{count / elapsed:,.0f}", "-" if temporary is None else f"{temporary:,.0f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Cold start of an extraction worker with eager and deferred (``SW_ONTO_DEFER_BUILD=1``) pydantic model builds.
+
+Every sample runs in a fresh interpreter and measures three points of one ontology:
+
+- import: package import plus loading the ontology's classes through the registry
+- first node: import plus validating and dumping one GeneralDocumentInfo, what a worker needs to answer its first request
+- all built: every node and relation model of the ontology built
+
+The "deferred + warm-up" row starts ``warm_up_models`` in the background right after import and joins it at the end.
+
+Run with ``uv run python -m benchmarks.bench_cold_start --ontology kasko_police --repeat 10``.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+_PROBE = """
+import json, time
+start = time.perf_counter()
+from sw_onto_generation.common.common_nodes import GeneralDocumentInfo
+from sw_onto_generation.utils import get_all_common_and_specific_root_classes, warm_up_models
+get_all_common_and_specific_root_classes({lib!r}, {ontology!r})
+imported = time.perf_counter()
+thread = warm_up_models(lib_name={lib!r}, ontology_name={ontology!r}) if {warm_up} else None
+GeneralDocumentInfo(reason="ilk istek", sozlesme_no="1").model_dump()
+first_node = time.perf_counter()
+if thread is not None:
+    thread.join()
+warm_up_models(lib_name={lib!r}, ontology_name={ontology!r}, background=False)
+all_built = time.perf_counter()
+print(json.dumps({{"import": imported - start, "first node": first_node - start, "all built": all_built - start}}))
+"""
+
+SCENARIOS = {"eager": (False, False), "deferred": (True, False), "deferred + warm-up": (True, True)}
+
+
+def sample(lib: str, ontology: str, defer: bool, warm_up: bool) -> dict[str, float]:
+    env = {**os.environ, "SW_ONTO_DEFER_BUILD": "1" if defer else "0"}
+    code = _PROBE.format(lib=lib, ontology=ontology, warm_up=warm_up)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)  # noqa: S603
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lib", default="LegalContract")
+    parser.add_argument("--ontology", default="kasko_police")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    table = Table(title=f"{args.lib}.{args.ontology} cold start, median of {args.repeat} interpreters")
+    table.add_column("scenario")
+    for column in ("import ms", "first node ms", "all built ms"):
+        table.add_column(column, justify="right")
+
+    for name, (defer, warm_up) in SCENARIOS.items():
+        samples = [sample(args.lib, args.ontology, defer, warm_up) for _ in range(args.repeat)]
+        medians = [statistics.median(s[point] for s in samples) * 1000 for point in ("import", "first node", "all built")]
+        table.add_row(name, *(f"{value:.1f}" for value in medians))
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+LLM calls and schema size per document: one call per CASE_0 node class and ask_llm relation against one combined call.
+
+Schema size is what every call sends in its prompt, so the per-class column is the sum over all calls of a document.
+Tokens are estimated as UTF-8 bytes / 4.
+
+Run with ``uv run python -m benchmarks.bench_combined_model``.
+"""
+
+from rich.console import Console
+from rich.table import Table
+
+from sw_onto_generation import DIR_STRUCTURE
+from sw_onto_generation.base.configs import HowToExtract
+from sw_onto_generation.base.schema_cache import cached_json_schema_bytes
+from sw_onto_generation.extraction.combined import get_combined_model
+from sw_onto_generation.utils import get_ontology_registry
+
+
+def main() -> None:
+    registry = get_ontology_registry()
+    table = Table(title="schema sent per document")
+    for column in ("ontology", "per-class calls", "per-class ~tokens", "combined calls", "combined ~tokens"):
+        table.add_column(column, justify="right")
+
+    for lib_name, ontology_names in DIR_STRUCTURE.items():
+        for ontology_name in ontology_names:
+            targets = [
+                *registry.node_classes_by_case(HowToExtract.CASE_0, lib_name, ontology_name),
+                *(cls for cls in registry.relation_classes(lib_name, ontology_name) if cls.relation_config.ask_llm),
+            ]
+            per_class = sum(len(cached_json_schema_bytes(cls)) for cls in targets)
+            combined = len(cached_json_schema_bytes(get_combined_model(lib_name, ontology_name)))
+            table.add_row(str(ontology_name), str(len(targets)), f"{per_class // 4:,}", "1", f"{combined // 4:,}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
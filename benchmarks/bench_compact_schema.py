@@ -0,0 +1,43 @@
+"""
+Estimated prompt tokens of every ontology's combined extraction schema, raw against compact and within a budget.
+
+Tokens are estimated as characters / 4. Without ``--max-tokens`` only the lossless compaction is reported.
+
+Run with ``uv run python -m benchmarks.bench_compact_schema --max-tokens 6000``.
+"""
+
+import argparse
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from sw_onto_generation.extraction.compact_schema import ontology_token_report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-tokens", type=int, default=None, help="token budget, descriptions are shortened to fit it")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    reports = ontology_token_report(args.max_tokens)
+    elapsed = time.perf_counter() - start
+
+    table = Table(title=f"combined schema ~tokens, compiled in {elapsed * 1000:.0f} ms")
+    for column in ("ontology", "raw", "compact", "saved", "budget", "description limit"):
+        table.add_column(column, justify="right")
+    for report in reports:
+        table.add_row(
+            report.ontology,
+            f"{report.raw_tokens:,}",
+            f"{report.compact_tokens:,}",
+            f"{1 - report.compact_tokens / report.raw_tokens:.0%}",
+            "-" if report.budget_tokens is None else f"{report.budget_tokens:,}",
+            "-" if report.description_limit is None else str(report.description_limit),
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Bulk node id computation with BaseNode.compute_ids against per-instance node_id access.
+
+Serialization and canonical encoding stay in the calling process, only digests are fanned out,
+so the process pool pays off when the digest dominates (large nodes, slow custom digests).
+
+Run with ``uv run python -m benchmarks.bench_compute_ids --count 100000``.
+"""
+
+import argparse
+import itertools
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import all_node_classes, sample_payload
+from sw_onto_generation.base.base_node import BaseNode
+
+
+def build_nodes(count: int) -> list[BaseNode]:
+    node_classes = itertools.cycle(all_node_classes())
+    return [node_cls(**sample_payload(node_cls, i)) for i, node_cls in zip(range(count), node_classes, strict=False)]
+
+
+def measure(count: int, compute: Callable[[list[BaseNode]], object]) -> float:
+    nodes = build_nodes(count)
+    start = time.perf_counter()
+    compute(nodes)
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000, help="nodes per run, cycled over all node classes")
+    parser.add_argument("--workers", type=int, default=4, help="process pool size")
+    args = parser.parse_args()
+
+    table = Table(title=f"computing {args.count} node ids")
+    table.add_column("path")
+    table.add_column("nodes/s", justify="right")
+
+    table.add_row("per instance node_id", f"{measure(args.count, lambda nodes: [node.node_id for node in nodes]):,.0f}")
+    table.add_row("compute_ids", f"{measure(args.count, lambda nodes: BaseNode.compute_ids(nodes)):,.0f}")
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        pool.submit(int).result()  # pool'u ölçümden önce ayağa kaldır
+        rate = measure(args.count, lambda nodes: BaseNode.compute_ids(nodes, executor=pool, pool_threshold=0))
+    table.add_row(f"compute_ids, {args.workers} process", f"{rate:,.0f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
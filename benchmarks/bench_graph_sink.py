@@ -0,0 +1,67 @@
+"""
+Writing kasko nodes to the in-process :class:`FakeGraphd` through :class:`AsyncGraphSink` with different pool sizes.
+
+The server answers every statement after ``--latency`` seconds, which stands in for graphd's round trip and storage
+write, so the table shows how far the connection pool and the in-flight limit hide that latency. ``--workers``
+coroutines share one sink, ``--fail-every`` injects errors to measure the cost of retries.
+
+Run with ``uv run python -m benchmarks.bench_graph_sink --nodes 50000 --latency 0.002``.
+"""
+
+import argparse
+import asyncio
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import sample_payload
+from sw_onto_generation.nebula.async_sink import AsyncGraphSink
+from sw_onto_generation.nebula.fake_graphd import FakeGraphd
+from sw_onto_generation.utils import get_ontology_registry
+
+LIB_NAME, ONTOLOGY_NAME = "LegalContract", "kasko_police"
+CONFIGURATIONS = ((1, 1), (4, 8), (16, 32))
+
+
+async def run(nodes: list, pool_size: int, max_in_flight: int, args: argparse.Namespace) -> tuple[float, FakeGraphd, AsyncGraphSink]:
+    async with FakeGraphd(latency=args.latency, fail_every=args.fail_every) as server:
+        sink = AsyncGraphSink(server.connect, space="kasko", pool_size=pool_size, max_in_flight=max_in_flight, backoff=0.001, batch_size=args.batch_size)
+        start = time.perf_counter()
+        async with sink:
+            await asyncio.gather(*(sink.write_nodes(nodes[worker :: args.workers]) for worker in range(args.workers)))
+        elapsed = time.perf_counter() - start
+    return elapsed, server, sink
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds per statement on the server")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every n-th statement with an error")
+    args = parser.parse_args()
+
+    node_classes = get_ontology_registry().node_classes(LIB_NAME, ONTOLOGY_NAME)
+    nodes = [node_classes[i % len(node_classes)](**sample_payload(node_classes[i % len(node_classes)], i)) for i in range(args.nodes)]
+
+    table = Table(title=f"{args.nodes:,} kasko nodes, {args.latency * 1000:g} ms per statement, {args.workers} workers")
+    for column in ("pool", "in flight", "statements", "retries", "server concurrency", "seconds", "vertices/s"):
+        table.add_column(column, justify="right")
+    for pool_size, max_in_flight in CONFIGURATIONS:
+        elapsed, server, sink = asyncio.run(run(nodes, pool_size, max_in_flight, args))
+        table.add_row(
+            str(pool_size),
+            str(max_in_flight),
+            f"{sink.statements_sent:,}",
+            f"{sink.retries:,}",
+            str(server.max_concurrency),
+            f"{elapsed:.2f}",
+            f"{sink.writer.vertices_written / elapsed:,.0f}",
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Node id throughput per hashing strategy across all ontology node classes.
+
+"legacy" is the previous encoding (``json.dumps`` with ASCII escaping and insertion-order keys) with sha256,
+the other rows use the canonical encoding with each registered digest.
+
+Run with ``uv run python -m benchmarks.bench_hashing``.
+"""
+
+import argparse
+import json
+from hashlib import sha256
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import all_node_classes, sample_payload, timeit
+from sw_onto_generation.base.hashing import HashAlgorithm, canonical_bytes, get_default_hash_algorithm, get_hash_function, set_default_hash_algorithm
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200, help="nodes built per class")
+    args = parser.parse_args()
+
+    nodes = [node_cls(**sample_payload(node_cls, i)) for node_cls in all_node_classes() for i in range(args.count)]
+    for node in nodes:
+        node.node_id  # noqa: B018, nested nodes keep their cached ids for all strategies
+    identity_dicts = [node.identity_dict() for node in nodes]
+    legacy_bytes = [json.dumps(data).encode() for data in identity_dicts]
+    canonical = [canonical_bytes(data) for data in identity_dicts]
+
+    table = Table(title=f"hashing {len(nodes)} nodes of {len(all_node_classes())} classes")
+    for column in ("strategy", "avg bytes", "digest only (MB/s)", "node_id (k nodes/s)"):
+        table.add_column(column, justify="left" if column == "strategy" else "right")
+
+    def legacy() -> None:
+        for node in nodes:
+            sha256(json.dumps(node.identity_dict()).encode()).hexdigest()
+
+    def legacy_digest() -> None:
+        for data in legacy_bytes:
+            sha256(data).hexdigest()
+
+    total = sum(map(len, legacy_bytes))
+    table.add_row("legacy sha256", f"{total / len(nodes):.0f}", f"{total / timeit(legacy_digest) / 1e6:.0f}", f"{len(nodes) / timeit(legacy) / 1e3:.1f}")
+
+    previous = get_default_hash_algorithm()
+    total = sum(map(len, canonical))
+    try:
+        for algorithm in HashAlgorithm:
+            try:
+                hash_function = get_hash_function(algorithm)
+                hash_function(b"")
+            except ImportError as e:
+                table.add_row(algorithm.value, "-", "-", f"skipped: {e}")
+                continue
+            set_default_hash_algorithm(algorithm)
+
+            def digest_only(hash_function=hash_function) -> None:
+                for data in canonical:
+                    hash_function(data)
+
+            def node_ids() -> None:
+                for node in nodes:
+                    node.generate_node_id()
+
+            table.add_row(algorithm.value, f"{total / len(nodes):.0f}", f"{total / timeit(digest_only) / 1e6:.0f}", f"{len(nodes) / timeit(node_ids) / 1e3:.1f}")
+    finally:
+        set_default_hash_algorithm(previous)
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
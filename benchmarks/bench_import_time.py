@@ -0,0 +1,70 @@
+"""
+Cold import time of the package and of each ontology, every sample in a fresh interpreter.
+
+An ontology sample imports the package and loads that ontology through the registry, which must not import
+any other ``onto_*`` module; the number of ontologies imported by each sample is reported to catch that.
+With ``--max-ms`` the run exits with status 1 when a median exceeds the budget, so it can guard CI.
+
+Run with ``uv run python -m benchmarks.bench_import_time --repeat 10``.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from sw_onto_generation import DIR_STRUCTURE
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import sw_onto_generation
+{load}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "ontologies": len({{name.split(".onto_")[1].split(".")[0] for name in sys.modules if ".onto_" in name}})}}))
+"""
+
+_LOAD = "from sw_onto_generation.utils import get_all_common_and_specific_root_classes\nget_all_common_and_specific_root_classes({lib!r}, {ontology!r})"
+
+
+def sample(load: str) -> dict[str, float]:
+    result = subprocess.run([sys.executable, "-c", _PROBE.format(load=load)], capture_output=True, text=True, check=True)  # noqa: S603
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per target")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail when a median import time exceeds this budget")
+    args = parser.parse_args()
+
+    targets = {"package only": ""}
+    for lib_name, ontology_names in DIR_STRUCTURE.items():
+        for ontology_name in ontology_names:
+            targets[f"{lib_name}.{ontology_name}"] = _LOAD.format(lib=str(lib_name), ontology=str(ontology_name))
+
+    table = Table(title=f"cold import, median of {args.repeat} interpreters")
+    for column in ("target", "median ms", "min ms", "ontologies imported"):
+        table.add_column(column, justify="right")
+
+    over_budget = []
+    for target, load in targets.items():
+        samples = [sample(load) for _ in range(args.repeat)]
+        times = [s["ms"] for s in samples]
+        median = statistics.median(times)
+        table.add_row(target, f"{median:.1f}", f"{min(times):.1f}", str(samples[0]["ontologies"]))
+        if args.max_ms is not None and median > args.max_ms:
+            over_budget.append(target)
+
+    Console().print(table)
+    if over_budget:
+        Console().print(f"[red]over the {args.max_ms} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Exporting kasko nodes for nebula-importer with :class:`ImporterExporter` at growing corpus sizes.
+
+Nodes are generated on the fly, so with ``--memory`` the tracemalloc peak (measured in a separate run) is the exporter's
+own memory, which should stay flat while the corpus grows. The nGQL column shows the same nodes rendered as batched INSERT statements to a file for comparison.
+
+Run with ``uv run python -m benchmarks.bench_importer_export --nodes 10000 100000 --rows-per-shard 50000 --memory``.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import sample_payload
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.nebula.importer import ImporterExporter
+from sw_onto_generation.nebula.writer import NgqlWriter, file_sink
+from sw_onto_generation.utils import get_ontology_registry
+
+LIB_NAME, ONTOLOGY_NAME = "LegalContract", "kasko_police"
+
+
+def generate(count: int) -> Iterator[BaseNode]:
+    node_classes = get_ontology_registry().node_classes(LIB_NAME, ONTOLOGY_NAME)
+    for i in range(count):
+        node_cls = node_classes[i % len(node_classes)]
+        yield node_cls(**sample_payload(node_cls, i))
+
+
+def directory_size(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
+
+
+def export(directory: str, count: int, rows_per_shard: int) -> ImporterExporter:
+    with ImporterExporter(directory, LIB_NAME, ONTOLOGY_NAME, rows_per_shard=rows_per_shard) as exporter:
+        exporter.write_nodes(generate(count))
+    return exporter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--rows-per-shard", type=int, default=50_000)
+    parser.add_argument("--memory", action="store_true", help="also report the peak memory of the export with tracemalloc")
+    args = parser.parse_args()
+
+    table = Table(title=f"nebula-importer export, {args.rows_per_shard:,} rows per shard")
+    for column in ("nodes", "vertex rows", "shards", "CSV MB", "seconds", "rows/s", "peak MB", "nGQL seconds"):
+        table.add_column(column, justify="right")
+    for count in args.nodes:
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            exporter = export(directory, count, args.rows_per_shard)
+            elapsed = time.perf_counter() - start
+            peak = None
+            if args.memory:
+                tracemalloc.start()
+                export(directory, count, args.rows_per_shard)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            rows = sum(export.rows for export in exporter.exports.values())
+            shards = sum(len(export.shards) for export in exporter.exports.values())
+            size = directory_size(Path(directory))
+
+            start = time.perf_counter()
+            with (Path(directory) / "insert.ngql").open("w", encoding="utf-8") as file, NgqlWriter(file_sink(file)) as writer:
+                writer.write_nodes(generate(count))
+            ngql_elapsed = time.perf_counter() - start
+        table.add_row(f"{count:,}", f"{rows:,}", str(shards), f"{size / 1e6:.1f}", f"{elapsed:.2f}", f"{rows / elapsed:,.0f}", "-" if peak is None else f"{peak / 1e6:.1f}", f"{ngql_elapsed:.2f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
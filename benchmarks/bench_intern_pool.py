@@ -0,0 +1,65 @@
+"""
+Memory held by a synthetic policy portfolio with and without NodeInternPool.
+
+Every policy references one of a few insurers and agents, each with its address, as extraction produces them:
+a fresh node per document.
+
+Run with ``uv run python -m benchmarks.bench_intern_pool --policies 20000``.
+"""
+
+import argparse
+import tracemalloc
+
+from rich.console import Console
+from rich.table import Table
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.intern_pool import NodeInternPool
+from sw_onto_generation.common.common_nodes import Adres, Sirket
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import Acente
+
+
+def build_portfolio(policies: int, insurers: int, pool: NodeInternPool | None) -> list[BaseNode]:
+    nodes: list[BaseNode] = []
+    for i in range(policies):
+        company = i % insurers
+        adres = Adres(reason=f"poliçe {i}", il="İstanbul", ilçe="Ataşehir", acik_adres=f"Küçükbakkalköy Mah. Kayışdağı Cad. No:{company}")
+        sirket = Sirket(reason=f"poliçe {i}", unvan=f"Sigorta Şirketi {company} A.Ş.", vkn=f"{company:010d}", adres=adres)
+        acente = Acente(reason=f"poliçe {i}", unvan=f"Acente {company} Ltd. Şti.", acente_no=f"{700000 + company}", adres=adres.model_copy())
+        batch: list[BaseNode] = [sirket, acente]
+        nodes.extend(pool.intern_many(batch) if pool is not None else batch)
+    return nodes
+
+
+def measure(policies: int, insurers: int, pool: NodeInternPool | None) -> int:
+    tracemalloc.start()
+    nodes = build_portfolio(policies, insurers, pool)
+    for node in nodes:
+        node.node_id  # noqa: B018, ids are computed in both runs
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--policies", type=int, default=20_000)
+    parser.add_argument("--insurers", type=int, default=25)
+    args = parser.parse_args()
+
+    plain = measure(args.policies, args.insurers, None)
+    pool = NodeInternPool(max_size=10_000)
+    interned = measure(args.policies, args.insurers, pool)
+
+    table = Table(title=f"{args.policies} policies, {args.insurers} distinct insurers and agents")
+    table.add_column("metric")
+    table.add_column("value", justify="right")
+    table.add_row("retained without pool", f"{plain / 1e6:.1f} MB")
+    table.add_row("retained with pool", f"{interned / 1e6:.1f} MB")
+    for name, value in pool.stats.model_dump().items():
+        table.add_row(f"pool {name}", f"{value:,}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Bulk re-materialization of CASE_1 containers and automatic relations for historical kasko extractions.
+
+Every synthetic document has a GeneralDocumentInfo, a policy and a few children of every container class.
+
+Run with ``uv run python -m benchmarks.bench_materialize --documents 20000``.
+"""
+
+import argparse
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import sample_payload
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import HowToExtract
+from sw_onto_generation.common.common_nodes import GeneralDocumentInfo
+from sw_onto_generation.extraction.materialize import get_container_materializer
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import KaskoPolice
+from sw_onto_generation.utils import get_ontology_registry
+
+
+def build_documents(count: int, children: int) -> list[list[BaseNode]]:
+    child_classes = [
+        node_cls
+        for node_cls in get_ontology_registry().node_classes_by_case(HowToExtract.CASE_0, "LegalContract", "kasko_police")
+        if node_cls.node_config.nodeclass_to_be_created_automatically is not None
+    ]
+    documents = []
+    for i in range(count):
+        nodes: list[BaseNode] = [GeneralDocumentInfo(reason="r", sozlesme_no=str(i)), KaskoPolice(**sample_payload(KaskoPolice, i))]
+        nodes.extend(node_cls(**sample_payload(node_cls, i * children + j)) for node_cls in child_classes for j in range(children))
+        documents.append(nodes)
+    return documents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=5_000)
+    parser.add_argument("--children", type=int, default=3, help="children per container class and document")
+    args = parser.parse_args()
+
+    documents = build_documents(args.documents, args.children)
+    materializer = get_container_materializer("LegalContract", "kasko_police")
+
+    start = time.perf_counter()
+    results = materializer.materialize_documents(documents)
+    elapsed = time.perf_counter() - start
+
+    containers = sum(len(created) for created, _ in results)
+    relations = sum(len(edges) for _, edges in results)
+    table = Table(title=f"{args.documents:,} documents, {sum(map(len, documents)):,} extracted nodes")
+    table.add_column("metric")
+    table.add_column("value", justify="right")
+    table.add_row("containers", f"{containers:,}")
+    table.add_row("automatic relations", f"{relations:,}")
+    table.add_row("documents/s", f"{args.documents / elapsed:,.0f}")
+    table.add_row("relations/s", f"{relations / elapsed:,.0f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Cost of hashing every node of deep and wide node trees.
+
+"full dump" hashes each node from the serialized dump of its whole subtree (the old scheme),
+"merkle" hashes each node from its own scalars plus the cached ids of its children.
+
+Run with ``uv run python -m benchmarks.bench_merkle_hash``.
+"""
+
+import argparse
+import json
+from hashlib import sha256
+
+from pydantic import Field
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import timeit
+from sw_onto_generation.base.base_node import BaseNode
+
+
+class ChainNode(BaseNode):
+    value: str = Field(default="", description="Örnek değer")
+    child: "ChainNode | None" = Field(default=None, description="Alt node")
+
+
+class LeafNode(BaseNode):
+    value: str = Field(default="", description="Örnek değer")
+
+
+class WideNode(BaseNode):
+    value: str = Field(default="", description="Örnek değer")
+    children: list[LeafNode] = Field(default_factory=list, description="Alt node'lar")
+
+
+def build_chain(depth: int) -> list[BaseNode]:
+    nodes: list[BaseNode] = []
+    child = None
+    for level in range(depth):
+        child = ChainNode(reason="bench", value=f"seviye {level}", child=child)
+        nodes.append(child)
+    return nodes
+
+
+def build_wide(width: int) -> list[BaseNode]:
+    leaves: list[BaseNode] = [LeafNode(reason="bench", value=f"yaprak {i}") for i in range(width)]
+    return [*leaves, WideNode(reason="bench", value="kök", children=leaves)]
+
+
+def full_dump_hash(nodes: list[BaseNode]) -> None:
+    for node in nodes:
+        sha256(json.dumps(node.model_dump(exclude={"node_id"})).encode()).hexdigest()
+
+
+def merkle_hash(nodes: list[BaseNode]) -> None:
+    for node in nodes:
+        node.__pydantic_private__["_node_id"] = None
+    for node in nodes:
+        node.node_id  # noqa: B018
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 200])
+    args = parser.parse_args()
+
+    table = Table(title="hashing every node of a tree, ms")
+    for column in ("shape", "nodes", "full dump", "merkle", "speedup"):
+        table.add_column(column, justify="left" if column == "shape" else "right")
+
+    for shape, builder in (("deep", build_chain), ("wide", build_wide)):
+        for size in args.sizes:
+            nodes = builder(size)
+            full_t = timeit(lambda nodes=nodes: full_dump_hash(nodes), repeat=3) * 1e3
+            merkle_t = timeit(lambda nodes=nodes: merkle_hash(nodes), repeat=3) * 1e3
+            table.add_row(shape, str(len(nodes)), f"{full_t:.2f}", f"{merkle_t:.2f}", f"{full_t / merkle_t:.1f}x")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Writing kasko nodes as nGQL: one INSERT per node against batched multi-row INSERTs of :class:`NgqlWriter`.
+
+Nodes are built once with :func:`sample_payload`, every writer streams into a sink that only counts statements and
+characters, so the numbers are the cost of rendering and what graphd would have to parse.
+
+Run with ``uv run python -m benchmarks.bench_ngql_writer --nodes 200000 --batch-size 256``.
+"""
+
+import argparse
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import sample_payload
+from sw_onto_generation.nebula.writer import NgqlWriter
+from sw_onto_generation.utils import get_ontology_registry
+
+LIB_NAME, ONTOLOGY_NAME = "LegalContract", "kasko_police"
+
+
+class CountingSink:
+    def __init__(self) -> None:
+        self.statements = 0
+        self.characters = 0
+
+    def __call__(self, statement: str) -> None:
+        self.statements += 1
+        self.characters += len(statement) + 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    node_classes = get_ontology_registry().node_classes(LIB_NAME, ONTOLOGY_NAME)
+    nodes = [node_classes[i % len(node_classes)](**sample_payload(node_classes[i % len(node_classes)], i)) for i in range(args.nodes)]
+    for node in nodes:
+        _ = node.node_id
+
+    table = Table(title=f"{args.nodes:,} kasko nodes")
+    for column in ("writer", "vertices", "statements", "MB", "seconds", "vertices/s"):
+        table.add_column(column, justify="right")
+    for name, batch_size in (("one INSERT per node", 1), (f"batch_size={args.batch_size}", args.batch_size)):
+        sink = CountingSink()
+        start = time.perf_counter()
+        with NgqlWriter(sink, batch_size=batch_size) as writer:
+            writer.write_nodes(nodes)
+        elapsed = time.perf_counter() - start
+        table.add_row(name, f"{writer.vertices_written:,}", f"{sink.statements:,}", f"{sink.characters / 1e6:.1f}", f"{elapsed:.2f}", f"{writer.vertices_written / elapsed:,.0f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Per node class cost of building nodes with and without reading ``node_id``.
+
+"eager" reproduces the old after-validator behaviour (construct + hash),
+"lazy" is plain construction, "lazy+read" constructs and reads ``node_id`` once.
+
+Run with ``uv run python -m benchmarks.bench_node_id``.
+"""
+
+import argparse
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import all_node_classes, sample_payload, timeit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2_000, help="nodes built per class and run")
+    args = parser.parse_args()
+
+    table = Table(title=f"node construction, µs/node ({args.count} nodes per class)")
+    for column in ("class", "eager", "lazy", "lazy+read", "speedup"):
+        table.add_column(column, justify="left" if column == "class" else "right")
+
+    for node_cls in all_node_classes():
+        payloads = [sample_payload(node_cls, i) for i in range(args.count)]
+
+        def eager(node_cls=node_cls, payloads=payloads) -> None:
+            for payload in payloads:
+                node_cls(**payload).generate_node_id()
+
+        def lazy(node_cls=node_cls, payloads=payloads) -> None:
+            for payload in payloads:
+                node_cls(**payload)
+
+        def lazy_read(node_cls=node_cls, payloads=payloads) -> None:
+            for payload in payloads:
+                node_cls(**payload).node_id  # noqa: B018
+
+        eager_t, lazy_t, read_t = (timeit(func) / args.count * 1e6 for func in (eager, lazy, lazy_read))
+        table.add_row(f"{node_cls.__module__.rsplit('.', 2)[-2]}.{node_cls.__name__}", f"{eager_t:.1f}", f"{lazy_t:.1f}", f"{read_t:.1f}", f"{eager_t / lazy_t:.1f}x")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
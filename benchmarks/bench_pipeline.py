@@ -0,0 +1,99 @@
+"""
+End-to-end extraction throughput against the offline stub LLM backend.
+
+Every document is one combined-model call to :class:`StubLLMBackend`, followed by the pipeline's own work:
+
+- validation: ``model_validate_json`` of the response
+- hashing: node ids of every extracted node
+- relations: references resolved into relations, CASE_1 containers and automatic relations materialized
+
+Reported per ontology are documents/s, p50/p99 document latency and the CPU time per document of each stage, the
+stub's own response rendering included for reference. With ``--latency 0`` the numbers are the overhead alone.
+
+Run with ``uv run python -m benchmarks.bench_pipeline --documents 500 --concurrency 64 --latency 0.05 --jitter 0.02``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+
+from rich.console import Console
+from rich.table import Table
+
+from sw_onto_generation import DIR_STRUCTURE
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.extraction.combined import get_combined_model
+from sw_onto_generation.extraction.materialize import get_container_materializer
+from sw_onto_generation.extraction.stub_backend import StubLLMBackend
+
+STAGES = ("stub", "validation", "hashing", "relations")
+
+
+async def run_ontology(backend: StubLLMBackend, lib_name: str, ontology_name: str, documents: int, concurrency: int) -> tuple[float, list[float], dict[str, float]]:
+    model = get_combined_model(lib_name, ontology_name)
+    materializer = get_container_materializer(lib_name, ontology_name)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    cpu: dict[str, float] = defaultdict(float)
+
+    async def process(document_id: str) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await backend.complete(model, document_id)
+
+            # asyncio tek thread'de çalıştığı için await'siz bloklar arası process_time farkı o aşamanın CPU süresi
+            # stub yanıtı burada tekrar üretilir ki süresi pipeline'a sayılmasın
+            stub_start = time.process_time()
+            text = backend.respond(model, document_id)
+            tick = time.process_time()
+            response = model.model_validate_json(text)
+            validated = time.process_time()
+            nodes, _ = response.split()
+            split = time.process_time()
+            BaseNode.compute_ids(nodes)
+            hashed = time.process_time()
+            materializer.materialize(nodes)
+            done = time.process_time()
+
+            cpu["stub"] += tick - stub_start
+            cpu["validation"] += validated - tick
+            cpu["hashing"] += hashed - split
+            cpu["relations"] += (split - validated) + (done - hashed)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(process(f"{ontology_name}-{i}") for i in range(documents)))
+    return time.perf_counter() - start, latencies, cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=200, help="documents per ontology")
+    parser.add_argument("--concurrency", type=int, default=32, help="documents in flight")
+    parser.add_argument("--latency", type=float, default=0.05, help="mean seconds per LLM call")
+    parser.add_argument("--jitter", type=float, default=0.02, help="maximum deviation of the latency in seconds")
+    args = parser.parse_args()
+
+    backend = StubLLMBackend(latency=args.latency, jitter=args.jitter)
+    table = Table(title=f"{args.documents:,} documents per ontology, concurrency {args.concurrency}, latency {args.latency * 1000:.0f}±{args.jitter * 1000:.0f} ms")
+    for column in ("ontology", "docs/s", "p50 ms", "p99 ms", *(f"{stage} CPU ms/doc" for stage in STAGES)):
+        table.add_column(column, justify="right")
+
+    for lib_name, ontology_names in DIR_STRUCTURE.items():
+        for ontology_name in ontology_names:
+            wall, latencies, cpu = asyncio.run(run_ontology(backend, lib_name, ontology_name, args.documents, args.concurrency))
+            percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+            table.add_row(
+                str(ontology_name),
+                f"{args.documents / wall:,.0f}",
+                f"{percentiles[49] * 1000:.1f}",
+                f"{percentiles[98] * 1000:.1f}",
+                *(f"{cpu[stage] / args.documents * 1000:.2f}" for stage in STAGES),
+            )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
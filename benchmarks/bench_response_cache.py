@@ -0,0 +1,67 @@
+"""
+Re-extraction of kasko documents after an ontology tweak, with the on-disk response cache.
+
+Every CASE_0 class is "extracted" once per document by a fake model call. Then one class gets a new field description
+and every document is extracted again: only that class goes back to the model.
+
+Run with ``uv run python -m benchmarks.bench_response_cache --documents 200``.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import sample_payload
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import HowToExtract
+from sw_onto_generation.extraction.response_cache import ResponseCache, document_hash
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import Teminat
+from sw_onto_generation.utils import get_ontology_registry
+
+
+async def extract_all(cache: ResponseCache, documents: int, latency: float) -> int:
+    node_classes = get_ontology_registry().node_classes_by_case(HowToExtract.CASE_0, "LegalContract", "kasko_police")
+    calls = 0
+
+    for i in range(documents):
+        doc = document_hash(f"kasko-{i}".encode())
+        for node_cls in node_classes:
+
+            async def extract(node_cls: type[BaseNode] = node_cls, i: int = i) -> list[BaseNode]:
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(latency)
+                return [node_cls(**sample_payload(node_cls, i))]
+
+            await cache.get_or_extract(doc, node_cls, extract)
+    return calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.001, help="seconds per fake model call")
+    args = parser.parse_args()
+
+    table = Table(title=f"{args.documents:,} kasko documents")
+    for column in ("run", "model calls", "hits", "seconds"):
+        table.add_column(column, justify="right")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(directory)
+        for run in ("cold", "warm", "after Teminat tweak"):
+            if run == "after Teminat tweak":
+                Teminat.append_field_description("teminat_adi", "(poliçede yazdığı gibi)")
+            hits = cache.hits
+            start = time.perf_counter()
+            calls = asyncio.run(extract_all(cache, args.documents, args.latency))
+            table.add_row(run, f"{calls:,}", f"{cache.hits - hits:,}", f"{time.perf_counter() - start:.2f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+JSON schema cost per extraction call: model_json_schema() and json.dumps against the schema cache.
+
+Run with ``uv run python -m benchmarks.bench_schema_cache``.
+"""
+
+import argparse
+import json
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import all_node_classes, timeit
+from sw_onto_generation.base.schema_cache import cached_json_schema_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20, help="simulated extraction calls, each needs every schema")
+    args = parser.parse_args()
+
+    node_classes = all_node_classes()
+
+    def uncached() -> None:
+        for _ in range(args.calls):
+            for node_cls in node_classes:
+                json.dumps(node_cls.model_json_schema(), ensure_ascii=False).encode()
+
+    def cached() -> None:
+        for _ in range(args.calls):
+            for node_cls in node_classes:
+                cached_json_schema_bytes(node_cls)
+
+    table = Table(title=f"{args.calls} calls x {len(node_classes)} node schemas")
+    table.add_column("path")
+    table.add_column("ms per call", justify="right")
+    table.add_row("model_json_schema + json.dumps", f"{timeit(uncached) / args.calls * 1000:.2f}")
+    table.add_row("cached_json_schema_bytes", f"{timeit(cached) / args.calls * 1000:.3f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Streaming parse of a long FesihMaddesi array against validating the complete payload.
+
+The response is split into token-sized chunks. Reported are the parser throughput and, for a simulated generation
+speed, when the first node becomes available with streaming and with waiting for the whole payload.
+
+Run with ``uv run python -m benchmarks.bench_streaming --nodes 2000 --chunk-bytes 16``.
+"""
+
+import argparse
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import sample_payload, timeit
+from sw_onto_generation.common.common_nodes import FesihMaddesi
+from sw_onto_generation.extraction.streaming import NodeStreamParser
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=2_000)
+    parser.add_argument("--chunk-bytes", type=int, default=16, help="bytes per streamed chunk, about 4 tokens")
+    parser.add_argument("--tokens-per-second", type=float, default=80.0, help="simulated generation speed")
+    args = parser.parse_args()
+
+    payload = to_json([sample_payload(FesihMaddesi, i) for i in range(args.nodes)])
+    chunks = [payload[i : i + args.chunk_bytes] for i in range(0, len(payload), args.chunk_bytes)]
+    adapter = TypeAdapter(list[FesihMaddesi])
+
+    def stream() -> int:
+        node_parser = NodeStreamParser(FesihMaddesi)
+        count = sum(len(node_parser.feed(chunk)) for chunk in chunks)
+        node_parser.close()
+        return count
+
+    streamed_nodes = stream()
+    whole = timeit(lambda: adapter.validate_json(payload))
+    streamed = timeit(stream)
+
+    first_parser = NodeStreamParser(FesihMaddesi)
+    first_chunk = next(i for i, chunk in enumerate(chunks) if first_parser.feed(chunk))
+    seconds_per_chunk = args.chunk_bytes / 4 / args.tokens_per_second
+
+    table = Table(title=f"{args.nodes:,} nodes, {len(payload) / 1e6:.1f} MB in {len(chunks):,} chunks")
+    for column in ("", "whole payload", "streaming"):
+        table.add_column(column, justify="right")
+    table.add_row("nodes", f"{args.nodes:,}", f"{streamed_nodes:,}")
+    table.add_row("parse + validate ms", f"{whole * 1000:.1f}", f"{streamed * 1000:.1f}")
+    table.add_row("MB/s", f"{len(payload) / whole / 1e6:.1f}", f"{len(payload) / streamed / 1e6:.1f}")
+    table.add_row(
+        f"first node after (s, {args.tokens_per_second:.0f} tok/s)",
+        f"{len(chunks) * seconds_per_chunk:,.1f}",
+        f"{(first_chunk + 1) * seconds_per_chunk:,.2f}",
+    )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Vertices and bytes sent with and without :class:`VertexDeduplicator` over two runs of the same corpus.
+
+Every document has its own ``Insan`` but shares ``GeneralDocumentInfo``, ``Sirket`` and ``Adres`` with the other
+documents out of pools of ``--shared`` nodes, like repeated insurers and addresses in a real corpus. The second run
+loads the Bloom filter saved by the first one, as a rerun of the pipeline would. Statements go to a counting sink.
+``Insan`` and ``Sirket`` have identity fields and are written on every run, only their nested ``Adres`` and the
+``GeneralDocumentInfo`` pool are skipped.
+
+Run with ``uv run python -m benchmarks.bench_vertex_dedup --documents 50000 --shared 500``.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import sample_payload
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.common.common_nodes import GeneralDocumentInfo, Insan, Sirket
+from sw_onto_generation.nebula.dedup import VertexDeduplicator
+from sw_onto_generation.nebula.writer import NgqlWriter
+
+
+class CountingSink:
+    def __init__(self) -> None:
+        self.characters = 0
+
+    def __call__(self, statement: str) -> None:
+        self.characters += len(statement) + 2
+
+
+def build_corpus(documents: int, shared: int) -> list[BaseNode]:
+    pools = {node_cls: [node_cls(**sample_payload(node_cls, i)) for i in range(shared)] for node_cls in (GeneralDocumentInfo, Sirket)}
+    nodes: list[BaseNode] = []
+    for i in range(documents):
+        nodes.extend(pool[i % shared] for pool in pools.values())
+        # Insan.adres ve Sirket.adres ortak adres havuzundan gelir
+        nodes.append(Insan(**{**sample_payload(Insan, i), "adres": sample_payload(Insan, i % shared)["adres"]}))
+    return nodes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=50_000)
+    parser.add_argument("--shared", type=int, default=500)
+    parser.add_argument("--error-rate", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    nodes = build_corpus(args.documents, args.shared)
+    table = Table(title=f"{args.documents:,} documents, {args.shared:,} shared nodes per class")
+    for column in ("run", "vertices sent", "skipped", "pending hits", "LRU hits", "Bloom hits", "MB sent", "seconds", "filter MB"):
+        table.add_column(column, justify="right")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "vids.bloom"
+        for run in ("no filter", "first run", "second run"):
+            deduplicator = None if run == "no filter" else VertexDeduplicator(path, capacity=len(nodes) * 2, error_rate=args.error_rate)
+            sink = CountingSink()
+            start = time.perf_counter()
+            with NgqlWriter(sink, vertex_filter=deduplicator) as writer:
+                writer.write_nodes(nodes)
+            elapsed = time.perf_counter() - start
+            if deduplicator is not None:
+                deduplicator.save()
+            table.add_row(
+                run,
+                f"{writer.vertices_written:,}",
+                f"{writer.vertices_skipped:,}",
+                "-" if deduplicator is None else f"{deduplicator.pending_hits:,}",
+                "-" if deduplicator is None else f"{deduplicator.lru_hits:,}",
+                "-" if deduplicator is None else f"{deduplicator.bloom_hits:,}",
+                f"{sink.characters / 1e6:.1f}",
+                f"{elapsed:.2f}",
+                "-" if deduplicator is None else f"{len(deduplicator.bloom.bits) / 1e6:.1f}",
+            )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
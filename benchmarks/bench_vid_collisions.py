@@ -0,0 +1,70 @@
+"""
+Collision rate of content-derived int64 VIDs on synthetic corpora.
+
+63-bit collisions are too rare to observe directly, so the same node ids are also truncated to fewer bits.
+When the observed counts match the birthday estimate ``n * (n - 1) / 2**(bits + 1)`` at small widths,
+the estimate can be trusted for the 63 bits ``INT64_CONTENT`` actually uses.
+
+Run with ``uv run python -m benchmarks.bench_vid_collisions --count 1000000``.
+"""
+
+import argparse
+import itertools
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.common import all_node_classes, sample_payload
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import VidMode
+from sw_onto_generation.base.vid import VidAllocator
+
+
+def synthetic_node_ids(count: int) -> list[str]:
+    node_classes = itertools.cycle(all_node_classes())
+    nodes = [node_cls(**sample_payload(node_cls, i)) for i, node_cls in zip(range(count), node_classes, strict=False)]
+    return BaseNode.compute_ids(nodes)
+
+
+def expected_collisions(count: int, bits: int) -> float:
+    return count * (count - 1) / 2 ** (bits + 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000, help="distinct synthetic nodes")
+    parser.add_argument("--bits", type=int, nargs="+", default=[24, 28, 32, 36, 63])
+    args = parser.parse_args()
+
+    node_ids = list(dict.fromkeys(synthetic_node_ids(args.count)))
+
+    table = Table(title=f"{len(node_ids):,} distinct synthetic nodes")
+    for column in ("bits", "observed collisions", "expected collisions"):
+        table.add_column(column, justify="right")
+    for bits in args.bits:
+        truncated = {int(node_id[:16], 16) >> (64 - bits) for node_id in node_ids}
+        table.add_row(str(bits), f"{len(node_ids) - len(truncated):,}", f"{expected_collisions(len(node_ids), bits):.3g}")
+    Console().print(table)
+
+    table = Table(title="63-bit collisions at corpus scale")
+    for column in ("nodes", "expected collisions"):
+        table.add_column(column, justify="right")
+    for corpus in (10**6, 10**8, 10**9, 10**10):
+        table.add_row(f"{corpus:,}", f"{expected_collisions(corpus, 63):.3g}")
+    Console().print(table)
+
+    table = Table(title="allocation cost")
+    for column in ("mode", "VIDs/s"):
+        table.add_column(column, justify="right")
+    for mode in VidMode:
+        allocator = VidAllocator(mode)
+        start = time.perf_counter()
+        for node_id in node_ids:
+            allocator.vid_for_id(node_id)
+        table.add_row(mode.value, f"{len(node_ids) / (time.perf_counter() - start):,.0f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
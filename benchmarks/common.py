@@ -0,0 +1,48 @@
+import time
+import types
+import typing
+from collections.abc import Callable
+from typing import Any
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.utils import get_all_common_and_root_classes
+
+
+def all_node_classes() -> list[type[BaseNode]]:
+    """Return every node class of every ontology, sorted by module and name."""
+    node_classes, _ = get_all_common_and_root_classes()
+    return sorted(node_classes, key=lambda cls: (cls.__module__, cls.__name__))
+
+
+def _sample_value(annotation: Any, field_name: str, index: int) -> Any:
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _sample_value(args[0], field_name, index)
+    if origin is list:
+        (item_type,) = typing.get_args(annotation)
+        return [_sample_value(item_type, field_name, index)]
+    if isinstance(annotation, type) and issubclass(annotation, BaseNode):
+        return sample_payload(annotation, index)
+    if annotation is bool:
+        return index % 2 == 0
+    if annotation is int:
+        return index
+    if annotation is float:
+        return index / 10
+    return f"{field_name} örnek değer çğıöşü {index}"
+
+
+def sample_payload(node_cls: type[BaseNode], index: int = 0) -> dict[str, Any]:
+    """Build a payload that fills every field of ``node_cls``, nested nodes included."""
+    return {name: _sample_value(field.annotation, name, index) for name, field in node_cls.model_fields.items()}
+
+
+def timeit(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the best wall-clock time of ``repeat`` runs of ``func`` in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
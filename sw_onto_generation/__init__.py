@@ -1,6 +1,4 @@
 __version__ = "0.1.0"
-import inspect
-import sys
 from enum import StrEnum
 
 
@@ -12,7 +10,8 @@ class LegalContract(StrEnum):
     KASKO_POLICE = "kasko_police"
 
 
-ENUM_CLASSES = [cls for name, cls in inspect.getmembers(sys.modules[__name__]) if inspect.isclass(cls) and issubclass(cls, StrEnum) and cls is not StrEnum]
+# inspect import etmek paket importunun çoğunu oluşturuyordu, globals() yeterli
+ENUM_CLASSES = [obj for obj in list(globals().values()) if isinstance(obj, type) and issubclass(obj, StrEnum) and obj is not StrEnum]
 #! add enum classes to the structure
 
 DIR_STRUCTURE = {}
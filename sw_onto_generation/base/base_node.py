@@ -1,20 +1,71 @@
-from hashlib import sha256
-from typing import ClassVar
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import cache
+from typing import Any, ClassVar, get_args
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, computed_field
 
 # from sw_onto_generation.base.id_generator import generate_random_64bit_id
 from typing_extensions import Self
 
 from sw_onto_generation.base.configs import (
+    DEFER_MODEL_BUILD,
     HowToExtract,
     NebulaIndexType,
     NodeFieldConfig,
     NodeModelConfig,
 )
+from sw_onto_generation.base.hashing import canonical_bytes, get_default_hash_algorithm, get_hash_function, hash_chunk
+from sw_onto_generation.base.schema_cache import bump_description_version
+
+# identity_dict'te node'un sınıfını tutan key, field adlarıyla çakışmaz
+NODE_TYPE_KEY = "__node_type__"
+
+
+def _contains_node_type(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseNode):
+        return True
+    return any(_contains_node_type(arg) for arg in get_args(annotation))
+
+
+def _child_node_ids(value: Any) -> Any:
+    if isinstance(value, BaseNode):
+        return value.node_id
+    if isinstance(value, list | tuple):
+        return [_child_node_ids(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _child_node_ids(item) for key, item in value.items()}
+    return value
+
+
+def _iter_child_nodes(value: Any) -> Iterator["BaseNode"]:
+    if isinstance(value, BaseNode):
+        yield value
+    elif isinstance(value, list | tuple):
+        for item in value:
+            yield from _iter_child_nodes(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_child_nodes(item)
+
+
+# eşitlikte karşılaştırılmayan private attr'lar
+_UNCOMPARED_PRIVATE = frozenset({"_node_id", "_child_ids", "_frozen"})
+
+
+def _compared_private(node: "BaseNode") -> dict[str, Any]:
+    private = node.__pydantic_private__ or {}
+    return {name: value for name, value in private.items() if name not in _UNCOMPARED_PRIVATE}
+
+
+@cache
+def _list_adapter(node_cls: type["BaseNode"]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[node_cls])  # type: ignore[valid-type]
 
 
 class BaseNode(BaseModel):
+    model_config = ConfigDict(defer_build=DEFER_MODEL_BUILD)
+
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         nodetag_index=False,
         description="",
@@ -28,19 +79,194 @@ class BaseNode(BaseModel):
         config=NodeFieldConfig(index_type=NebulaIndexType.VECTOR),
     )
 
-    # Define node_id with default=None, but we'll always overwrite it
-    node_id: str = Field(default=None)
+    # içinde başka node barındıran field'lar (ör. Insan.adres), __pydantic_init_subclass__ doldurur
+    _child_node_fields: ClassVar[tuple[str, ...]] = ()
+    _hash_exclude: ClassVar[frozenset[str]] = frozenset({"node_id", "reason"})
+    _node_type: ClassVar[str] = ""
 
-    @model_validator(mode="after")
-    def generate_node_id(self) -> Self:
-        import json
+    # node_id ilk erişimde hesaplanır, field ataması yapılınca sıfırlanır
+    _node_id: str | None = PrivateAttr(default=None)
+    # _node_id hesaplanırken iç içe node'ların node_id'leri, değişirse cache geçersizdir
+    _child_ids: tuple[Any, ...] | None = PrivateAttr(default=None)
+    # NodeInternPool'a giren paylaşılan instance'lar değiştirilemez
+    _frozen: bool = PrivateAttr(default=False)
 
-        model_dict = self.model_dump()
-        model_dict.pop("node_id")
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def node_id(self) -> str:
+        """
+        Node'un içeriğinden üretilen id. İlk erişimde hesaplanır ve instance üzerinde cache'lenir.
+        Cache bu node'un field'larına atama yapılınca sıfırlanır. İç içe node'u olan bir node her erişimde çocuklarının node_id'lerini
+        cache'lendiği andakilerle karşılaştırır, ör. insan.adres.il = "Ankara" sonrası insan.node_id yeniden hesaplanır.
 
-        sha256_hash = sha256(json.dumps(model_dict).encode()).hexdigest()
-        self.node_id = sha256_hash
-        return self
+        Returns:
+            str: Node'un hex id'si
+        """
+        # private attr'a __getattr__ yerine doğrudan dict üzerinden erişmek belirgin şekilde daha hızlı
+        private = self.__pydantic_private__
+        node_id = private["_node_id"]
+        if self.__class__._child_node_fields:
+            child_ids = self._current_child_ids()
+            if node_id is None or private["_child_ids"] != child_ids:
+                node_id = private["_node_id"] = self.generate_node_id()
+                private["_child_ids"] = child_ids
+        elif node_id is None:
+            node_id = private["_node_id"] = self.generate_node_id()
+        return node_id
+
+    def _current_child_ids(self) -> tuple[Any, ...]:
+        values = self.__dict__
+        return tuple([_child_node_ids(values[field_name]) for field_name in self.__class__._child_node_fields])
+
+    def identity_dict(self) -> dict[str, Any]:
+        """
+        node_id'nin hesaplandığı dict'i döner.
+
+        LLM'in serbest metni olan reason kimliğe dahil edilmez, böylece aynı node farklı dokümanlarda aynı id'yi alır.
+        node_config.identity_fields tanımlıysa dolu olan ilk identity field kimliği belirler (ör. Insan için tckn).
+        Aksi halde reason dışındaki tüm field'lar kullanılır. İki durumda da sınıfın modül yolu NODE_TYPE_KEY altında eklenir,
+        aynı içerikli farklı sınıflar (ör. kasko ve trafik Teminatlar) aynı id'yi almaz. İç içe node'lar (ör. Insan.adres) serialize edilmez,
+        onların yerine cache'lenmiş node_id'leri kullanılır. Böylece her alt ağaç bir kere hash'lenir.
+
+        Returns:
+            dict[str, Any]: Hash'lenecek field'lar
+        """
+        return self._identity_from_dump(self.model_dump(exclude=self.__class__._hash_exclude))
+
+    def _identity_from_dump(self, model_dict: dict[str, Any]) -> dict[str, Any]:
+        cls = self.__class__
+        for field_name in cls.node_config.identity_fields or ():
+            value = _child_node_ids(getattr(self, field_name)) if field_name in cls._child_node_fields else model_dict[field_name]
+            if value is not None and value != "":
+                return {NODE_TYPE_KEY: cls._node_type, field_name: value}
+
+        for field_name in cls._child_node_fields:
+            model_dict[field_name] = _child_node_ids(getattr(self, field_name))
+        model_dict[NODE_TYPE_KEY] = cls._node_type
+        return model_dict
+
+    def generate_node_id(self) -> str:
+        """
+        Node'un field'larından id üretir. Cache'e bakmaz, her çağrıda yeniden hesaplar.
+
+        identity_dict sıralı key'li canonical JSON'a çevrilir ve node_config.hash_algorithm ile seçilen algoritmayla hash'lenir.
+
+        Returns:
+            str: Node'un hex id'si
+        """
+        return get_hash_function(self.node_config.hash_algorithm)(canonical_bytes(self.identity_dict()))
+
+    @classmethod
+    def compute_ids(
+        cls,
+        nodes: Sequence["BaseNode"],
+        *,
+        chunk_size: int = 4096,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        pool_threshold: int = 50_000,
+    ) -> list[str]:
+        """
+        Birçok node'un id'sini toplu olarak hesaplar ve her node'un cache'ine yazar.
+
+        Aynı sınıftaki node'lar tek bir serializer çağrısıyla dump edilir, canonical byte'lar chunk'lar halinde hash'lenir.
+        Hesaplanacak node sayısı pool_threshold'u geçerse ve max_workers veya executor verilmişse chunk'lar process pool'a dağıtılır.
+        Sonuçlar tek tek node_id erişimiyle üretilen id'lerle aynıdır.
+
+        Args:
+            nodes (Sequence[BaseNode]): Herhangi bir sınıftan node'lar, sıra korunur
+            chunk_size (int, optional): Bir seferde hash'lenecek node sayısı. Defaults to 4096.
+            max_workers (int | None, optional): Verilirse bu çağrı için bu kadar process'li bir pool açılır. Defaults to None.
+            executor (Executor | None, optional): Tekrar kullanılacak hazır bir pool, max_workers'tan önceliklidir. Defaults to None.
+            pool_threshold (int, optional): Pool kullanmak için gereken en az node sayısı. Defaults to 50_000.
+
+        Returns:
+            list[str]: nodes ile aynı sırada node_id'ler
+        """
+        pending = [node for node in nodes if node.__pydantic_private__["_node_id"] is None]
+
+        # Merkle hash için önce cache'i boş olan iç içe node'ların id'leri hesaplanır
+        children = [child for node in pending for field_name in node._child_node_fields for child in _iter_child_nodes(getattr(node, field_name)) if child.__pydantic_private__["_node_id"] is None]
+        if children:
+            cls.compute_ids(children, chunk_size=chunk_size, max_workers=max_workers, executor=executor, pool_threshold=pool_threshold)
+
+        groups: dict[type[BaseNode], list[BaseNode]] = {}
+        for node in pending:
+            groups.setdefault(node.__class__, []).append(node)
+
+        algorithms: list[str] = []
+        chunks: list[list[bytes]] = []
+        chunk_nodes: list[list[BaseNode]] = []
+        for node_cls, group in groups.items():
+            algorithm = node_cls.node_config.hash_algorithm or get_default_hash_algorithm()
+            model_dicts = _list_adapter(node_cls).dump_python(group, exclude={"__all__": node_cls._hash_exclude})
+            encoded = [canonical_bytes(node._identity_from_dump(model_dict)) for node, model_dict in zip(group, model_dicts, strict=True)]
+            for start in range(0, len(group), chunk_size):
+                algorithms.append(algorithm)
+                chunks.append(encoded[start : start + chunk_size])
+                chunk_nodes.append(group[start : start + chunk_size])
+
+        use_pool = len(pending) >= pool_threshold and (executor is not None or max_workers is not None)
+        if not use_pool:
+            digests = [hash_chunk(algorithm, chunk) for algorithm, chunk in zip(algorithms, chunks, strict=True)]
+        elif executor is not None:
+            digests = list(executor.map(hash_chunk, algorithms, chunks))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                digests = list(pool.map(hash_chunk, algorithms, chunks))
+
+        for group, node_ids in zip(chunk_nodes, digests, strict=True):
+            for node, node_id in zip(group, node_ids, strict=True):
+                private = node.__pydantic_private__
+                private["_node_id"] = node_id
+                if node._child_node_fields:
+                    private["_child_ids"] = node._current_child_ids()
+
+        return [node.node_id for node in nodes]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._child_node_fields = tuple(name for name, field_info in cls.model_fields.items() if _contains_node_type(field_info.annotation))
+        cls._hash_exclude = frozenset({"node_id", "reason", *cls._child_node_fields})
+        # Teminatlar hem kasko hem trafik'te var, sınıf adı tek başına yetmez
+        cls._node_type = f"{cls.__module__}.{cls.__qualname__}"
+
+        for field_name in cls.node_config.identity_fields or ():
+            if field_name not in cls.model_fields:
+                raise ValueError(f"Identity field {field_name} not found in model {cls.__name__}")
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Field'ları, extra'ları ve private attr'ları karşılaştırır. node_id cache'i ve _frozen bayrağı karşılaştırılmaz,
+        böylece node_id'si okunmuş veya intern edilmiş bir node eşit kopyasına eşit kalır.
+        """
+        if not isinstance(other, BaseNode):
+            return NotImplemented
+        return (
+            self.__class__ is other.__class__
+            and self.__dict__ == other.__dict__
+            and (self.__pydantic_extra__ or {}) == (other.__pydantic_extra__ or {})
+            and _compared_private(self) == _compared_private(other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self.__class__.__pydantic_fields__:
+            private = self.__pydantic_private__
+            if private["_frozen"]:
+                raise ValueError(f"{self.__class__.__name__} instance is interned and can not be modified, use model_copy(update=...) instead")
+            private["_node_id"] = None
+        super().__setattr__(name, value)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        # model_copy private attr'ları da kopyalar, kopya her zaman değiştirilebilir olmalı
+        copied.__pydantic_private__["_frozen"] = False
+        if update:
+            copied.__pydantic_private__["_node_id"] = None
+        return copied
 
     @classmethod
     def append_field_description(cls: type[BaseModel], field_name: str, additional_description: str, seperator: str = " ") -> None:
@@ -67,6 +293,7 @@ class BaseNode(BaseModel):
                 field_info.description += seperator + additional_description
             else:
                 field_info.description = additional_description
+            bump_description_version()
 
     @classmethod
     def set_field_description(cls: type[BaseModel], field_name: str, new_description: str) -> None:
@@ -86,3 +313,15 @@ class BaseNode(BaseModel):
 
         else:
             cls.model_fields[field_name].description = new_description
+            bump_description_version()
+
+
+class ContainerNode(BaseNode):
+    """
+    HowToExtract.CASE_1 container node'larının tabanı (Ekler, Teminatlar, ...).
+
+    Container'ların kendi içeriği olmadığından kimliklerini çocuklarının node_id'leri belirler, yoksa her dokümanın Ekler'i
+    aynı vertex olurdu. ContainerMaterializer doldurur.
+    """
+
+    uye_node_idleri: list[str] = Field(default_factory=list, description="Container'a bağlı node'ların sıralı node_id'leri")
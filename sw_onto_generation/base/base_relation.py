@@ -1,12 +1,15 @@
 from typing import ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from sw_onto_generation.base.base_node import BaseNode
-from sw_onto_generation.base.configs import RelationModelConfig
+from sw_onto_generation.base.configs import DEFER_MODEL_BUILD, RelationModelConfig
+from sw_onto_generation.base.schema_cache import bump_description_version
 
 
 class BaseRelation(BaseModel):
+    model_config = ConfigDict(defer_build=DEFER_MODEL_BUILD)
+
     relation_config: ClassVar[RelationModelConfig] = RelationModelConfig()
 
     source_node: BaseNode
@@ -23,6 +26,7 @@ class BaseRelation(BaseModel):
 
             if field_info.description:
                 field_info.description += seperator + additional_description
+                bump_description_version()
 
     @classmethod
     def set_field_description(cls: type[BaseModel], field_name: str, new_description: str) -> None:
@@ -31,6 +35,7 @@ class BaseRelation(BaseModel):
 
         else:
             cls.model_fields[field_name].description = new_description
+            bump_description_version()
 
     @classmethod
     def update_relation_config(cls: type[BaseModel], new_relation_config: RelationModelConfig) -> None:
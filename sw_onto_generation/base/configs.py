@@ -1,13 +1,28 @@
+import os
 from enum import StrEnum
+from typing import Any
 
 from pydantic import BaseModel, Field
 
+from sw_onto_generation.base.schema_cache import bump_description_version
+
+# SW_ONTO_DEFER_BUILD=1 ise node ve relation modellerinin validator ve serializer'ları import anında değil,
+# ilk instance oluşturulduğunda ya da schema istendiğinde kurulur (bkz. utils.warm_up_models)
+DEFER_MODEL_BUILD = os.environ.get("SW_ONTO_DEFER_BUILD", "").lower() in {"1", "true", "yes"}
+
 
 class NebulaIndexType(StrEnum):
     EXACT = "exact"
     VECTOR = "vector"
 
 
+class VidMode(StrEnum):
+    FIXED_STRING = "fixed_string"  # node_id olduğu gibi, FIXED_STRING(64) VID
+    INT64_CONTENT = "int64_content"  # node_id'nin ilk 63 biti, içerik adresli INT64 VID
+    INT64_SNOWFLAKE = "int64_snowflake"  # SnowflakeGenerator ile her yeni node_id için INT64 VID
+    INT64_RANDOM = "int64_random"  # generate_random_64bit_id ile her yeni node_id için INT64 VID
+
+
 class HowToExtract(StrEnum):
     CASE_0 = "case_0"  # LLM extract edecek
     CASE_1 = "case_1"  # nodes_to_be_created case i, başka bir node da bu node nodes_to_be_created içinde olacak
@@ -27,19 +42,35 @@ class RelationFieldConfig(BaseModel):
     )
 
 
-class NodeModelConfig(BaseModel):
+class _DescribedConfig(BaseModel):
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # açıklama cache'lenmiş schema'lara (iç içe modellerinkine de) girer, değişince hepsi yeniden üretilir
+        if name == "description":
+            bump_description_version()
+
+
+class NodeModelConfig(_DescribedConfig):
     # model_config = {"arbitrary_types_allowed": }
     nodetag_index: bool = Field(description="This tag is indexed in Nebula Graph")
     description: str = Field(description=" LLMe nodu tanıtmak için kullanılır")
     cardinality: bool = Field(description="LLMe node'un birden fazla olup olmadığını belirtir")
     how_to_extract: HowToExtract = Field(description="LLM e sorup sorulmayacağını belirtir")
     nodeclass_to_be_created_automatically: type[BaseModel] | None = Field(description="Bu node'un oluşturulması için kullanılacak base node'un tipi")
+    identity_fields: list[str] | None = Field(
+        default=None,
+        description="node_id'yi belirleyen field'lar, öncelik sırasıyla. Dolu olan ilk field tek başına node'un kimliği olur. Hiçbiri dolu değilse reason dışındaki tüm field'lar kullanılır",
+    )
+    hash_algorithm: str | None = Field(
+        default=None,
+        description="node_id üretirken kullanılacak hash algoritması (HashAlgorithm), None ise process genelindeki varsayılan kullanılır",
+    )
 
     model_config = {"extra": "forbid"}
     # extra_fields: list[FieldInfo] = Field(default=[], description="Node'a eklenecek ekstra field'lar")
 
 
-class RelationModelConfig(BaseModel):
+class RelationModelConfig(_DescribedConfig):
     # model_config = {"arbitrary_types_allowed": True}
     edge_index: bool = Field(default=False, description="Index of the edge in Nebula Graph")
     description: str | None = Field(default=None, description="LLMe Relation'u tanıtmak için kullanılır")
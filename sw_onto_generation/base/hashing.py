@@ -0,0 +1,118 @@
+import hashlib
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any
+
+from pydantic_core import to_json
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık: sw-onto-generation[xxhash]
+    xxhash = None  # type: ignore[assignment]
+
+
+class HashAlgorithm(StrEnum):
+    SHA256 = "sha256"  # 64 hex karakter, varsayılan
+    BLAKE2B_128 = "blake2b_128"  # 32 hex karakter
+    XXH64 = "xxh64"  # 16 hex karakter, kriptografik değil, xxhash paketi gerekir
+
+
+HashFunction = Callable[[bytes], str]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _blake2b_128(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _xxh64(data: bytes) -> str:
+    if xxhash is None:
+        raise ImportError("HashAlgorithm.XXH64 requires the 'xxhash' package, install it with 'uv sync --extra xxhash'")
+    return xxhash.xxh64_hexdigest(data)
+
+
+_HASH_FUNCTIONS: dict[str, HashFunction] = {
+    HashAlgorithm.SHA256: _sha256,
+    HashAlgorithm.BLAKE2B_128: _blake2b_128,
+    HashAlgorithm.XXH64: _xxh64,
+}
+
+_default_hash_algorithm: str = HashAlgorithm.SHA256
+
+
+def register_hash_function(algorithm: str, hash_function: HashFunction) -> None:
+    """
+    Yeni bir hash fonksiyonunu algorithm adıyla kaydeder, hazır algoritmalar gibi seçilebilir.
+
+    Args:
+        algorithm (str): NodeModelConfig.hash_algorithm veya set_default_hash_algorithm'de kullanılacak ad
+        hash_function (HashFunction): Canonical byte'ları hex string'e çeviren fonksiyon
+    """
+    _HASH_FUNCTIONS[algorithm] = hash_function
+
+
+def get_hash_function(algorithm: str | None = None) -> HashFunction:
+    """
+    algorithm için kayıtlı hash fonksiyonunu döner, None ise process'in varsayılanını.
+
+    Raises:
+        ValueError: algorithm adıyla kayıtlı bir fonksiyon yoksa hata verir
+    """
+    if algorithm is None:
+        algorithm = _default_hash_algorithm
+    if algorithm not in _HASH_FUNCTIONS:
+        raise ValueError(f"Hash algorithm {algorithm} not found, valid values: {list(_HASH_FUNCTIONS)}")
+    return _HASH_FUNCTIONS[algorithm]
+
+
+def get_default_hash_algorithm() -> str:
+    return _default_hash_algorithm
+
+
+def set_default_hash_algorithm(algorithm: str) -> None:
+    """
+    hash_algorithm'i None olan node sınıflarının kullanacağı algoritmayı ayarlar. Cache'lenmiş node_id'ler yeniden hesaplanmaz.
+
+    Raises:
+        ValueError: algorithm adıyla kayıtlı bir fonksiyon yoksa hata verir
+    """
+    global _default_hash_algorithm
+
+    get_hash_function(algorithm)
+    _default_hash_algorithm = algorithm
+
+
+_CONTAINER_TYPES = frozenset({dict, list, tuple})
+
+
+def hash_chunk(algorithm: str, chunk: list[bytes]) -> list[str]:
+    """
+    Bir chunk canonical byte'ı tek algoritmayla hash'ler. Process pool'da çalışabilmesi için modül seviyesinde.
+
+    register_hash_function ile eklenen algoritmaları sadece kaydı miras alan (fork) veya import sırasında kaydeden worker'lar görür.
+    """
+    hash_function = get_hash_function(algorithm)
+    return [hash_function(data) for data in chunk]
+
+
+def _sort_keys(value: Any) -> Any:
+    # model_dump çıktısı sadece düz dict/list içerdiği için isinstance yerine type() kontrolü yeterli ve daha hızlı
+    if type(value) is dict:
+        return {key: _sort_keys(value[key]) if type(value[key]) in _CONTAINER_TYPES else value[key] for key in sorted(value)}
+    return [_sort_keys(item) if type(item) in _CONTAINER_TYPES else item for item in value]
+
+
+def canonical_bytes(data: dict[str, Any]) -> bytes:
+    """
+    data'yı sıralı key'li, boşluksuz, UTF-8 JSON'a çevirir. Türkçe karakterler \\u kaçışıyla şişirilmez.
+
+    Args:
+        data (dict[str, Any]): JSON'a çevrilebilir dict, genelde node'un identity_dict'i
+
+    Returns:
+        bytes: data'nın canonical byte karşılığı
+    """
+    return to_json(_sort_keys(data))
@@ -0,0 +1,114 @@
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, Field
+
+from sw_onto_generation.base.base_node import BaseNode
+
+NodeT = TypeVar("NodeT", bound=BaseNode)
+
+
+class InternPoolStats(BaseModel):
+    hits: int = Field(default=0, description="Havuzdaki bir instance ile değiştirilen node sayısı")
+    misses: int = Field(default=0, description="Havuza yeni eklenen node sayısı")
+    evictions: int = Field(default=0, description="LRU ile havuzdan çıkarılan node sayısı")
+    size: int = Field(default=0, description="Havuzdaki node sayısı")
+    bytes_saved: int = Field(default=0, description="Paylaşılan instance'lar sayesinde tutulmayan tekrar node'ların yaklaşık boyutu")
+
+
+def _approx_size(value: Any) -> int:
+    if isinstance(value, BaseNode):
+        size = sys.getsizeof(value) + sys.getsizeof(value.__dict__) + sys.getsizeof(value.__pydantic_private__)
+        return size + sum(_approx_size(item) for item in value.__dict__.values())
+    if isinstance(value, list | tuple):
+        return sys.getsizeof(value) + sum(_approx_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class NodeInternPool:
+    """
+    Her farklı node'u tek bir paylaşılan, değiştirilemez instance'a eşleyen opsiyonel havuz.
+
+    Node'lar (sınıf, node_id) ile tutulur, identity_fields tanımlıysa aynı tckn'li iki Insan ilk görülene düşer. İç içe
+    node'lar da intern edilir. Intern edilen instance'lara atama yapılamaz, değişiklik için model_copy(update=...) kullanılır.
+    Havuz en fazla max_size node tutar ve en uzun süre kullanılmayanı çıkarır, çıkarılan node'lar değiştirilemez kalır.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        """
+        Args:
+            max_size (int): Havuzda tutulacak en fazla node sayısı
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self._nodes: OrderedDict[tuple[type[BaseNode], str], BaseNode] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = InternPoolStats()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: BaseNode) -> bool:
+        return (node.__class__, node.node_id) in self._nodes
+
+    @property
+    def stats(self) -> InternPoolStats:
+        return self._stats.model_copy(update={"size": len(self._nodes)})
+
+    def intern(self, node: NodeT) -> NodeT:
+        """
+        node'un paylaşılan instance'ını döner, node yeniyse havuza eklenir.
+
+        Args:
+            node (BaseNode): Intern edilecek node, havuza eklenince değiştirilemez olur
+
+        Returns:
+            BaseNode: node ile aynı kimlikteki havuzdaki instance
+        """
+        key = (node.__class__, node.node_id)
+        with self._lock:
+            pooled = self._nodes.get(key)
+            if pooled is not None:
+                self._nodes.move_to_end(key)
+                self._stats.hits += 1
+                if pooled is not node:
+                    self._stats.bytes_saved += _approx_size(node)
+                return pooled  # type: ignore[return-value]
+
+        # iç içe node'lar parent'tan önce havuza girer, child id'si değişmediği için parent'ın id'si de değişmez
+        for field_name in node._child_node_fields:
+            value = node.__dict__[field_name]
+            if isinstance(value, BaseNode):
+                node.__dict__[field_name] = self.intern(value)
+            elif isinstance(value, list):
+                node.__dict__[field_name] = [self.intern(item) if isinstance(item, BaseNode) else item for item in value]
+
+        with self._lock:
+            pooled = self._nodes.setdefault(key, node)
+            if pooled is not node:
+                # başka bir thread aynı node'u araya girip eklemiş
+                self._stats.hits += 1
+                self._stats.bytes_saved += _approx_size(node)
+                return pooled  # type: ignore[return-value]
+
+            node.__pydantic_private__["_frozen"] = True
+            self._stats.misses += 1
+            while len(self._nodes) > self.max_size:
+                self._nodes.popitem(last=False)
+                self._stats.evictions += 1
+        return node
+
+    def intern_many(self, nodes: Iterable[NodeT]) -> list[NodeT]:
+        """nodes'daki her node'u intern eder, paylaşılan instance'ları aynı sırayla döner."""
+        return [self.intern(node) for node in nodes]
+
+    def clear(self) -> None:
+        """Havuzu ve sayaçları sıfırlar. Paylaşılmış instance'lar değiştirilemez kalır."""
+        with self._lock:
+            self._nodes.clear()
+            self._stats = InternPoolStats()
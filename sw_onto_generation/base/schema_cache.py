@@ -0,0 +1,95 @@
+import threading
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
+from pydantic_core import CoreSchema, to_json
+
+_version = 0
+_lock = threading.Lock()
+
+
+class _CachedSchema(NamedTuple):
+    version: int
+    model_config_obj: Any
+    schema: dict[str, Any]
+    schema_bytes: bytes
+
+
+_CACHE: dict[type[BaseModel], _CachedSchema] = {}
+
+
+def _model_config_obj(model_cls: type[BaseModel]) -> Any:
+    return getattr(model_cls, "node_config", None) or getattr(model_cls, "relation_config", None)
+
+
+class LiveDescriptionJsonSchema(GenerateJsonSchema):
+    """Açıklamaları güncel model_fields'tan ve ontoloji config'lerinden alan schema generator'ı."""
+
+    def model_schema(self, schema: CoreSchema) -> JsonSchemaValue:
+        json_schema = super().model_schema(schema)
+        model_cls = schema["cls"]  # type: ignore[typeddict-item]
+        properties = json_schema.get("properties", {})
+        for field_name, field_info in model_cls.model_fields.items():
+            field_schema = properties.get(field_info.alias or field_name)
+            if field_schema is None:
+                continue
+            if field_info.description:
+                field_schema["description"] = field_info.description
+            else:
+                field_schema.pop("description", None)
+
+        config = _model_config_obj(model_cls)
+        if config is not None and config.description:
+            json_schema["description"] = config.description
+        return json_schema
+
+
+def description_version() -> int:
+    return _version
+
+
+def bump_description_version() -> int:
+    """
+    Cache'lenmiş bütün schema'ları geçersiz kılar, her field veya model açıklaması değişikliğinde çağrılır.
+
+    Versiyon globaldir çünkü bir schema iç içe modellerin açıklamalarını da içerir (Insan, Adres'i içerir).
+    """
+    global _version
+    with _lock:
+        _version += 1
+        return _version
+
+
+def clear_schema_cache() -> None:
+    with _lock:
+        _CACHE.clear()
+
+
+def _cached(model_cls: type[BaseModel]) -> _CachedSchema:
+    entry = _CACHE.get(model_cls)
+    # node_config veya relation_config sınıfa yeniden atanmışsa da yeniden üret
+    if entry is not None and entry.version == _version and entry.model_config_obj is _model_config_obj(model_cls):
+        return entry
+
+    with _lock:
+        version = _version
+        schema = model_cls.model_json_schema(schema_generator=LiveDescriptionJsonSchema)
+        entry = _CachedSchema(version, _model_config_obj(model_cls), schema, to_json(schema))
+        _CACHE[model_cls] = entry
+    return entry
+
+
+def cached_json_schema(model_cls: type[BaseModel]) -> dict[str, Any]:
+    """
+    model_cls'ın JSON schema'sını döner, her açıklama versiyonu için en fazla bir kere üretilir.
+
+    model_json_schema() her çağrıda core schema'yı baştan gezer ve sınıf oluştuktan sonra değişen açıklamaları görmez. Buradaki
+    schema'lar açıklamaları canlı model_fields'tan alır. Dönen dict paylaşılır, değiştirilmemeli.
+    """
+    return _cached(model_cls).schema
+
+
+def cached_json_schema_bytes(model_cls: type[BaseModel]) -> bytes:
+    """cached_json_schema'nın JSON byte'larını döner, her açıklama versiyonu için bir kere serialize edilir."""
+    return _cached(model_cls).schema_bytes
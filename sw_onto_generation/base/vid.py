@@ -0,0 +1,115 @@
+from collections.abc import Sequence
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import VidMode
+from sw_onto_generation.base.id_generator import SnowflakeGenerator, generate_random_64bit_id
+from sw_onto_generation.utils import check_valid_lib_and_ontology
+
+MAX_INT64_VID = (1 << 63) - 1
+
+
+class VidCollisionError(ValueError):
+    pass
+
+
+def content_vid(node_id: str) -> int:
+    """
+    Hex node_id'nin ilk 63 bitini alarak negatif olmayan bir int64 VID üretir.
+
+    Args:
+        node_id (str): En az 16 karakterlik hex node id (sha256, blake2b_128 veya xxh64)
+
+    Returns:
+        int: [0, 2**63 - 1] aralığında VID
+    """
+    return int(node_id[:16], 16) >> 1
+
+
+def nebula_vid_type(mode: VidMode) -> str:
+    """mode için Nebula space'inin vid_type'ını döner, ör. FIXED_STRING(64) veya INT64."""
+    return "FIXED_STRING(64)" if mode == VidMode.FIXED_STRING else "INT64"
+
+
+class VidAllocator:
+    """
+    Node'lara Nebula VID'i atar.
+
+    Varsayılan VID hex node_id'dir (FIXED_STRING(64)). INT64_CONTENT node_id'nin ilk 63 bitini kullanır ve çakışmada
+    VidCollisionError verir. INT64_SNOWFLAKE ve INT64_RANDOM bir node_id'ye ilk görüldüğünde yeni id verir, id'ler sadece
+    aynı allocator içinde sabittir, process'ler arası gerekirse assigned saklanmalı.
+    """
+
+    def __init__(self, mode: VidMode = VidMode.FIXED_STRING, machine_id: int = 1, check_collisions: bool = True):
+        """
+        Args:
+            mode (VidMode): VID'lerin node'lardan nasıl üretileceği
+            machine_id (int): INT64_SNOWFLAKE için makine id'si (0-1023)
+            check_collisions (bool): INT64_CONTENT'te verilen VID'leri hatırlar, çakışmada hata verir
+        """
+        self.mode = VidMode(mode)
+        self.check_collisions = check_collisions
+        self._snowflake = SnowflakeGenerator(machine_id=machine_id) if self.mode == VidMode.INT64_SNOWFLAKE else None
+        # INT64_CONTENT için vid -> node_id, diğer INT64 modları için node_id -> vid
+        self._content_owners: dict[int, str] = {}
+        self.assigned: dict[str, int] = {}
+
+    def vid_for_id(self, node_id: str) -> int | str:
+        """
+        node_id'li node'un VID'ini döner.
+
+        Raises:
+            VidCollisionError: INT64_CONTENT iki farklı node_id'yi aynı VID'e eşlerse hata verir
+        """
+        if self.mode == VidMode.FIXED_STRING:
+            return node_id
+
+        if self.mode == VidMode.INT64_CONTENT:
+            vid = content_vid(node_id)
+            if self.check_collisions:
+                owner = self._content_owners.setdefault(vid, node_id)
+                if owner != node_id:
+                    raise VidCollisionError(f"VID {vid} of node {node_id} is already used by node {owner}")
+            return vid
+
+        vid = self.assigned.get(node_id)
+        if vid is None:
+            vid = self._snowflake.generate_id() if self._snowflake is not None else generate_random_64bit_id()
+            self.assigned[node_id] = vid
+        return vid
+
+    def vid(self, node: BaseNode) -> int | str:
+        """node'un VID'ini döner, bkz. vid_for_id."""
+        return self.vid_for_id(node.node_id)
+
+    def vids(self, nodes: Sequence[BaseNode]) -> list[int | str]:
+        """nodes'un VID'lerini sırayla döner, eksik node_id'ler önce toplu hesaplanır."""
+        return [self.vid_for_id(node_id) for node_id in BaseNode.compute_ids(nodes)]
+
+
+_ONTOLOGY_VID_MODES: dict[tuple[str, str], VidMode] = {}
+_ONTOLOGY_ALLOCATORS: dict[tuple[str, str], VidAllocator] = {}
+
+
+def set_ontology_vid_mode(lib_name: str, ontology_name: str, mode: VidMode) -> None:
+    """
+    Bir ontolojinin VID modunu seçer. Ontolojinin allocator'ı ve atadığı VID'ler sıfırlanır.
+
+    Raises:
+        ValueError: Lib veya ontoloji yoksa hata verir
+    """
+    check_valid_lib_and_ontology(lib_name, ontology_name)
+    _ONTOLOGY_VID_MODES[(lib_name, ontology_name)] = VidMode(mode)
+    _ONTOLOGY_ALLOCATORS.pop((lib_name, ontology_name), None)
+
+
+def get_ontology_vid_mode(lib_name: str, ontology_name: str) -> VidMode:
+    check_valid_lib_and_ontology(lib_name, ontology_name)
+    return _ONTOLOGY_VID_MODES.get((lib_name, ontology_name), VidMode.FIXED_STRING)
+
+
+def get_vid_allocator(lib_name: str, ontology_name: str) -> VidAllocator:
+    """Ontolojinin process genelindeki allocator'ını döner, ilk kullanımda seçili modla oluşturulur."""
+    key = (lib_name, ontology_name)
+    if key not in _ONTOLOGY_ALLOCATORS:
+        _ONTOLOGY_ALLOCATORS[key] = VidAllocator(get_ontology_vid_mode(lib_name, ontology_name))
+    return _ONTOLOGY_ALLOCATORS[key]
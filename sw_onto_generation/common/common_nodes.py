@@ -2,7 +2,7 @@ from typing import ClassVar
 
 from pydantic import Field
 
-from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.base_node import BaseNode, ContainerNode
 from sw_onto_generation.base.configs import HowToExtract, NebulaIndexType, NodeFieldConfig, NodeModelConfig
 
 
@@ -86,6 +86,7 @@ class Insan(BaseNode):
         cardinality=True,
         how_to_extract=HowToExtract.CASE_0,
         nodeclass_to_be_created_automatically=None,
+        identity_fields=["tckn", "yabanci_kimlik_no", "pasaport_no"],
     )
 
     ad: str | None = Field(
@@ -167,6 +168,7 @@ class Sirket(BaseNode):
         cardinality=True,
         how_to_extract=HowToExtract.CASE_0,
         nodeclass_to_be_created_automatically=None,
+        identity_fields=["vkn", "mersisno"],
     )
 
     unvan: str | None = Field(
@@ -357,7 +359,7 @@ class UyusmazlikCozumYeri(BaseNode):
     )
 
 
-class Ekler(BaseNode):
+class Ekler(ContainerNode):
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         nodetag_index=True,
         description="Predefined",
@@ -379,7 +381,7 @@ class Ek(BaseNode):
     ek_aciklama: str | None = Field(default=None, description="sozlemede belirtilen ekin aciklamasi. ")
 
 
-class FesihMaddeleri(BaseNode):
+class FesihMaddeleri(ContainerNode):
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         nodetag_index=False,
         description="Predefined",
@@ -403,7 +405,7 @@ class FesihMaddesi(BaseNode):
     fesih_maddesi: str | None = Field(default=None, description="Sozlesmede belirtilen fesih maddesi. ")
 
 
-class FaizMaddeleri(BaseNode):
+class FaizMaddeleri(ContainerNode):
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         nodetag_index=False,
         description="Predefined",
@@ -441,7 +443,7 @@ class FaizMaddesi(BaseNode):
     )
 
 
-class Istisnalar(BaseNode):
+class Istisnalar(ContainerNode):
     """Istisnalar node."""
 
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
@@ -462,7 +464,7 @@ class Istisna(BaseNode):
         description="Sigorta poliçesinde uygulanan istisnaları tanımlar. Bu istisnalar primi azaltabilir, teminat kapsamını sınırlayabilir. Alkollü araba kullanımı, sürücü belgesiz araç kullanımı vb.",
         cardinality=True,
         how_to_extract=HowToExtract.CASE_0,
-        nodeclass_to_be_created_automatically=None,
+        nodeclass_to_be_created_automatically=Istisnalar,
     )
     istisna_turu: str = Field(description="Istisna türü (ALKOLLU ARABA KULLANIMI, vb.)")
     açıklama: str | None = Field(
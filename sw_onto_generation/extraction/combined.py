@@ -0,0 +1,144 @@
+import re
+from functools import cache
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, Field, create_model
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.base_relation import BaseRelation
+from sw_onto_generation.base.configs import HowToExtract
+from sw_onto_generation.utils import get_ontology_registry, get_relation_endpoint_types
+
+
+def snake_case(class_name: str) -> str:
+    """Sınıf adını combined modeldeki field adına çevirir, ör. KaskoPolice -> kasko_police."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()
+
+
+class CombinedExtraction(BaseModel):
+    """
+    Tek LLM çağrısıyla extraction için üretilen modellerin base'i.
+
+    Ontolojinin bütün CASE_0 node sınıfları ve ask_llm=True relation'ları tek modelde toplanır, cardinality=True olan sınıflar
+    liste, diğerleri opsiyonel field olur. Relation'lar uç node'larını tekrar etmemek için referans modeli olarak döner,
+    source_node/target_node field adı ve liste index'iyle node'a işaret eder (ör. "insan[1]", "kasko_police"). Sınıf
+    değişkenleri üretilen field adlarını ontoloji sınıflarına eşler.
+    """
+
+    node_fields: ClassVar[dict[str, type[BaseNode]]] = {}
+    relation_fields: ClassVar[dict[str, type[BaseRelation]]] = {}
+
+    def split(self, skip_invalid_relations: bool = False) -> tuple[list[BaseNode], list[BaseRelation]]:
+        """
+        Cevabı çıkarılan node'lara ve relation'lara ayırır.
+
+        Args:
+            skip_invalid_relations (bool): Referansı bilinmeyen veya yanlış tipte node'a işaret eden relation'ları hata vermek yerine atlar
+
+        Returns:
+            tuple[list[BaseNode], list[BaseRelation]]: Field sırasıyla node'lar, sonra field sırasıyla relation'lar
+
+        Raises:
+            ValueError: Bir relation olmayan veya yanlış tipte bir node'a işaret ederse hata verir
+        """
+        nodes: list[BaseNode] = []
+        refs: dict[str, BaseNode] = {}
+        for field_name in self.node_fields:
+            value = getattr(self, field_name)
+            if isinstance(value, list):
+                for index, node in enumerate(value):
+                    refs[f"{field_name}[{index}]"] = node
+                nodes.extend(value)
+            elif value is not None:
+                refs[field_name] = value
+                nodes.append(value)
+
+        relations: list[BaseRelation] = []
+        for field_name, relation_cls in self.relation_fields.items():
+            for ref in getattr(self.relations, field_name):  # type: ignore[attr-defined]
+                try:
+                    source_node, target_node = _lookup(refs, ref.source_node), _lookup(refs, ref.target_node)
+                    relations.append(relation_cls(source_node=source_node, target_node=target_node, reason=ref.reason))
+                except ValueError:
+                    if not skip_invalid_relations:
+                        raise
+        return nodes, relations
+
+
+def _lookup(refs: dict[str, BaseNode], ref: str) -> BaseNode:
+    node = refs.get(ref)
+    if node is None:
+        raise ValueError(f"Node reference {ref} not found in extraction, valid values: {', '.join(refs)}")
+    return node
+
+
+def _ref_field(description: str, node_fields: dict[str, type[BaseNode]], allowed: tuple[type[BaseNode], ...]) -> tuple[type[str], Any]:
+    names = [name for name, node_cls in node_fields.items() if issubclass(node_cls, allowed)]
+    listed = [f"{name}[i]" if node_fields[name].node_config.cardinality else name for name in names]
+    single = "|".join(name for name in names if not node_fields[name].node_config.cardinality)
+    multiple = "|".join(name for name in names if node_fields[name].node_config.cardinality)
+    patterns = ([f"^({single})$"] if single else []) + ([rf"^({multiple})\[\d+\]$"] if multiple else [])
+    return str, Field(description=f"{description}, şunlardan biri: {', '.join(listed)}", pattern="|".join(patterns))
+
+
+def build_combined_model(lib_name: str, ontology_name: str) -> type[CombinedExtraction]:
+    """
+    Bir ontolojinin combined cevap modelini kurar, cache'li hali için get_combined_model.
+
+    Raises:
+        ValueError: Lib veya ontoloji yoksa hata verir
+    """
+    registry = get_ontology_registry()
+    node_fields = {snake_case(node_cls.__name__): node_cls for node_cls in registry.node_classes_by_case(HowToExtract.CASE_0, lib_name, ontology_name)}
+    model_name = "".join(part.capitalize() for part in ontology_name.split("_"))
+
+    relation_fields: dict[str, type[BaseRelation]] = {}
+    relation_definitions: dict[str, Any] = {}
+    for relation_cls in registry.relation_classes(lib_name, ontology_name):
+        if not relation_cls.relation_config.ask_llm:
+            continue
+        sources = get_relation_endpoint_types(relation_cls, "source_node")
+        targets = get_relation_endpoint_types(relation_cls, "target_node")
+        # uç node'lardan biri LLM'e sorulmuyorsa relation referans verilemez
+        if not any(issubclass(node_cls, sources) for node_cls in node_fields.values()) or not any(issubclass(node_cls, targets) for node_cls in node_fields.values()):
+            continue
+
+        ref_model = create_model(
+            f"{relation_cls.__name__}Ref",
+            __doc__=relation_cls.relation_config.description or relation_cls.__doc__,
+            source_node=_ref_field("Kaynak node referansı", node_fields, sources),
+            target_node=_ref_field("Hedef node referansı", node_fields, targets),
+            reason=(str, Field(description=relation_cls.model_fields["reason"].description)),
+        )
+        field_name = snake_case(relation_cls.__name__)
+        relation_fields[field_name] = relation_cls
+        relation_definitions[field_name] = (list[ref_model], Field(default_factory=list, description=relation_cls.relation_config.description))
+
+    relations_model = create_model(f"{model_name}Relations", **relation_definitions)
+
+    node_definitions: dict[str, Any] = {}
+    for field_name, node_cls in node_fields.items():
+        if node_cls.node_config.cardinality:
+            node_definitions[field_name] = (list[node_cls], Field(default_factory=list, description=node_cls.node_config.description))  # type: ignore[valid-type]
+        else:
+            node_definitions[field_name] = (node_cls | None, Field(default=None, description=node_cls.node_config.description))
+
+    model = create_model(
+        f"{model_name}Extraction",
+        __base__=CombinedExtraction,
+        __doc__=(
+            "Dokümandaki tüm node'ları ve aralarındaki ilişkileri tek seferde çıkar. "
+            "İlişkilerde node'lara alan adı ve listedeki sırası ile referans ver, örneğin 'insan[0]' veya tekil node'lar için 'general_document_info'."
+        ),
+        **node_definitions,
+        relations=(relations_model, Field(default_factory=relations_model, description="Node'lar arasındaki ilişkiler")),
+    )
+    model.node_fields = node_fields
+    model.relation_fields = relation_fields
+    return model
+
+
+@cache
+def get_combined_model(lib_name: str, ontology_name: str) -> type[CombinedExtraction]:
+    """Ontolojinin process genelindeki combined modelini döner, ilk kullanımda kurulur."""
+    return build_combined_model(lib_name, ontology_name)
@@ -0,0 +1,213 @@
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic import BaseModel, Field
+from pydantic.json_schema import models_json_schema
+from pydantic_core import to_json
+
+from sw_onto_generation import DIR_STRUCTURE
+from sw_onto_generation.base.hashing import canonical_bytes
+from sw_onto_generation.base.schema_cache import LiveDescriptionJsonSchema, cached_json_schema
+
+STRIPPED_KEYS = frozenset({"title", "config"})
+_NAME_MAPPINGS = frozenset({"properties", "$defs", "patternProperties"})
+_REF_PREFIX = "#/$defs/"
+
+
+class SchemaTokenReport(BaseModel):
+    ontology: str
+    raw_tokens: int = Field(description="model_json_schema çıktısının tahmini token sayısı")
+    compact_tokens: int = Field(description="compact_schema çıktısının tahmini token sayısı")
+    budget_tokens: int | None = Field(default=None, description="Token bütçesi verildiyse bütçeye göre kısaltılmış şemanın token sayısı")
+    description_limit: int | None = Field(default=None, description="Bütçeye sığmak için açıklamaların kısaltıldığı karakter sayısı, kısaltma yoksa None")
+
+
+def estimate_tokens(schema: Any) -> int:
+    """Schema'nın veya string'in prompt token sayısını karakter / 4 olarak tahmin eder."""
+    text = schema if isinstance(schema, str) else to_json(schema).decode()
+    return -(-len(text) // 4)
+
+
+def _strip(node: Any, stripped_keys: frozenset[str]) -> Any:
+    if isinstance(node, list):
+        return [_strip(item, stripped_keys) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    result: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in stripped_keys or (key == "default" and value is None):
+            continue
+        if key in _NAME_MAPPINGS:
+            # anahtarlar field veya tanım isimleri, keyword değil
+            result[key] = {name: _strip(item, stripped_keys) for name, item in value.items()}
+        else:
+            result[key] = _strip(value, stripped_keys)
+
+    any_of = result.get("anyOf")
+    if any_of and all(isinstance(item, dict) and item.keys() == {"type"} and isinstance(item["type"], str) for item in any_of):
+        del result["anyOf"]
+        result["type"] = [item["type"] for item in any_of]
+    return result
+
+
+def _rewrite_refs(node: Any, renames: dict[str, str]) -> Any:
+    if isinstance(node, list):
+        return [_rewrite_refs(item, renames) for item in node]
+    if not isinstance(node, dict):
+        return node
+    result = {key: _rewrite_refs(value, renames) for key, value in node.items()}
+    ref = result.get("$ref")
+    if isinstance(ref, str) and ref.startswith(_REF_PREFIX) and ref[len(_REF_PREFIX) :] in renames:
+        result["$ref"] = _REF_PREFIX + renames[ref[len(_REF_PREFIX) :]]
+    return result
+
+
+def _short_name(name: str) -> str:
+    # pydantic çakışan isimleri sw_onto_generation__root__..__nodes__Arac ya da ..__HasKefilRef__1 şeklinde verir
+    return re.sub(r"__\d+$", "", name).rsplit("__", 1)[-1]
+
+
+def _dedupe_defs(schema: dict[str, Any]) -> dict[str, Any]:
+    # bir birleştirme başka tanımları da özdeş yapabilir, değişiklik kalmayana kadar tekrarlanır
+    while True:
+        defs = schema.get("$defs", {})
+        first_by_content: dict[bytes, str] = {}
+        renames: dict[str, str] = {}
+        for name, definition in defs.items():
+            renames_to = first_by_content.setdefault(canonical_bytes(definition), name)
+            if renames_to != name:
+                renames[name] = renames_to
+        if not renames:
+            break
+        schema = _rewrite_refs({**schema, "$defs": {name: d for name, d in defs.items() if name not in renames}}, renames)
+
+    defs = schema.get("$defs", {})
+    renames = {}
+    used = {_short_name(name) for name in defs if _short_name(name) == name}
+    for name in defs:
+        short = _short_name(name)
+        if short == name:
+            continue
+        candidate, suffix = short, 2
+        while candidate in used:
+            candidate, suffix = f"{short}{suffix}", suffix + 1
+        used.add(candidate)
+        renames[name] = candidate
+    if renames:
+        schema = _rewrite_refs({**schema, "$defs": {renames.get(name, name): d for name, d in defs.items()}}, renames)
+    return schema
+
+
+def _truncate_descriptions(node: Any, limit: int) -> Any:
+    if isinstance(node, list):
+        return [_truncate_descriptions(item, limit) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    result: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in _NAME_MAPPINGS:
+            result[key] = {name: _truncate_descriptions(item, limit) for name, item in value.items()}
+        elif key == "description" and isinstance(value, str):
+            if limit > 0:
+                result[key] = _truncate_text(value, limit)
+        else:
+            result[key] = _truncate_descriptions(value, limit)
+    return result
+
+
+def _truncate_text(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    cut = text[: limit - 1]
+    # kelimenin ortasından kesme, yarıdan sonra bir boşluk varsa orada kes
+    space = cut.rfind(" ")
+    if space > limit // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,.;:") + "…"
+
+
+def _max_description_length(node: Any) -> int:
+    if isinstance(node, list):
+        return max((_max_description_length(item) for item in node), default=0)
+    if not isinstance(node, dict):
+        return 0
+    lengths = [len(node["description"])] if isinstance(node.get("description"), str) else []
+    for key, value in node.items():
+        if key in _NAME_MAPPINGS:
+            lengths.extend(_max_description_length(item) for item in value.values())
+        elif key != "description":
+            lengths.append(_max_description_length(value))
+    return max(lengths, default=0)
+
+
+def fit_to_budget(schema: dict[str, Any], max_tokens: int) -> tuple[dict[str, Any], int | None]:
+    """
+    Açıklamaları, schema'yı max_tokens içinde tutan en uzun ortak uzunlukta keser.
+
+    Returns:
+        tuple[dict[str, Any], int | None]: Schema ve açıklama uzunluk sınırı, schema zaten sığıyorsa None. Açıklamasız hali de
+            sığmıyorsa açıklamasız schema ve 0 döner.
+    """
+    if estimate_tokens(schema) <= max_tokens:
+        return schema, None
+
+    low, high = 0, _max_description_length(schema)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(_truncate_descriptions(schema, middle)) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return _truncate_descriptions(schema, low), low
+
+
+def compact_schema(schema: dict[str, Any], max_tokens: int | None = None, stripped_keys: frozenset[str] = STRIPPED_KEYS) -> dict[str, Any]:
+    """
+    JSON schema'nın LLM'e gereken en küçük eşdeğerini döner, girdi değişmez.
+
+    LLM'in kullanmadığı key'ler (title, field'ların Nebula config'i, default: null) atılır, düz tiplerin anyOf'u tip listesine
+    indirilir, yapısı aynı $defs'ler birleştirilir ve çakışan tanımların uzun modül adları kısaltılır.
+
+    Args:
+        schema (dict[str, Any]): JSON schema, ör. model_json_schema() veya cached_json_schema çıktısı
+        max_tokens (int | None, optional): Token bütçesi, açıklamalar buna sığacak şekilde kısaltılır. Defaults to None.
+        stripped_keys (frozenset[str], optional): Schema'nın her yerinden silinecek key'ler. Defaults to STRIPPED_KEYS.
+
+    Returns:
+        dict[str, Any]: Kompakt schema
+    """
+    compact = _dedupe_defs(_strip(schema, stripped_keys))
+    if max_tokens is not None:
+        compact, _ = fit_to_budget(compact, max_tokens)
+    return compact
+
+
+def compact_models_schema(model_classes: Sequence[type[BaseModel]], max_tokens: int | None = None) -> dict[str, Any]:
+    """
+    Tek $defs paylaşan birden fazla modelin kompakt schema'sı, ör. bütün ontolojilerin combined modelleri tek prompt öneki olarak.
+
+    Modeller $defs içindedir ve anyOf altında listelenir.
+    """
+    refs, schema = models_json_schema([(model_cls, "validation") for model_cls in model_classes], schema_generator=LiveDescriptionJsonSchema)
+    schema["anyOf"] = [refs[(model_cls, "validation")] for model_cls in model_classes]
+    return compact_schema(schema, max_tokens)
+
+
+def ontology_token_report(max_tokens: int | None = None) -> list[SchemaTokenReport]:
+    """Her ontolojinin combined modelinin ham, kompakt ve max_tokens içindeki tahmini prompt token sayıları."""
+    from sw_onto_generation.extraction.combined import get_combined_model
+
+    reports = []
+    for lib_name, ontology_names in DIR_STRUCTURE.items():
+        for ontology_name in ontology_names:
+            raw = cached_json_schema(get_combined_model(lib_name, ontology_name))
+            compact = compact_schema(raw)
+            report = SchemaTokenReport(ontology=f"{lib_name}.{ontology_name}", raw_tokens=estimate_tokens(raw), compact_tokens=estimate_tokens(compact))
+            if max_tokens is not None:
+                fitted, limit = fit_to_budget(compact, max_tokens)
+                report.budget_tokens, report.description_limit = estimate_tokens(fitted), limit
+            reports.append(report)
+    return reports
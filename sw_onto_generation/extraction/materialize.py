@@ -0,0 +1,77 @@
+from collections.abc import Iterable, Sequence
+from functools import cache
+
+from sw_onto_generation.base.base_node import BaseNode, ContainerNode
+from sw_onto_generation.base.base_relation import BaseRelation
+from sw_onto_generation.relation_resolver import AUTOMATIC_RELATION_REASON, get_relation_resolver
+from sw_onto_generation.utils import get_ontology_registry
+
+
+class ContainerMaterializer:
+    """
+    HowToExtract.CASE_1 container node'larını LLM çağırmadan oluşturur.
+
+    Çocuk sınıf container'ını nodeclass_to_be_created_automatically'de belirtir (Ek -> Ekler, Teminat -> Teminatlar). Dokümanın
+    node'ları arasında bulunan her container sınıfı için bir container oluşturulur ve dokümanın ask_llm=False relation'ları
+    relation resolver ile üretilir, ör. GeneralDocumentInfo -> Ekler -> Ek. Container'ın uye_node_idleri çocuklarının sıralı
+    node_id'leridir, node_id'si de bu field'dan hesaplanır (bkz. ContainerNode).
+    """
+
+    def __init__(self, lib_name: str, ontology_name: str):
+        """
+        Args:
+            lib_name (str): Ontology'nin lib'i, ör. "LegalContract"
+            ontology_name (str): Container'ları oluşturulacak ontology, ör. "kasko_police"
+
+        Raises:
+            ValueError: Lib veya ontology yoksa ya da bir container sınıfı ContainerNode değilse hata verir
+        """
+        node_classes = get_ontology_registry().node_classes(lib_name, ontology_name)
+        self.resolver = get_relation_resolver(lib_name, ontology_name)
+        # child sınıfı -> container sınıfı
+        self.containers: dict[type[BaseNode], type[ContainerNode]] = {}
+        for node_cls in node_classes:
+            container_cls = node_cls.node_config.nodeclass_to_be_created_automatically
+            if container_cls is not None and container_cls in node_classes:
+                if not issubclass(container_cls, ContainerNode):
+                    raise ValueError(f"Container class {container_cls.__name__} of {node_cls.__name__} must subclass ContainerNode")
+                self.containers[node_cls] = container_cls
+
+    def build_containers(self, nodes: Iterable[BaseNode], reason: str = AUTOMATIC_RELATION_REASON) -> list[ContainerNode]:
+        """Verilen çocukların container'larını oluşturur, en az bir çocuğu olan her container sınıfı için bir tane."""
+        children: dict[type[ContainerNode], list[BaseNode]] = {}
+        for node in nodes:
+            container_cls = self.containers.get(node.__class__)
+            if container_cls is not None:
+                children.setdefault(container_cls, []).append(node)
+
+        containers = []
+        for container_cls, members in children.items():
+            # diğer alanlar sabit varsayılanlar (ek_var=True), validasyona gerek yok
+            containers.append(container_cls.model_construct(reason=reason, uye_node_idleri=sorted(member.node_id for member in members)))
+        return containers
+
+    def materialize(self, nodes: Sequence[BaseNode], reason: str = AUTOMATIC_RELATION_REASON) -> tuple[list[ContainerNode], list[BaseRelation]]:
+        """
+        Bir dokümanın container'larını ve node'ları ile yeni container'lar arasındaki otomatik relation'ları oluşturur.
+
+        Args:
+            nodes (Sequence[BaseNode]): Bir dokümanın çıkarılan node'ları, container edge'leri için GeneralDocumentInfo da dahil
+            reason (str, optional): Oluşturulan container ve relation'ların reason'ı. Defaults to AUTOMATIC_RELATION_REASON.
+
+        Returns:
+            tuple[list[ContainerNode], list[BaseRelation]]: Yeni container'lar ve otomatik relation'lar
+        """
+        containers = self.build_containers(nodes, reason)
+        return containers, self.resolver.resolve([*nodes, *containers], reason)
+
+    def materialize_documents(self, documents: Sequence[Sequence[BaseNode]], reason: str = AUTOMATIC_RELATION_REASON) -> list[tuple[list[ContainerNode], list[BaseRelation]]]:
+        """Birden fazla doküman için materialize'ı çalıştırır, önce bütün çocukların node_id'leri tek seferde hesaplanır."""
+        BaseNode.compute_ids([node for nodes in documents for node in nodes if node.__class__ in self.containers])
+        return [self.materialize(nodes, reason) for nodes in documents]
+
+
+@cache
+def get_container_materializer(lib_name: str, ontology_name: str) -> ContainerMaterializer:
+    """Bir ontology'nin process başına tek materializer'ını döner, ilk kullanımda kurulur."""
+    return ContainerMaterializer(lib_name, ontology_name)
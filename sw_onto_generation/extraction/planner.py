@@ -0,0 +1,215 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from enum import StrEnum
+from functools import cache
+from graphlib import CycleError, TopologicalSorter
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import HowToExtract
+from sw_onto_generation.utils import get_ontology_registry, get_relation_endpoint_types
+
+AUTOMATIC_RELATIONS_STEP = "automatic_relations"
+
+
+class StepKind(StrEnum):
+    EXTRACT_NODE = "extract_node"  # CASE_0, LLM çağrısı
+    EXTRACT_DOCUMENT_INFO = "extract_document_info"  # CASE_3, özel fonksiyon
+    MATERIALIZE_CONTAINER = "materialize_container"  # CASE_1, child'lardan otomatik oluşturulur
+    EXTRACT_RELATION = "extract_relation"  # ask_llm=True relation, LLM çağrısı
+    RESOLVE_RELATIONS = "resolve_relations"  # ask_llm=False relation'lar, LLM'siz
+
+
+# varsayılan maliyetler LLM çağrısı cinsinden, critical_path süre verilmeden çağrıldığında kullanılır
+DEFAULT_STEP_COSTS: dict[StepKind, float] = {
+    StepKind.EXTRACT_NODE: 1.0,
+    StepKind.EXTRACT_DOCUMENT_INFO: 1.0,
+    StepKind.MATERIALIZE_CONTAINER: 0.0,
+    StepKind.EXTRACT_RELATION: 1.0,
+    StepKind.RESOLVE_RELATIONS: 0.0,
+}
+
+StepHandler = Callable[["ExtractionStep", dict[str, Any]], Awaitable[Any]]
+
+
+class ExtractionStep(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(description="Plan içinde adımın tekil adı, ör. node:Ek")
+    kind: StepKind
+    model_cls: type[BaseModel] | None = Field(default=None, description="Adımın ürettiği node veya relation sınıfı")
+    depends_on: tuple[str, ...] = Field(default=(), description="Bu adımdan önce bitmesi gereken adımlar")
+
+
+class PlanReport(BaseModel):
+    results: dict[str, Any] = Field(description="Adım adı -> handler sonucu")
+    durations: dict[str, float] = Field(description="Adım adı -> saniye cinsinden süre")
+    wall_seconds: float = Field(description="Planın baştan sona süresi")
+    sequential_seconds: float = Field(description="Adımlar sırayla çalışsaydı geçecek süre, sürelerin toplamı")
+    critical_path: list[str] = Field(description="Ölçülen sürelere göre en uzun bağımlılık zinciri")
+    critical_path_seconds: float
+
+
+class ExtractionPlan:
+    """
+    Bir ontolojinin extraction adımlarından oluşan bağımlılık DAG'ı.
+
+    HowToExtract ve nodeclass_to_be_created_automatically kuralları adımlara çevrilir: CASE_0 node sınıfı başına EXTRACT_NODE
+    (CASE_2 node'lar parent'larının içinde doldurulur), CASE_3 için EXTRACT_DOCUMENT_INFO, CASE_1 container'ları için onu
+    adlandıran bütün sınıflardan sonra MATERIALIZE_CONTAINER, ask_llm=True relation başına uç sınıflarından sonra
+    EXTRACT_RELATION ve bütün node adımlarından sonra RESOLVE_RELATIONS. run her adımı bağımlılıkları biter bitmez çalıştırır,
+    doküman başına süre DAG'ın en uzun zinciriyle (critical path) sınırlıdır.
+    """
+
+    def __init__(self, steps: list[ExtractionStep]):
+        """
+        Args:
+            steps (list[ExtractionStep]): Planın adımları, bağımlılıklar aynı plandaki adımları göstermeli
+
+        Raises:
+            ValueError: Bilinmeyen bir bağımlılık varsa veya adımlar döngü içeriyorsa hata verir
+        """
+        self.steps = {step.name: step for step in steps}
+        for step in steps:
+            for dependency in step.depends_on:
+                if dependency not in self.steps:
+                    raise ValueError(f"Step {step.name} depends on unknown step {dependency}")
+        try:
+            self.order = list(TopologicalSorter({step.name: step.depends_on for step in steps}).static_order())
+        except CycleError as e:
+            raise ValueError(f"Extraction plan contains a cycle: {e}") from e
+
+    def critical_path(self, durations: Mapping[str, float] | None = None) -> tuple[list[str], float]:
+        """
+        En uzun bağımlılık zincirini ve uzunluğunu döner.
+
+        Args:
+            durations (Mapping[str, float] | None, optional): Adım adı -> süre, None ise DEFAULT_STEP_COSTS, yani zincirdeki LLM çağrısı sayısı. Defaults to None.
+
+        Returns:
+            tuple[list[str], float]: Zincirdeki adımlar ve toplam süre
+        """
+        cost = {name: durations[name] if durations is not None else DEFAULT_STEP_COSTS[step.kind] for name, step in self.steps.items()}
+        finish: dict[str, float] = {}
+        previous: dict[str, str | None] = {}
+        for name in self.order:
+            dependencies = self.steps[name].depends_on
+            slowest = max(dependencies, key=finish.__getitem__, default=None)
+            finish[name] = (finish[slowest] if slowest is not None else 0.0) + cost[name]
+            previous[name] = slowest
+
+        if not finish:
+            return [], 0.0
+        name: str | None = max(finish, key=finish.__getitem__)
+        total = finish[name]
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        return path[::-1], total
+
+    async def run(self, handlers: Mapping[StepKind, StepHandler], max_concurrency: int | None = None) -> PlanReport:
+        """
+        Her adımı bağımlılıkları biter bitmez çalıştırır.
+
+        Args:
+            handlers (Mapping[StepKind, StepHandler]): Adım tipi başına coroutine, adımla ve bağımlılıklarının sonuçlarıyla çağrılır
+            max_concurrency (int | None, optional): Aynı anda çalışacak en fazla adım, None ise sınırsız. Defaults to None.
+
+        Raises:
+            ValueError: Planda handler'ı olmayan bir adım tipi varsa hata verir
+        """
+        missing = {step.kind for step in self.steps.values()} - set(handlers)
+        if missing:
+            raise ValueError(f"No handler for step kinds: {', '.join(sorted(missing))}")
+
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        results: dict[str, Any] = {}
+        durations: dict[str, float] = {}
+        tasks: dict[str, asyncio.Task[None]] = {}
+
+        async def run_step(step: ExtractionStep) -> None:
+            await asyncio.gather(*(tasks[dependency] for dependency in step.depends_on))
+            dependency_results = {dependency: results[dependency] for dependency in step.depends_on}
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                start = time.perf_counter()
+                results[step.name] = await handlers[step.kind](step, dependency_results)
+                durations[step.name] = time.perf_counter() - start
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+
+        start = time.perf_counter()
+        # topolojik sırada oluşturulduğu için her task bağımlılıklarının task'ları hazırken oluşur
+        for name in self.order:
+            tasks[name] = asyncio.create_task(run_step(self.steps[name]))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            # bir adım hata verirse kalan adımlar iptal edilir, hata çağırana gider
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        wall_seconds = time.perf_counter() - start
+
+        path, path_seconds = self.critical_path(durations)
+        return PlanReport(
+            results=results,
+            durations=durations,
+            wall_seconds=wall_seconds,
+            sequential_seconds=sum(durations.values()),
+            critical_path=path,
+            critical_path_seconds=path_seconds,
+        )
+
+
+def _node_step_name(node_cls: type[BaseNode]) -> str:
+    return f"node:{node_cls.__name__}"
+
+
+def build_extraction_plan(lib_name: str, ontology_name: str) -> ExtractionPlan:
+    """
+    Bir ontolojiyi extraction planına çevirir, cache'li hali için get_extraction_plan.
+
+    Raises:
+        ValueError: Lib veya ontoloji yoksa hata verir
+    """
+    registry = get_ontology_registry()
+    node_classes = registry.node_classes(lib_name, ontology_name)
+    steps: list[ExtractionStep] = []
+    node_steps: dict[type[BaseNode], str] = {}
+
+    for node_cls in node_classes:
+        case = node_cls.node_config.how_to_extract
+        if case in (HowToExtract.CASE_0, HowToExtract.CASE_3):
+            kind = StepKind.EXTRACT_NODE if case == HowToExtract.CASE_0 else StepKind.EXTRACT_DOCUMENT_INFO
+            steps.append(ExtractionStep(name=_node_step_name(node_cls), kind=kind, model_cls=node_cls))
+            node_steps[node_cls] = _node_step_name(node_cls)
+
+    for node_cls in node_classes:
+        if node_cls.node_config.how_to_extract == HowToExtract.CASE_1:
+            children = tuple(node_steps[child] for child in node_steps if child.node_config.nodeclass_to_be_created_automatically is node_cls)
+            steps.append(ExtractionStep(name=_node_step_name(node_cls), kind=StepKind.MATERIALIZE_CONTAINER, model_cls=node_cls, depends_on=children))
+            node_steps[node_cls] = _node_step_name(node_cls)
+
+    for relation_cls in registry.relation_classes(lib_name, ontology_name):
+        if not relation_cls.relation_config.ask_llm:
+            continue
+        endpoint_types = get_relation_endpoint_types(relation_cls, "source_node") + get_relation_endpoint_types(relation_cls, "target_node")
+        dependencies = tuple(name for node_cls, name in node_steps.items() if issubclass(node_cls, endpoint_types))
+        steps.append(ExtractionStep(name=f"relation:{relation_cls.__name__}", kind=StepKind.EXTRACT_RELATION, model_cls=relation_cls, depends_on=dependencies))
+
+    steps.append(ExtractionStep(name=AUTOMATIC_RELATIONS_STEP, kind=StepKind.RESOLVE_RELATIONS, depends_on=tuple(node_steps.values())))
+    return ExtractionPlan(steps)
+
+
+@cache
+def get_extraction_plan(lib_name: str, ontology_name: str) -> ExtractionPlan:
+    """Ontolojinin process genelindeki extraction planını döner, ilk kullanımda kurulur."""
+    return build_extraction_plan(lib_name, ontology_name)
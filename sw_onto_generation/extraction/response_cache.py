@@ -0,0 +1,248 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
+
+from sw_onto_generation.base.schema_cache import cached_json_schema_bytes
+from sw_onto_generation.extraction.planner import ExtractionStep, StepHandler
+
+CachedResponse = BaseModel | list[BaseModel]
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+_SCHEMA_HASH_LENGTH = 16
+_READ_CHUNK = 1024 * 1024
+
+
+def document_hash(content: bytes) -> str:
+    """Doküman içeriğinin hash'i, ör. PDF'in veya çıkarılan metnin byte'ları."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_document_hash(path: str | Path) -> str:
+    """Bir dosyanın document_hash'i, parça parça okunur."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(_READ_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def schema_hash(model_cls: type[BaseModel]) -> str:
+    """model_cls için LLM'e gönderilen JSON schema'nın hash'i, herhangi bir field veya açıklama değişince değişir."""
+    return hashlib.sha256(cached_json_schema_bytes(model_cls)).hexdigest()[:_SCHEMA_HASH_LENGTH]
+
+
+def _class_key(model_cls: type[BaseModel]) -> str:
+    # Arac hem kasko hem trafik'te var, sınıf adı tek başına yetmez
+    return f"{model_cls.__module__}.{model_cls.__qualname__}"
+
+
+@cache
+def _list_adapter(model_cls: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model_cls])  # type: ignore[valid-type]
+
+
+class ResponseCache:
+    """
+    LLM extraction cevaplarının diskte, içerik adresli cache'i.
+
+    Kayıt doküman içeriğinin hash'i, çıkarılan sınıf ve o sınıfın schema_hash'i ile tutulur:
+    <directory>/<document_hash[:2]>/<document_hash>/<modül.SınıfAdı>.<schema_hash>.json. Ontolojide bir değişiklikten sonra
+    sadece schema'sı değişen sınıflar tekrar çıkarılır. Kayıt bir JSON başlık satırı ({"many": true}) ve cevaptan oluşur.
+    Cache max_bytes ile sınırlıdır, en uzun süre kullanılmayan kayıtlar önce silinir, kullanım zamanı dosyaların mtime'ında
+    tutulduğu için yeniden başlatmada kaybolmaz.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory (str | Path): Cache'in kök dizini, yoksa oluşturulur. Var olan kayıtlar kullanılır.
+            max_bytes (int, optional): Kayıtların toplam boyutu bunu geçince en uzun süre kullanılmayanlar silinir. Defaults to 512 MB.
+
+        Raises:
+            ValueError: max_bytes pozitif değilse hata verir
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # path -> byte sayısı, en eski kullanılan başta
+        self._entries: OrderedDict[Path, int] = OrderedDict()
+
+        stats = []
+        for path in self.directory.glob("*/*/*.json"):
+            stat = path.stat()
+            stats.append((stat.st_mtime_ns, path, stat.st_size))
+        for _, path, size in sorted(stats):
+            self._entries[path] = size
+        self.size_bytes = sum(self._entries.values())
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _path(self, document_hash: str, model_cls: type[BaseModel]) -> Path:
+        return self.directory / document_hash[:2] / document_hash / f"{_class_key(model_cls)}.{schema_hash(model_cls)}.json"
+
+    def get(self, document_hash: str, model_cls: type[BaseModel]) -> CachedResponse | None:
+        """
+        model_cls'ın doküman için cache'lenmiş cevabını döner, yoksa None.
+
+        Sınıfın eski bir schema'sı için yazılmış kayıtlar miss sayılır. Okunamayan kayıtlar silinir ve miss sayılır. Index'te
+        olmayan ama diskte bulunan kayıtlar (ör. aynı dizini kullanan başka bir process'in yazdıkları) index'e eklenir.
+        """
+        path = self._path(document_hash, model_cls)
+        with self._lock:
+            indexed = path in self._entries
+            if indexed:
+                self._entries.move_to_end(path)
+        if not indexed and not self._adopt(path):
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            header, payload = path.read_bytes().split(b"\n", 1)
+            items = _list_adapter(model_cls).validate_json(payload)
+            os.utime(path)
+        except (OSError, ValueError, ValidationError):
+            self._remove(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return items if from_json(header)["many"] else items[0]
+
+    def put(self, document_hash: str, model_cls: type[BaseModel], response: CachedResponse) -> None:
+        """
+        model_cls'ın doküman için cevabını saklar, sınıfın eski schema'larına ait kayıtlar silinir.
+
+        Args:
+            document_hash (str): Bkz. document_hash
+            model_cls (type[BaseModel]): Çıkarılan node, relation veya combined model sınıfı
+            response (BaseModel | list[BaseModel]): model_cls'ın bir instance'ı veya instance listesi
+        """
+        many = isinstance(response, list)
+        items = response if many else [response]
+        data = to_json({"many": many}) + b"\n" + _list_adapter(model_cls).dump_json(items, exclude_unset=True)
+
+        path = self._path(document_hash, model_cls)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in path.parent.glob(f"{_class_key(model_cls)}.*.json"):
+            if stale != path:
+                self._remove(stale)
+
+        # yarım yazılmış dosya okunmasın diye önce geçici dosyaya yazılır
+        fd, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+
+        with self._lock:
+            self.size_bytes += len(data) - self._entries.pop(path, 0)
+            self._entries[path] = len(data)
+        self._evict()
+
+    async def get_or_extract(self, document_hash: str, model_cls: type[BaseModel], extract: Callable[[], Awaitable[CachedResponse]]) -> CachedResponse:
+        """Cache'lenmiş cevabı döner, yoksa extract'i bekler ve sonucunu cache'ler."""
+        cached = self.get(document_hash, model_cls)
+        if cached is not None:
+            return cached
+        response = await extract()
+        self.put(document_hash, model_cls, response)
+        return response
+
+    def wrap_handler(self, handler: StepHandler, document_hash: str) -> StepHandler:
+        """
+        Extraction planı handler'ını sarar, cevabı cache'te olan sınıfların adımları handler'ı çağırmaz.
+
+        Handler adımın model_cls'ının bir instance'ını veya instance listesini dönmeli. model_cls'ı olmayan adımlar her zaman çalışır.
+        """
+
+        async def cached_handler(step: ExtractionStep, dependencies: dict[str, Any]) -> Any:
+            if step.model_cls is None:
+                return await handler(step, dependencies)
+            return await self.get_or_extract(document_hash, step.model_cls, lambda: handler(step, dependencies))
+
+        return cached_handler
+
+    def invalidate(self, document_hash: str | None = None, model_classes: Iterable[type[BaseModel]] | None = None) -> int:
+        """
+        Bir dokümanın, bazı sınıfların veya ikisinin kayıtlarını siler. Argümansız çağrılırsa bütün cache temizlenir.
+
+        Returns:
+            int: Silinen kayıt sayısı
+        """
+        class_keys = None if model_classes is None else {_class_key(model_cls) for model_cls in model_classes}
+        with self._lock:
+            paths = list(self._entries)
+        removed = 0
+        for path in paths:
+            if document_hash is not None and path.parent.name != document_hash:
+                continue
+            if class_keys is not None and path.name.rsplit(".", 2)[0] not in class_keys:
+                continue
+            self._remove(path)
+            removed += 1
+        return removed
+
+    def prune_stale(self, model_classes: Iterable[type[BaseModel]]) -> int:
+        """
+        Verilen sınıfların güncel schema dışında bir schema için yazılmış kayıtlarını siler.
+
+        Bu kayıtlar bir daha hit olmaz, silmek LRU'dan önce yerlerini boşaltır.
+
+        Returns:
+            int: Silinen kayıt sayısı
+        """
+        current = {_class_key(model_cls): schema_hash(model_cls) for model_cls in model_classes}
+        with self._lock:
+            paths = list(self._entries)
+        removed = 0
+        for path in paths:
+            class_key, entry_schema_hash, _ = path.name.rsplit(".", 2)
+            if class_key in current and entry_schema_hash != current[class_key]:
+                self._remove(path)
+                removed += 1
+        return removed
+
+    def _adopt(self, path: Path) -> bool:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return False
+        with self._lock:
+            self.size_bytes += size - self._entries.pop(path, 0)
+            self._entries[path] = size
+        self._evict()
+        return True
+
+    def _remove(self, path: Path) -> None:
+        with self._lock:
+            self.size_bytes -= self._entries.pop(path, 0)
+        path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        while True:
+            with self._lock:
+                # tek bir girdi limitten büyükse bile en son yazılan tutulur
+                if self.size_bytes <= self.max_bytes or len(self._entries) <= 1:
+                    return
+                path, size = self._entries.popitem(last=False)
+                self.size_bytes -= size
+                self.evictions += 1
+            path.unlink(missing_ok=True)
@@ -0,0 +1,202 @@
+import codecs
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.extraction.combined import CombinedExtraction
+
+_STRUCTURE = re.compile(r'[{}\[\]"]')
+_STRING_END = re.compile(r'["\\]')
+
+
+class NodeStreamParser:
+    """
+    Stream edilen LLM cevabını parça parça okuyup tamamlanan node'ları doğrulanmış olarak döner.
+
+    Node sınıfı verilirse cevabın ilk array'inin node'ları ([{...}] veya {"items": [{...}]}), combined model verilirse üst seviye
+    objenin bütün node field'ları okunur, relations field'ı atlanır. Model dizinin geri kalanını üretirken ilk node ile Nebula
+    yazımı veya relation çözümü başlayabilir. Her node'dan sonra okunan kısım buffer'dan atılır, bellek en büyük tek node ile
+    sınırlıdır.
+    """
+
+    def __init__(self, node_cls: type[BaseNode] | None = None, fields: dict[str, type[BaseNode]] | None = None, skip_invalid: bool = False):
+        """
+        Args:
+            node_cls (type[BaseNode] | None, optional): Cevabın ilk array'indeki node'ların sınıfı. Defaults to None.
+            fields (dict[str, type[BaseNode]] | None, optional): Üst seviye key -> node sınıfı, birden fazla node field'ı olan tek obje
+                cevaplar için. Defaults to None.
+            skip_invalid (bool, optional): Doğrulanamayan node'lar hata vermek yerine errors'a eklenir. Defaults to False.
+
+        Raises:
+            ValueError: node_cls ve fields'tan tam olarak biri verilmezse hata verir
+        """
+        if (node_cls is None) == (fields is None):
+            raise ValueError("Exactly one of node_cls and fields must be given")
+        self.node_cls = node_cls
+        self.fields = fields
+        self.skip_invalid = skip_invalid
+        self.errors: list[ValidationError] = []
+        self.done = False
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._key_start: int | None = None
+        self._last_key: str | None = None
+        # aktif hedef: node'ların sınıfı ve açıldıkları derinlik, tek obje alanlarında single=True
+        self._target_cls: type[BaseNode] | None = None
+        self._element_depth = 0
+        self._single = False
+        self._object_start: int | None = None
+
+    @classmethod
+    def for_combined(cls, model_cls: type[CombinedExtraction], skip_invalid: bool = False) -> "NodeStreamParser":
+        """Combined extraction modelinin cevabı için, bütün node field'larının node'larını dönen parser."""
+        return cls(fields=dict(model_cls.node_fields), skip_invalid=skip_invalid)
+
+    def feed(self, chunk: str | bytes) -> list[BaseNode]:
+        """
+        Cevabın sıradaki parçasını okur.
+
+        Returns:
+            list[BaseNode]: Bu parçayla tamamlanan node'lar, cevaptaki sırayla
+
+        Raises:
+            ValidationError: Tamamlanan bir node geçersizse ve skip_invalid False ise hata verir
+        """
+        if isinstance(chunk, bytes):
+            # çok baytlı karakterler chunk sınırında bölünebilir
+            chunk = self._decoder.decode(chunk)
+        if self.done or not chunk:
+            return []
+        self._buffer += chunk
+        nodes = self._scan()
+        self._trim()
+        return nodes
+
+    def close(self) -> None:
+        """
+        Cevabın bittiğini bildirir.
+
+        Raises:
+            ValueError: Cevap bir node'un içinde bittiyse hata verir
+        """
+        self._decoder.decode(b"", final=True)
+        if self._object_start is not None:
+            raise ValueError(f"Response ended inside a {self._target_cls.__name__} object")  # type: ignore[union-attr]
+        self.done = True
+
+    def _scan(self) -> list[BaseNode]:
+        nodes: list[BaseNode] = []
+        buffer = self._buffer
+        while not self.done:
+            if self._in_string:
+                match = _STRING_END.search(buffer, self._position)
+                if match is None:
+                    self._position = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # kaçış karakteri henüz gelmedi
+                        self._position = match.start()
+                        break
+                    self._position = match.end() + 1
+                    continue
+                self._in_string = False
+                self._position = match.end()
+                if self._key_start is not None:
+                    self._last_key = from_json(buffer[self._key_start : match.end()])
+                    self._key_start = None
+                continue
+
+            match = _STRUCTURE.search(buffer, self._position)
+            if match is None:
+                self._position = len(buffer)
+                break
+            char, start = match.group(), match.start()
+            self._position = match.end()
+
+            if char == '"':
+                self._in_string = True
+                if self.fields is not None and self._depth == 1 and self._target_cls is None:
+                    self._key_start = start
+            elif char in "[{":
+                self._open(char, start)
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if char == "}" and self._object_start is not None and self._depth == self._element_depth:
+                    node = self._validate(buffer[self._object_start : match.end()])
+                    if node is not None:
+                        nodes.append(node)
+                    self._object_start = None
+                    if self._single:
+                        self._target_cls = None
+                elif char == "]" and self._target_cls is not None and not self._single and self._depth < self._element_depth:
+                    self._target_cls = None
+                    # tek sınıf modunda sadece ilk dizi okunur
+                    self.done = self.fields is None
+        return nodes
+
+    def _open(self, char: str, start: int) -> None:
+        if self._target_cls is not None:
+            if char == "{" and self._depth == self._element_depth and self._object_start is None:
+                self._object_start = start
+            return
+
+        if self.fields is None:
+            if char == "[" and self._depth <= 1:
+                self._target_cls, self._element_depth, self._single = self.node_cls, self._depth + 1, False
+            return
+
+        if self._depth == 1 and self._last_key in self.fields:
+            self._target_cls = self.fields[self._last_key]
+            if char == "[":
+                self._element_depth, self._single = self._depth + 1, False
+            else:
+                self._element_depth, self._single, self._object_start = self._depth, True, start
+
+    def _validate(self, text: str) -> BaseNode | None:
+        try:
+            return self._target_cls.model_validate_json(text)  # type: ignore[union-attr]
+        except ValidationError as error:
+            if not self.skip_invalid:
+                raise
+            self.errors.append(error)
+            return None
+
+    def _trim(self) -> None:
+        # açık bir node ya da key string'i yoksa okunmuş kısım atılır
+        keep = self._position
+        if self._object_start is not None:
+            keep = self._object_start
+        elif self._key_start is not None:
+            keep = self._key_start
+        if keep == 0:
+            return
+        self._buffer = self._buffer[keep:]
+        self._position -= keep
+        if self._object_start is not None:
+            self._object_start -= keep
+        if self._key_start is not None:
+            self._key_start -= keep
+
+
+def iter_nodes(chunks: Iterable[str | bytes], parser: NodeStreamParser) -> Iterator[BaseNode]:
+    """Parçalı bir cevabın node'larını tamamlandıkça döner."""
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+async def aiter_nodes(chunks: AsyncIterable[str | bytes], parser: NodeStreamParser) -> AsyncIterator[BaseNode]:
+    """iter_nodes'un asenkron hali, ör. stream eden bir LLM client'ının parçaları üzerinde."""
+    async for chunk in chunks:
+        for node in parser.feed(chunk):
+            yield node
+    parser.close()
@@ -0,0 +1,120 @@
+import asyncio
+import random
+import re
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from sw_onto_generation.base.schema_cache import cached_json_schema, description_version
+
+# combined modeldeki referans pattern'leri: ^(a|b)$ veya ^(c|d)\[\d+\]$
+_REF_ALTERNATIVE = re.compile(r"\^\(([^)]*)\)(\\\[\\d\+\\\])?\$")
+_DOCUMENT_PLACEHOLDER = "<<document>>"
+
+
+class StubLLMBackend:
+    """
+    LLM'in yerine geçen deterministik offline backend.
+
+    Her node, relation veya combined model için JSON schema'sını (cached_json_schema) gezerek geçerli bir cevap üretir. Schema
+    gezintisi sınıf ve schema versiyonu başına bir kez bir JSON şablonuna yapılır, çağrılar sadece doküman id'sini yerleştirir,
+    id her string'e gömüldüğü için node id'leri dokümanlar arasında farklıdır. Cevaplar sadece seed'e, sınıfa ve doküman id'sine
+    bağlıdır. Gecikme asyncio.sleep ile simüle edilir. Listeler items_per_list eleman alır ve opsiyonel field'lar hep doldurulur,
+    böylece combined modellerin relation referansları ("insan[0]") hep var olan bir node'u gösterir.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, items_per_list: int = 2, seed: int = 0):
+        """
+        Args:
+            latency (float, optional): Çağrı başına ortalama saniye. Defaults to 0.0.
+            jitter (float, optional): Gecikmenin latency'den en fazla sapması, her çağrıda uniform çekilir. Defaults to 0.0.
+            items_per_list (int, optional): Cevaptaki her array'in eleman sayısı. Defaults to 2.
+            seed (int, optional): Üretilen değerlerin seed'i. Defaults to 0.
+
+        Raises:
+            ValueError: Bir değer negatifse veya items_per_list 0 ise hata verir
+        """
+        if latency < 0 or jitter < 0 or items_per_list < 1:
+            raise ValueError(f"latency and jitter must be >= 0 and items_per_list >= 1, got {latency}, {jitter}, {items_per_list}")
+        self.latency = latency
+        self.jitter = jitter
+        self.items_per_list = items_per_list
+        self.seed = seed
+        self.calls = 0
+        self._templates: dict[type[BaseModel], tuple[int, str]] = {}
+
+    def _template(self, model_cls: type[BaseModel]) -> str:
+        entry = self._templates.get(model_cls)
+        if entry is None or entry[0] != description_version():
+            schema = cached_json_schema(model_cls)
+            rng = random.Random(f"{self.seed}:{model_cls.__module__}.{model_cls.__qualname__}")  # noqa: S311
+            data = _Fabricator(schema.get("$defs", {}), rng, self.items_per_list).value(schema, model_cls.__name__)
+            entry = (description_version(), to_json(data).decode())
+            self._templates[model_cls] = entry
+        return entry[1]
+
+    def respond(self, model_cls: type[BaseModel], document_id: str) -> str:
+        """model_cls'ın doküman için JSON cevabını gecikme olmadan döner."""
+        # document_id JSON string içine kaçışlı olarak yerleştirilir
+        return self._template(model_cls).replace(_DOCUMENT_PLACEHOLDER, to_json(document_id).decode()[1:-1])
+
+    def fabricate(self, model_cls: type[BaseModel], document_id: str) -> Any:
+        """model_cls'ın doküman için cevabını JSON uyumlu veri olarak döner."""
+        return from_json(self.respond(model_cls, document_id))
+
+    async def complete(self, model_cls: type[BaseModel], document_id: str) -> str:
+        """model_cls'ın doküman için JSON cevabını dönen bir LLM çağrısını simüle eder."""
+        self.calls += 1
+        delay = self.latency
+        if self.jitter:
+            delay += random.Random(f"{self.seed}:{document_id}:{model_cls.__qualname__}").uniform(-self.jitter, self.jitter)  # noqa: S311
+        await asyncio.sleep(max(delay, 0.0))
+        return self.respond(model_cls, document_id)
+
+
+class _Fabricator:
+    def __init__(self, defs: dict[str, Any], rng: random.Random, items_per_list: int):
+        self.defs = defs
+        self.rng = rng
+        self.items_per_list = items_per_list
+
+    def value(self, schema: dict[str, Any], name: str) -> Any:
+        if "$ref" in schema:
+            return self.value(self.defs[schema["$ref"].rsplit("/", 1)[-1]], name)
+        if "const" in schema:
+            return schema["const"]
+        if "enum" in schema:
+            return self.rng.choice(schema["enum"])
+        if "anyOf" in schema:
+            # null seçilmez, referanslar var olan node'lara işaret etsin
+            options = [option for option in schema["anyOf"] if option.get("type") != "null"] or schema["anyOf"]
+            return self.value(options[0], name)
+
+        schema_type = schema.get("type")
+        if isinstance(schema_type, list):
+            schema_type = next((item for item in schema_type if item != "null"), "null")
+        if schema_type == "object" or "properties" in schema:
+            return {field_name: self.value(field_schema, field_name) for field_name, field_schema in schema.get("properties", {}).items()}
+        if schema_type == "array":
+            return [self.value(schema.get("items", {}), name) for _ in range(self.items_per_list)]
+        if schema_type == "boolean":
+            return self.rng.random() < 0.5
+        if schema_type == "integer":
+            return self.rng.randint(schema.get("minimum", 0), schema.get("maximum", 10_000))
+        if schema_type == "number":
+            return round(self.rng.uniform(schema.get("minimum", 0.0), schema.get("maximum", 10_000.0)), 2)
+        if schema_type == "null":
+            return None
+        if "pattern" in schema:
+            return self.pattern_value(schema["pattern"])
+        return f"{name} {_DOCUMENT_PLACEHOLDER} {self.rng.randrange(1_000_000)}"
+
+    def pattern_value(self, pattern: str) -> str:
+        """Combined modellerin relation referans pattern'leri için değer üretir, diğer pattern'ler desteklenmez."""
+        alternatives = _REF_ALTERNATIVE.findall(pattern)
+        if not alternatives:
+            raise ValueError(f"Pattern {pattern} is not supported by the stub backend")
+        names, indexed = self.rng.choice(alternatives)
+        name = self.rng.choice(names.split("|"))
+        return f"{name}[{self.rng.randrange(self.items_per_list)}]" if indexed else name
@@ -0,0 +1,260 @@
+import asyncio
+import random
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Protocol, TypeVar
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.base_relation import BaseRelation
+from sw_onto_generation.base.vid import VidAllocator
+from sw_onto_generation.nebula.ddl import quote
+from sw_onto_generation.nebula.writer import NgqlWriter
+
+ResultT = TypeVar("ResultT")
+
+
+class GraphConnection(Protocol):
+    """
+    AsyncGraphSink'in graphd bağlantısı.
+
+    Gerçek bir graphd (Thrift, 9669) için nebula3-python'un Session'ını saran bir adaptör yazılır: open ConnectionPool.get_session'ı,
+    execute Session.execute'u, close Session.release'i asyncio.to_thread ile çağırır. execute IOErrorException'ı ConnectionError'a
+    çevirir, ResultSet.is_succeeded() False ise error_msg() ile RuntimeError verir. Testler için bkz. FakeGraphd.connect.
+    """
+
+    async def execute(self, statement: str) -> None:
+        """Bir statement çalıştırır, bağlantı kullanılamıyorsa ConnectionError, statement başarısızsa RuntimeError verir."""
+
+    async def close(self) -> None: ...
+
+
+class _DeferredWriter(NgqlWriter):
+    # statement'lar VID'leriyle sıraya alınır, vertex_filter'a gönderim sonucu belli olunca AsyncGraphSink bildirir
+    def _deliver(self, statement: str, vids: list[str | int]) -> None:
+        self.sink((statement, vids))  # type: ignore[arg-type]
+
+
+class AsyncGraphSink:
+    """
+    Node ve relation'ları sınırlı bir bağlantı havuzu üzerinden graphd'ye eşzamanlı yazar.
+
+    Bir NgqlWriter'ın ürettiği statement'lar en fazla pool_size bağlantı üzerinden gönderilir. Birden fazla extraction worker aynı
+    sink'i paylaşabilir. Aynı anda en fazla max_in_flight statement gönderilir veya bağlantı bekler, ötesinde write_* çağıran bekler,
+    yavaş bir graphd belleği doldurmak yerine extraction'ı yavaşlatır. Başarısız statement (ERROR cevabı, kopan veya reddedilen
+    bağlantı, timeout) üstel backoff ve jitter ile max_retries kere tekrar denenir, bozuk bağlantı atılır. Tekrarlardan sonra da başarısız
+    olan statement'ın hatası sonraki write_*/flush çağrısından verilir. Her yeni bağlantı önce USE space çalıştırır. Farklı batch'lerin
+    statement'ları sırasız tamamlanabilir, pool_size=1 ve max_in_flight=1 ile üretildikleri sırayla gönderilir. vertex_filter'ın
+    confirm ve release metodları varsa bir statement'ın VID'leri statement graphd'ye yazılınca confirm'e, tekrarlardan sonra da
+    başarısız olunca veya close ile iptal edilince release'e verilir.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[GraphConnection]],
+        space: str | None = None,
+        pool_size: int = 4,
+        max_in_flight: int = 16,
+        max_retries: int = 3,
+        backoff: float = 0.05,
+        max_backoff: float = 2.0,
+        batch_size: int = 256,
+        timeout: float | None = 30.0,
+        vid_allocator: VidAllocator | None = None,
+        vertex_filter: Callable[[str | int], bool] | None = None,
+    ):
+        """
+        Args:
+            connect (Callable[[], Awaitable[GraphConnection]]): Yeni bir graphd bağlantısı açar, bkz. GraphConnection
+            space (str | None, optional): Her bağlantının ilk insert'ten önce kullandığı space. Defaults to None.
+            pool_size (int, optional): En fazla açık bağlantı sayısı. Defaults to 4.
+            max_in_flight (int, optional): Gönderilen veya bağlantı bekleyen en fazla statement, ötesinde producer'lar bekler. Defaults to 16.
+            max_retries (int, optional): Sink hata vermeden önce başarısız statement'ın tekrar sayısı. Defaults to 3.
+            backoff (float, optional): İlk tekrardan önceki saniye, her tekrarda ikiye katlanır. Defaults to 0.05.
+            max_backoff (float, optional): Tekrar gecikmesinin üst sınırı, saniye. Defaults to 2.0.
+            batch_size (int, optional): INSERT statement'ı başına satır, bkz. NgqlWriter. Defaults to 256.
+            timeout (float | None, optional): Bağlantı açma ve statement başına saniye sınırı, aşılırsa bağlantı kopmuş sayılır, atılır ve
+                statement tekrar denenir. None ise sınırsız. Defaults to 30.0.
+            vid_allocator (VidAllocator | None, optional): Node'ları VID'lere eşler, bkz. NgqlWriter. Defaults to None.
+            vertex_filter (Callable[[str | int], bool] | None, optional): True döndüğü VID'lerin node'larını atlar, bkz. NgqlWriter. Defaults to None.
+
+        Raises:
+            ValueError: pool_size, max_in_flight veya timeout pozitif değilse ya da bir tekrar ayarı negatifse hata verir
+        """
+        if pool_size <= 0 or max_in_flight <= 0:
+            raise ValueError(f"pool_size and max_in_flight must be positive, got {pool_size} and {max_in_flight}")
+        if max_retries < 0 or backoff < 0 or max_backoff < 0:
+            raise ValueError(f"max_retries, backoff and max_backoff must be >= 0, got {max_retries}, {backoff}, {max_backoff}")
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive or None, got {timeout}")
+        self.space = space
+        self.pool_size = pool_size
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.connect = connect
+        self.statements_sent = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.connections_opened = 0
+
+        # writer'ın ürettiği, henüz gönderilmeyen statement'lar
+        self._pending: deque[tuple[str, list[str | int]]] = deque()
+        self.writer: NgqlWriter = _DeferredWriter(self._pending.append, batch_size=batch_size, vid_allocator=vid_allocator, vertex_filter=vertex_filter)  # type: ignore[arg-type]
+        self._slots = asyncio.Semaphore(max_in_flight)
+        # açık bağlantı sayısını sınırlar, boştaki bağlantılar _idle'da bekler
+        self._connection_slots = asyncio.Semaphore(pool_size)
+        self._idle: list[GraphConnection] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._error: BaseException | None = None
+
+    async def __aenter__(self) -> "AsyncGraphSink":  # noqa: PYI034
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        try:
+            if exc_type is None:
+                await self.flush()
+        finally:
+            await self.close()
+
+    async def write_node(self, node: BaseNode) -> None:
+        """Node'u ve iç içe node'larını buffer'lar, tamamladığı statement'ları gönderir."""
+        await self.write_nodes((node,))
+
+    async def write_nodes(self, nodes: Iterable[BaseNode]) -> None:
+        for node in nodes:
+            self.writer.write_node(node)
+            if self._pending:
+                await self._send_pending()
+        self._raise_error()
+
+    async def write_relations(self, relations: Iterable[BaseRelation]) -> None:
+        for relation in relations:
+            self.writer.write_relation(relation)
+            if self._pending:
+                await self._send_pending()
+        self._raise_error()
+
+    async def submit(self, statement: str, vids: Iterable[str | int] = ()) -> None:
+        """
+        Statement'ı gönderilmek üzere sıraya alır, max_in_flight statement gönderilmekteyse bekler.
+
+        Args:
+            statement (str): Gönderilecek statement
+            vids (Iterable[str | int], optional): Statement'ın yazdığı, sonucu vertex_filter'a bildirilecek VID'ler. Defaults to ().
+
+        Raises:
+            RuntimeError: Önceki bir statement tekrarlardan sonra da başarısız olduysa hata verir
+        """
+        self._raise_error()
+        await self._slots.acquire()
+        task = asyncio.create_task(self._run(statement, list(vids)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """
+        Writer'ın buffer'daki satırlarını gönderir ve bütün statement'lar tamamlanana kadar bekler.
+
+        Raises:
+            RuntimeError: Bir statement tekrarlardan sonra da başarısız olduysa hata verir
+        """
+        self.writer.flush()
+        await self._send_pending()
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+        self._raise_error()
+
+    async def close(self) -> None:
+        """Gönderilmekte olan statement'ları iptal eder ve bütün bağlantıları kapatır, buffer'daki satırlar gönderilmez."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        while self._pending:
+            self.writer.release_vertices(self._pending.popleft()[1])
+        while self._idle:
+            await self._idle.pop().close()
+
+    async def _send_pending(self) -> None:
+        while self._pending:
+            await self.submit(*self._pending.popleft())
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"Writing to graphd failed after {self.max_retries} retries: {self._error}") from self._error
+
+    async def _acquire(self) -> GraphConnection:
+        await self._connection_slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            connection = await self._with_timeout(self.connect())
+        except BaseException:
+            self._connection_slots.release()
+            raise
+        self.connections_opened += 1
+        if self.space is not None:
+            try:
+                await self._with_timeout(connection.execute(f"USE {quote(self.space)}"))
+            except BaseException:
+                await self._discard(connection)
+                raise
+        return connection
+
+    async def _with_timeout(self, awaitable: Awaitable[ResultT]) -> ResultT:
+        try:
+            return await asyncio.wait_for(awaitable, self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def _release(self, connection: GraphConnection) -> None:
+        self._idle.append(connection)
+        self._connection_slots.release()
+
+    async def _discard(self, connection: GraphConnection) -> None:
+        self._connection_slots.release()
+        try:
+            await connection.close()
+        except OSError:
+            pass
+
+    async def _run(self, statement: str, vids: list[str | int]) -> None:
+        written = False
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    connection = await self._acquire()
+                except (OSError, RuntimeError, asyncio.TimeoutError) as e:
+                    error: BaseException = e
+                else:
+                    try:
+                        await self._with_timeout(connection.execute(statement))
+                    except (OSError, asyncio.TimeoutError) as e:
+                        # bozuk veya cevap vermeyen bağlantı havuza dönmez, gerekirse yenisi açılır
+                        await self._discard(connection)
+                        error = e
+                    except RuntimeError as e:
+                        self._release(connection)
+                        error = e
+                    except BaseException:
+                        await self._discard(connection)
+                        raise
+                    else:
+                        self._release(connection)
+                        self.statements_sent += 1
+                        written = True
+                        self.writer.confirm_vertices(vids)
+                        return
+                if attempt == self.max_retries:
+                    self._error = self._error or error
+                    return
+                self.retries += 1
+                delay = min(self.max_backoff, self.backoff * 2**attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))  # noqa: S311
+        finally:
+            if not written:
+                self.writer.release_vertices(vids)
+            self._slots.release()
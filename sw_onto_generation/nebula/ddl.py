@@ -0,0 +1,237 @@
+import types
+import typing
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import NebulaIndexType, VidMode
+from sw_onto_generation.base.vid import get_ontology_vid_mode, nebula_vid_type
+from sw_onto_generation.utils import get_ontology_registry
+
+_PROPERTY_TYPES: dict[type, str] = {str: "string", int: "int64", float: "double", bool: "bool"}
+_RELATION_ENDPOINT_FIELDS = frozenset({"source_node", "target_node"})
+
+
+class IndexField(BaseModel):
+    name: str
+    length: int | None = Field(default=None, description="String property'lerde index'lenen byte sayısı")
+
+
+class IndexDefinition(BaseModel):
+    schema_name: str = Field(description="Index'in tag veya edge type'ı")
+    fields: list[IndexField] = Field(default_factory=list, description="Boşsa tag veya edge type'ın tamamı index'lenir")
+
+
+class NebulaSchema(BaseModel):
+    space: str
+    vid_type: str
+    partition_num: int = 10
+    replica_factor: int = 1
+    tags: dict[str, dict[str, str]] = Field(default_factory=dict, description="Tag -> property -> Nebula tipi")
+    edges: dict[str, dict[str, str]] = Field(default_factory=dict, description="Edge type -> property -> Nebula tipi")
+    tag_indexes: dict[str, IndexDefinition] = Field(default_factory=dict, description="Index adı -> tanım")
+    edge_indexes: dict[str, IndexDefinition] = Field(default_factory=dict, description="Index adı -> tanım")
+    skipped_vector_fields: list[str] = Field(default_factory=list, description="Nebula'da karşılığı olmayan VECTOR index'li field'lar, Tag.field")
+
+
+def quote(identifier: str) -> str:
+    """Nebula identifier'ını backtick ile tırnaklar, hasarsızlık_basamak gibi field adları için gerekir."""
+    return "`" + identifier.replace("`", "``") + "`"
+
+
+def _field_index_type(field_info: Any) -> NebulaIndexType | None:
+    extra = field_info.json_schema_extra
+    config = extra.get("config") if isinstance(extra, dict) else None
+    return getattr(config, "index_type", None)
+
+
+def property_type(annotation: Any, vid_type: str) -> str:
+    """Bir field annotation'ının vid_type'lı bir space'teki Nebula property tipi."""
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return property_type(args[0], vid_type)
+        return "string"
+    if isinstance(annotation, type) and issubclass(annotation, BaseNode):
+        return "int64" if vid_type == "INT64" else "string"
+    return _PROPERTY_TYPES.get(annotation, "string")
+
+
+def _index_field(name: str, property_type: str, string_index_length: int) -> IndexField:
+    return IndexField(name=name, length=string_index_length if property_type == "string" else None)
+
+
+def build_space_schema(
+    lib_name: str,
+    ontology_name: str,
+    space: str | None = None,
+    vid_mode: VidMode | None = None,
+    string_index_length: int = 64,
+    partition_num: int = 10,
+    replica_factor: int = 1,
+) -> NebulaSchema:
+    """
+    Bir ontology'nin Nebula schema'sını modellerinden kurar.
+
+    Node sınıfları tag, relation sınıfları edge type olur, field'lar nullable property'dir. str -> string, int -> int64,
+    float -> double, bool -> bool, diğer tipler string'tir: list ve dict JSON, date ve enum gibi değerler düz metin olarak tutulur. İç içe node'lar (Insan.adres) ayrı vertex'tir,
+    property çocuğun VID'ini tutar. index_type=EXACT field'lar tag index'i, nodetag_index=True ve edge_index=True property'siz
+    index olur. VECTOR field'ların Nebula index'i yoktur, skipped_vector_fields'a yazılır.
+
+    Args:
+        lib_name (str): Ontology'nin lib'i, ör. "LegalContract"
+        ontology_name (str): Ontology, ör. "kasko_police"
+        space (str | None, optional): Space adı, None ise {lib_name}_{ontology_name}. Defaults to None.
+        vid_mode (VidMode | None, optional): Space'in VID modu, None ise ontology'nin modu (bkz. set_ontology_vid_mode). Defaults to None.
+        string_index_length (int, optional): String property'lerin index'lenen önek uzunluğu. Defaults to 64.
+        partition_num (int, optional): Space'in partition_num'u. Defaults to 10.
+        replica_factor (int, optional): Space'in replica_factor'ü. Defaults to 1.
+
+    Raises:
+        ValueError: Lib veya ontology yoksa hata verir
+    """
+    registry = get_ontology_registry()
+    vid_type = nebula_vid_type(vid_mode or get_ontology_vid_mode(lib_name, ontology_name))
+    schema = NebulaSchema(space=space or f"{lib_name}_{ontology_name}", vid_type=vid_type, partition_num=partition_num, replica_factor=replica_factor)
+
+    for node_cls in registry.node_classes(lib_name, ontology_name):
+        tag = node_cls.__name__
+        properties = schema.tags[tag] = {}
+        for field_name, field_info in node_cls.model_fields.items():
+            properties[field_name] = property_type(field_info.annotation, vid_type)
+            index_type = _field_index_type(field_info)
+            if index_type == NebulaIndexType.EXACT:
+                schema.tag_indexes[f"idx_{tag}_{field_name}"] = IndexDefinition(schema_name=tag, fields=[_index_field(field_name, properties[field_name], string_index_length)])
+            elif index_type == NebulaIndexType.VECTOR:
+                schema.skipped_vector_fields.append(f"{tag}.{field_name}")
+        if node_cls.node_config.nodetag_index:
+            schema.tag_indexes[f"idx_{tag}"] = IndexDefinition(schema_name=tag)
+
+    for relation_cls in registry.relation_classes(lib_name, ontology_name):
+        edge = relation_cls.__name__
+        properties = schema.edges[edge] = {}
+        for field_name, field_info in relation_cls.model_fields.items():
+            if field_name in _RELATION_ENDPOINT_FIELDS:
+                continue
+            properties[field_name] = property_type(field_info.annotation, vid_type)
+            index_type = _field_index_type(field_info)
+            if index_type == NebulaIndexType.EXACT:
+                schema.edge_indexes[f"idx_{edge}_{field_name}"] = IndexDefinition(schema_name=edge, fields=[_index_field(field_name, properties[field_name], string_index_length)])
+            elif index_type == NebulaIndexType.VECTOR:
+                schema.skipped_vector_fields.append(f"{edge}.{field_name}")
+        if relation_cls.relation_config.edge_index:
+            schema.edge_indexes[f"idx_{edge}"] = IndexDefinition(schema_name=edge)
+    return schema
+
+
+def _properties_clause(properties: dict[str, str]) -> str:
+    return ", ".join(f"{quote(name)} {property_type} NULL" for name, property_type in properties.items())
+
+
+def _index_fields_clause(definition: IndexDefinition) -> str:
+    return ", ".join(quote(field.name) if field.length is None else f"{quote(field.name)}({field.length})" for field in definition.fields)
+
+
+def _schema_statements(kind: str, old: dict[str, dict[str, str]], new: dict[str, dict[str, str]], rebuilt_properties: set[tuple[str, str]], allow_drop: bool) -> list[str]:
+    statements = []
+    for name, properties in new.items():
+        if name not in old:
+            statements.append(f"CREATE {kind} IF NOT EXISTS {quote(name)}({_properties_clause(properties)})")
+            continue
+        added = {prop: property_type for prop, property_type in properties.items() if prop not in old[name]}
+        changed = {prop: property_type for prop, property_type in properties.items() if prop in old[name] and old[name][prop] != property_type}
+        dropped = [prop for prop in old[name] if prop not in properties]
+        if added:
+            statements.append(f"ALTER {kind} {quote(name)} ADD ({_properties_clause(added)})")
+        if changed:
+            statements.append(f"ALTER {kind} {quote(name)} CHANGE ({_properties_clause(changed)})")
+            rebuilt_properties.update((name, prop) for prop in changed)
+        if dropped and allow_drop:
+            statements.append(f"ALTER {kind} {quote(name)} DROP ({', '.join(map(quote, dropped))})")
+            rebuilt_properties.update((name, prop) for prop in dropped)
+    if allow_drop:
+        statements.extend(f"DROP {kind} IF EXISTS {quote(name)}" for name in old if name not in new)
+    return statements
+
+
+def _index_statements(
+    kind: str,
+    old: dict[str, IndexDefinition],
+    new: dict[str, IndexDefinition],
+    existing_schemas: dict[str, dict[str, str]],
+    altered_properties: set[tuple[str, str]],
+    allow_drop: bool,
+) -> tuple[list[str], list[str], list[str]]:
+    drops, creates, rebuilds = [], [], []
+    for name, definition in old.items():
+        # değişen ya da silinen property'yi kapsayan index'ler ALTER'dan önce silinmeli, Nebula aksi halde reddeder
+        touches_altered = any((definition.schema_name, field.name) in altered_properties for field in definition.fields)
+        if (name in new and (new[name] != definition or touches_altered)) or (name not in new and (allow_drop or touches_altered)):
+            drops.append(f"DROP {kind} INDEX IF EXISTS {quote(name)}")
+    for name, definition in new.items():
+        if name not in old or old[name] != definition or any((definition.schema_name, field.name) in altered_properties for field in definition.fields):
+            creates.append(f"CREATE {kind} INDEX IF NOT EXISTS {quote(name)} ON {quote(definition.schema_name)}({_index_fields_clause(definition)})")
+            # yeni tag veya edge type'ta veri yok, index yazma sırasında dolar
+            if definition.schema_name in existing_schemas:
+                rebuilds.append(quote(name))
+    return drops, creates, [f"REBUILD {kind} INDEX {', '.join(rebuilds)}"] if rebuilds else []
+
+
+def diff_schemas(old: NebulaSchema | None, new: NebulaSchema, allow_drop: bool = False) -> list[str]:
+    """
+    old ile deploy edilmiş bir space'i new'e getiren nGQL statement'larını sonda noktalı virgül olmadan döner.
+
+    old yoksa space oluşturma dahil bütün schema döner. Sıra Nebula'nın kabul edeceği şekildedir: index drop'ları, tag ve edge
+    değişiklikleri, index oluşturma ve en sonda sadece veri tutan tag ve edge type'ların yeni veya değişen index'lerini kapsayan,
+    index türü başına bir REBUILD. Tipi değişen property'lerin index'leri ALTER'dan önce drop edilip sonra tekrar oluşturulur.
+
+    Args:
+        old (NebulaSchema | None): Deploy edilmiş schema'nın snapshot'ı, yeni space için None
+        new (NebulaSchema): Hedef schema
+        allow_drop (bool, optional): new'de olmayan tag, edge type, property ve index'leri de drop eder, yoksa tutulurlar. Defaults to False.
+
+    Raises:
+        ValueError: Space veya vid_type farklıysa hata verir, bir space başka bir space'e dönüştürülemez
+    """
+    if old is None:
+        old = NebulaSchema(space=new.space, vid_type=new.vid_type)
+        statements = [
+            f"CREATE SPACE IF NOT EXISTS {quote(new.space)}(partition_num = {new.partition_num}, replica_factor = {new.replica_factor}, vid_type = {new.vid_type})",
+        ]
+    else:
+        statements = []
+    if old.space != new.space or old.vid_type != new.vid_type:
+        raise ValueError(f"Space {old.space} with vid_type {old.vid_type} can not be altered into space {new.space} with vid_type {new.vid_type}, create a new space")
+    statements.append(f"USE {quote(new.space)}")
+
+    altered_tag_properties: set[tuple[str, str]] = set()
+    altered_edge_properties: set[tuple[str, str]] = set()
+    tag_statements = _schema_statements("TAG", old.tags, new.tags, altered_tag_properties, allow_drop)
+    edge_statements = _schema_statements("EDGE", old.edges, new.edges, altered_edge_properties, allow_drop)
+    tag_drops, tag_creates, tag_rebuilds = _index_statements("TAG", old.tag_indexes, new.tag_indexes, old.tags, altered_tag_properties, allow_drop)
+    edge_drops, edge_creates, edge_rebuilds = _index_statements("EDGE", old.edge_indexes, new.edge_indexes, old.edges, altered_edge_properties, allow_drop)
+
+    changes = [*tag_drops, *edge_drops, *tag_statements, *edge_statements, *tag_creates, *edge_creates, *tag_rebuilds, *edge_rebuilds]
+    return statements + changes if changes or len(statements) > 1 else []
+
+
+def render_script(statements: list[str], schema: NebulaSchema | None = None) -> str:
+    """Statement'ları bir nGQL script'inde birleştirir, schema'nın atlanan VECTOR field'larını yorum olarak listeler."""
+    lines = [f"# VECTOR index of {field} skipped, Nebula has no vector index" for field in (schema.skipped_vector_fields if schema else [])]
+    lines.extend(f"{statement};" for statement in statements)
+    return "\n".join(lines) + "\n"
+
+
+def save_snapshot(schema: NebulaSchema, path: str | Path) -> None:
+    Path(path).write_text(schema.model_dump_json(indent=2), encoding="utf-8")
+
+
+def load_snapshot(path: str | Path) -> NebulaSchema | None:
+    """save_snapshot ile yazılmış bir snapshot'ı okur, dosya yoksa None döner."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    return NebulaSchema.model_validate_json(path.read_bytes())
@@ -0,0 +1,190 @@
+import hashlib
+import math
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+
+_MAGIC = b"SWBLOOM1"
+# magic, bit sayısı, hash sayısı, kapasite, eklenen anahtar sayısı, hedef hata oranı
+_HEADER = struct.Struct("<8sQQQQd")
+
+
+def _key_bytes(key: str | int) -> bytes:
+    return key.encode() if isinstance(key, str) else key.to_bytes(8, "little", signed=True)
+
+
+class BloomFilter:
+    """Sabit boyutlu, diske kaydedilebilen Bloom filter, expected_error_rate olasılıkla yanlış pozitif verir."""
+
+    def __init__(self, capacity: int = 10_000_000, error_rate: float = 1e-6):
+        """
+        Args:
+            capacity (int, optional): Filter'ın boyutlandırıldığı anahtar sayısı. Defaults to 10_000_000.
+            error_rate (float, optional): capacity anahtarda yanlış pozitif oranı. Defaults to 1e-6.
+
+        Raises:
+            ValueError: capacity pozitif değilse veya error_rate 0 ile 1 arasında değilse hata verir
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError(f"capacity must be positive and error_rate between 0 and 1, got {capacity} and {error_rate}")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # m = -n ln p / (ln 2)^2 bit, k = m / n ln 2 hash
+        bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.bit_count = (bit_count + 7) // 8 * 8
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.count = 0
+        self.bits = bytearray(self.bit_count // 8)
+
+    @property
+    def expected_error_rate(self) -> float:
+        """Mevcut anahtar sayısında yanlış pozitif oranı."""
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
+
+    def _positions(self, key: str | int) -> list[int]:
+        # Kirsch-Mitzenmacher: k konum tek bir 128 bit özetten türetilir
+        digest = hashlib.blake2b(_key_bytes(key), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.bit_count for i in range(self.hash_count)]
+
+    def __contains__(self, key: str | int) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def add(self, key: str | int) -> bool:
+        """Anahtarı ekler, daha önce (muhtemelen) var olup olmadığını döner."""
+        bits = self.bits
+        present = True
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                present = False
+        if not present:
+            self.count += 1
+        return present
+
+    def save(self, path: str | Path) -> None:
+        """Filter'ı dosyaya yazar, var olan dosya atomik olarak değiştirilir."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, self.bit_count, self.hash_count, self.capacity, self.count, self.error_rate))
+            file.write(self.bits)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BloomFilter":
+        """
+        save ile yazılmış bir filter'ı okur.
+
+        Raises:
+            ValueError: Dosya Bloom filter değilse veya eksikse hata verir
+        """
+        with Path(path).open("rb") as file:
+            header = file.read(_HEADER.size)
+            if len(header) != _HEADER.size or header[:8] != _MAGIC:
+                raise ValueError(f"{path} is not a Bloom filter file")
+            _, bit_count, hash_count, capacity, count, error_rate = _HEADER.unpack(header)
+            bits = bytearray(file.read())
+        if len(bits) != bit_count // 8:
+            raise ValueError(f"{path} is truncated, expected {bit_count // 8} bytes of bits, got {len(bits)}")
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.error_rate, bloom.bit_count, bloom.hash_count, bloom.count, bloom.bits = capacity, error_rate, bit_count, hash_count, count, bits
+        return bloom
+
+
+class VertexDeduplicator:
+    """
+    Daha önce yazılmış vertex'leri atlamak için NgqlWriter'ın vertex_filter'ı.
+
+    VID'ler içerikten türediği için VID'i bilinen bir vertex graph'ta aynı içerikle zaten vardır, writer bu yüzden sadece
+    identity_fields'ı olmayan node'ları filtreler. Son lru_size VID'i tutan kesin bir LRU bir çalışmadaki tekrarları yanlış pozitif
+    olmadan yakalar, yazılan bütün VID'ler diske kaydedilen bir BloomFilter'da tutulur. Bloom filter'ın yanlış pozitifi yeni bir
+    vertex'in atlanmasına yol açar, filter'ı corpus'a göre boyutlandırın ve space yeniden kurulunca silin.
+
+    Writer'a verilen VID'ler statement'ları kabul edilene kadar bekleyen (pending) sayılır, aynı çalışmadaki tekrarları atlanır ama
+    LRU'ya ve Bloom filter'a ancak confirm ile girerler. release edilen, yani statement'ı başarısız olan VID'ler unutulur ve sonraki
+    karşılaşmada tekrar yazılır. Böylece kaydedilen filter sadece graphd'nin kabul ettiği vertex'leri içerir.
+    """
+
+    def __init__(self, path: str | Path | None = None, capacity: int = 10_000_000, error_rate: float = 1e-6, lru_size: int = 100_000):
+        """
+        Args:
+            path (str | Path | None, optional): Bloom filter dosyası, varsa okunur ve save ile yazılır, None ise bellekte tutulur. Defaults to None.
+            capacity (int, optional): Yeni Bloom filter'ın kapasitesi, okunan filter kendi kapasitesini korur. Defaults to 10_000_000.
+            error_rate (float, optional): Yeni Bloom filter'ın capacity'deki yanlış pozitif oranı. Defaults to 1e-6.
+            lru_size (int, optional): Kesin LRU'da tutulan VID sayısı. Defaults to 100_000.
+
+        Raises:
+            ValueError: lru_size negatifse veya path'teki dosya Bloom filter değilse hata verir
+        """
+        if lru_size < 0:
+            raise ValueError(f"lru_size must be >= 0, got {lru_size}")
+        self.path = Path(path) if path is not None else None
+        self.bloom = BloomFilter.load(self.path) if self.path is not None and self.path.exists() else BloomFilter(capacity, error_rate)
+        self.lru_size = lru_size
+        self.lru_hits = 0
+        self.bloom_hits = 0
+        self.pending_hits = 0
+        self.misses = 0
+        self._recent: OrderedDict[str | int, None] = OrderedDict()
+        # writer'a verilmiş, statement'ı henüz kabul edilmemiş VID'ler
+        self._pending: set[str | int] = set()
+
+    @property
+    def hits(self) -> int:
+        return self.lru_hits + self.bloom_hits + self.pending_hits
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def __call__(self, vid: str | int) -> bool:
+        """Vertex'in yazılmış veya yazılmakta olup olmadığını döner, değilse bekleyen olarak kaydeder."""
+        recent = self._recent
+        if vid in recent:
+            recent.move_to_end(vid)
+            self.lru_hits += 1
+            return True
+        if vid in self._pending:
+            self.pending_hits += 1
+            return True
+        if vid in self.bloom:
+            self.bloom_hits += 1
+            return True
+        self.misses += 1
+        self._pending.add(vid)
+        return False
+
+    def confirm(self, vids: Iterable[str | int]) -> None:
+        """Statement'ı kabul edilen VID'leri yazılmış olarak LRU'ya ve Bloom filter'a ekler."""
+        recent, pending, bloom = self._recent, self._pending, self.bloom
+        for vid in vids:
+            pending.discard(vid)
+            bloom.add(vid)
+            if self.lru_size:
+                recent[vid] = None
+                recent.move_to_end(vid)
+                if len(recent) > self.lru_size:
+                    recent.popitem(last=False)
+
+    def release(self, vids: Iterable[str | int]) -> None:
+        """Statement'ı başarısız olan VID'leri unutur, tekrar karşılaşıldıklarında yazılırlar."""
+        for vid in vids:
+            self._pending.discard(vid)
+
+    def save(self) -> None:
+        """
+        Bloom filter'ı path'e kaydeder, bekleyen VID'ler dahil edilmez.
+
+        Raises:
+            ValueError: Deduplicator'ın path'i yoksa hata verir
+        """
+        if self.path is None:
+            raise ValueError("VertexDeduplicator has no path to save to")
+        self.bloom.save(self.path)
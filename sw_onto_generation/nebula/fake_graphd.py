@@ -0,0 +1,159 @@
+import asyncio
+
+from pydantic import BaseModel, Field
+
+# asyncio'nun varsayılan 64 KB okuma sınırı çok satırlı INSERT'ler için küçük
+_MAX_STATEMENT_BYTES = 16 * 1024 * 1024
+
+
+class RecordedStatement(BaseModel):
+    connection: int = Field(description="Statement'ı gönderen bağlantının sırası, 0'dan başlar")
+    statement: str = Field(description="Sonundaki ;\\n olmadan statement")
+
+
+class FakeGraphdConnection:
+    """
+    FakeGraphd'nin satır protokolünün bağlantısı: statement;\\n gönderilir, OK veya ERROR <mesaj> satırı döner.
+
+    Gerçek graphd bu protokolü konuşmaz, sadece FakeGraphd ile test ve benchmark içindir.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: int) -> "FakeGraphdConnection":
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def execute(self, statement: str) -> None:
+        """
+        Raises:
+            ConnectionError: Sunucu bağlantıyı kapattıysa hata verir
+            RuntimeError: Sunucu hata döndüyse hata verir
+        """
+        self.writer.write(statement.encode() + b";\n")
+        await self.writer.drain()
+        answer = await self.reader.readline()
+        if not answer:
+            raise ConnectionError("graphd closed the connection")
+        if answer != b"OK\n":
+            raise RuntimeError(f"graphd rejected the statement: {answer.decode().strip()}")
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class FakeGraphd:
+    """
+    Nebula cluster'ı olmadan AsyncGraphSink'i test etmek için process içi graphd yerine geçen sunucu.
+
+    İstemci ;\\n ile biten statement'lar gönderir (NgqlWriter'ın string literal'leri ham satır sonu içermez), sunucu her
+    statement'a kendi satırında OK veya ERROR <mesaj> ile cevap verir. Kabul edilen statement'lar geliş sırasıyla, gönderen
+    bağlantıyla birlikte statements'a kaydedilir. AsyncGraphSink'e connect olarak bağlanır, ör. AsyncGraphSink(server.connect). Eşzamanlılık, tekrar ve kopan bağlantıları denemek için gecikme ve hata eklenebilir.
+    """
+
+    def __init__(self, latency: float = 0.0, fail_every: int = 0, drop_every: int = 0):
+        """
+        Args:
+            latency (float, optional): Her statement'a cevap vermeden önce beklenen saniye. Defaults to 0.0.
+            fail_every (int, optional): Her n'inci statement'a kaydetmeden ERROR ile cevap verir, 0 ise kapalı. Defaults to 0.
+            drop_every (int, optional): Her n'inci statement'ta cevap vermeden ve kaydetmeden bağlantıyı kapatır, 0 ise kapalı. Defaults to 0.
+
+        Raises:
+            ValueError: Bir değer negatifse hata verir
+        """
+        if latency < 0 or fail_every < 0 or drop_every < 0:
+            raise ValueError(f"latency, fail_every and drop_every must be >= 0, got {latency}, {fail_every}, {drop_every}")
+        self.latency = latency
+        self.fail_every = fail_every
+        self.drop_every = drop_every
+        self.statements: list[RecordedStatement] = []
+        self.received = 0
+        self.failed = 0
+        self.dropped = 0
+        self.connections = 0
+        self.max_concurrency = 0
+
+        self._running = 0
+        self._host = "127.0.0.1"
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        """
+        Sunucunun dinlediği port.
+
+        Raises:
+            ValueError: Sunucu başlatılmadıysa hata verir
+        """
+        if self._server is None:
+            raise ValueError("FakeGraphd is not started")
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Dinlemeye başlar, port 0 boş bir port seçer."""
+        self._host = host
+        self._server = await asyncio.start_server(self._handle, host, port, limit=_MAX_STATEMENT_BYTES)
+
+    async def connect(self) -> FakeGraphdConnection:
+        """
+        Sunucuya yeni bir bağlantı açar.
+
+        Raises:
+            ValueError: Sunucu başlatılmadıysa hata verir
+        """
+        return await FakeGraphdConnection.open(self._host, self.port)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeGraphd":  # noqa: PYI034
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = self.connections
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    data = await reader.readuntil(b";\n")
+                except asyncio.IncompleteReadError:
+                    return
+                self.received += 1
+                number = self.received
+                # istemcinin eşzamanlılığı sunucuda aynı anda işlenen statement sayısıyla ölçülür
+                self._running += 1
+                self.max_concurrency = max(self.max_concurrency, self._running)
+                try:
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                finally:
+                    self._running -= 1
+
+                if self.drop_every and number % self.drop_every == 0:
+                    self.dropped += 1
+                    return
+                if self.fail_every and number % self.fail_every == 0:
+                    self.failed += 1
+                    writer.write(b"ERROR simulated failure\n")
+                else:
+                    self.statements.append(RecordedStatement(connection=connection, statement=data[:-2].decode()))
+                    writer.write(b"OK\n")
+                await writer.drain()
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
@@ -0,0 +1,273 @@
+import csv
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, TextIO
+
+from pydantic import BaseModel, Field
+from pydantic_core import to_json
+
+from sw_onto_generation.base.base_node import BaseNode, _iter_child_nodes
+from sw_onto_generation.base.base_relation import BaseRelation
+from sw_onto_generation.base.configs import VidMode
+from sw_onto_generation.base.vid import VidAllocator, get_vid_allocator
+from sw_onto_generation.nebula.ddl import NebulaSchema, build_space_schema
+from sw_onto_generation.nebula.writer import _JSON, _NODE, _json_text, property_layout
+from sw_onto_generation.utils import get_ontology_registry
+
+NULL_VALUE = "__NULL__"
+
+# Nebula tipi -> nebula-importer tipi
+_IMPORTER_TYPES = {"string": "string", "int64": "int", "double": "double", "bool": "bool"}
+
+
+class ExportedClass(BaseModel):
+    name: str = Field(description="Tag veya edge type adı")
+    kind: str = Field(description="vertex veya edge")
+    shards: list[str] = Field(default_factory=list, description="Config dizinine göre shard yolları")
+    rows: int = 0
+
+
+class _Shard:
+    __slots__ = ("export", "file", "layout", "rows", "writer")
+
+    def __init__(self, export: ExportedClass, layout: list[tuple[str, int]]):
+        self.export = export
+        self.layout = layout
+        self.file: TextIO | None = None
+        self.writer: Any = None
+        self.rows = 0
+
+
+class ImporterExporter:
+    """
+    Bir ontology'nin node ve relation'larını nebula-importer için CSV'ye yazar.
+
+    Her node sınıfı (tag) ve relation sınıfı (edge type) kendi shard'lanmış CSV dosyalarına, close'da da CSV kolonlarını schema'ya
+    eşleyen importer.yaml config'ine yazılır, ör. exports/importer.yaml ve exports/Insan/Insan.00000.csv. Tag, edge ve property
+    sırası build_space_schema'dan, VID'ler varsayılan olarak ontology'nin get_vid_allocator'ından gelir, böylece NgqlWriter ve
+    AsyncGraphSink'e aynı allocator verilince VID'ler eşleşir. Değerler NgqlWriter'daki gibi yazılır. Vertex satırları vid,prop...,
+    edge satırları src,dst,prop... şeklindedir, başlık yoktur, None NULL_VALUE olarak yazılır. Sadece ontology'nin kendi sınıfları
+    yazılır, başka bir ontology'nin aynı isimli sınıfı reddedilir. Shard rows_per_shard satırdan sonra kapanır, FIXED_STRING VID'lerde
+    bellek corpus ile büyümez. INT64 modlarında allocator her node için bir kayıt tutar (INT64_CONTENT'te check_collisions kapalıysa
+    tutmaz), bkz. VidAllocator. Import'tan önce space ve schema'sı var olmalı, bkz. diff_schemas.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        lib_name: str,
+        ontology_name: str,
+        space: str | None = None,
+        vid_mode: VidMode | None = None,
+        vid_allocator: VidAllocator | None = None,
+        rows_per_shard: int = 1_000_000,
+        address: str = "127.0.0.1:9669",
+        user: str = "root",
+        password: str = "nebula",  # noqa: S107
+        concurrency: int = 10,
+        batch_size: int = 128,
+    ):
+        """
+        Args:
+            directory (str | Path): Çıktı dizini, yoksa oluşturulur
+            lib_name (str): Ontology'nin lib'i, ör. "LegalContract"
+            ontology_name (str): Ontology, ör. "kasko_police"
+            space (str | None, optional): Space adı, None ise {lib_name}_{ontology_name}. Defaults to None.
+            vid_mode (VidMode | None, optional): Space'in VID modu, None ise vid_allocator'ın modu. Defaults to None.
+            vid_allocator (VidAllocator | None, optional): Node'ları VID'lere eşler, None ise vid_mode verilmediyse ontology'nin
+                get_vid_allocator'ı, verildiyse bu modda yeni bir allocator. Defaults to None.
+            rows_per_shard (int, optional): CSV dosyası başına satır. Defaults to 1_000_000.
+            address (str, optional): Config'e yazılan graphd adresi. Defaults to "127.0.0.1:9669".
+            user (str, optional): Config'e yazılan kullanıcı. Defaults to "root".
+            password (str, optional): Config'e yazılan şifre. Defaults to "nebula".
+            concurrency (int, optional): Config'in clientSettings.concurrency'si. Defaults to 10.
+            batch_size (int, optional): nebula-importer'ın insert başına satırı. Defaults to 128.
+
+        Raises:
+            ValueError: Lib veya ontology yoksa, rows_per_shard pozitif değilse ya da vid_mode vid_allocator'ın modundan farklıysa hata verir
+        """
+        if rows_per_shard <= 0:
+            raise ValueError(f"rows_per_shard must be positive, got {rows_per_shard}")
+        if vid_allocator is None:
+            vid_allocator = get_vid_allocator(lib_name, ontology_name) if vid_mode is None else VidAllocator(vid_mode)
+        elif vid_mode is not None and VidMode(vid_mode) != vid_allocator.mode:
+            raise ValueError(f"vid_mode {vid_mode} does not match the allocator's mode {vid_allocator.mode}")
+        self.directory = Path(directory)
+        self.vid_allocator = vid_allocator
+        self.vid_mode = vid_allocator.mode
+        self.schema: NebulaSchema = build_space_schema(lib_name, ontology_name, space=space, vid_mode=self.vid_mode)
+        self.rows_per_shard = rows_per_shard
+        self.client_settings = {"address": address, "user": user, "password": password, "concurrency": concurrency}
+        self.batch_size = batch_size
+        registry = get_ontology_registry()
+        self._classes = {*registry.node_classes(lib_name, ontology_name), *registry.relation_classes(lib_name, ontology_name)}
+        self.exports: dict[str, ExportedClass] = {}
+
+        self._shards: dict[type, _Shard] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "ImporterExporter":  # noqa: PYI034
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _shard(self, model_cls: type) -> _Shard:
+        shard = self._shards.get(model_cls)
+        if shard is None:
+            name = model_cls.__name__
+            kind = "vertex" if issubclass(model_cls, BaseNode) else "edge"
+            # isim yetmez, ör. trafik_police'in Arac'ı kasko_police space'inin Arac tag'ine yazılmamalı
+            if model_cls not in self._classes or name not in (self.schema.tags if kind == "vertex" else self.schema.edges):
+                raise ValueError(f"{model_cls.__module__}.{model_cls.__qualname__} is not a {'tag' if kind == 'vertex' else 'edge type'} of space {self.schema.space}")
+            export = self.exports.setdefault(name, ExportedClass(name=name, kind=kind))
+            shard = self._shards[model_cls] = _Shard(export, property_layout(model_cls, self.schema.vid_type))
+        if shard.file is None:
+            path = Path(shard.export.name) / f"{shard.export.name}.{len(shard.export.shards):05d}.csv"
+            (self.directory / path.parent).mkdir(exist_ok=True)
+            shard.file = (self.directory / path).open("w", encoding="utf-8", newline="")
+            shard.writer = csv.writer(shard.file)
+            shard.export.shards.append(path.as_posix())
+        return shard
+
+    def _row(self, shard: _Shard, prefix: list[Any], model: BaseNode | BaseRelation) -> None:
+        values = model.__dict__
+        row = prefix
+        for field_name, kind in shard.layout:
+            value = values[field_name]
+            if value is None:
+                row.append(NULL_VALUE)
+            elif kind == _NODE:
+                row.append(self.vid_allocator.vid(value) if isinstance(value, BaseNode) else to_json([self.vid_allocator.vid(child) for child in _iter_child_nodes(value)]).decode())
+            elif value.__class__ is str:
+                row.append(value)
+            elif kind == _JSON:
+                row.append(_json_text(value))
+            elif value.__class__ is bool:
+                row.append("true" if value else "false")
+            else:
+                row.append(value)
+        shard.writer.writerow(row)
+        shard.rows += 1
+        shard.export.rows += 1
+        if shard.rows >= self.rows_per_shard:
+            self._close_shard(shard)
+
+    def _close_shard(self, shard: _Shard) -> None:
+        if shard.file is not None:
+            shard.file.close()
+            shard.file = None
+            shard.writer = None
+            shard.rows = 0
+
+    def write_node(self, node: BaseNode) -> None:
+        """
+        Node'u ve iç içe node'larını vertex satırları olarak yazar.
+
+        Raises:
+            ValueError: Bir sınıf space'in tag'i değilse hata verir
+        """
+        for field_name in node._child_node_fields:
+            for child in _iter_child_nodes(node.__dict__[field_name]):
+                self.write_node(child)
+        self._row(self._shard(node.__class__), [self.vid_allocator.vid(node)], node)
+
+    def write_nodes(self, nodes: Iterable[BaseNode]) -> None:
+        for node in nodes:
+            self.write_node(node)
+
+    def write_relation(self, relation: BaseRelation) -> None:
+        """
+        Relation'ı edge satırı olarak yazar, node'ları yazılmaz.
+
+        Raises:
+            ValueError: Sınıf space'in edge type'ı değilse hata verir
+        """
+        source, target = relation.__dict__["source_node"], relation.__dict__["target_node"]
+        self._row(self._shard(relation.__class__), [self.vid_allocator.vid(source), self.vid_allocator.vid(target)], relation)
+
+    def write_relations(self, relations: Iterable[BaseRelation]) -> None:
+        for relation in relations:
+            self.write_relation(relation)
+
+    def close(self) -> Path:
+        """Bütün shard'ları kapatır, importer config'ini yazar ve yolunu döner."""
+        for shard in self._shards.values():
+            self._close_shard(shard)
+        path = self.directory / "importer.yaml"
+        path.write_text(render_importer_config(self.schema, list(self.exports.values()), batch_size=self.batch_size, **self.client_settings), encoding="utf-8")
+        return path
+
+
+def _prop(name: str, nebula_type: str, index: int) -> dict[str, Any]:
+    return {"name": name, "type": _IMPORTER_TYPES[nebula_type], "index": index, "nullable": True, "nullValue": NULL_VALUE}
+
+
+def render_importer_config(
+    schema: NebulaSchema,
+    exports: list[ExportedClass],
+    address: str = "127.0.0.1:9669",
+    user: str = "root",
+    password: str = "nebula",  # noqa: S107
+    concurrency: int = 10,
+    batch_size: int = 128,
+) -> str:
+    """Export edilen shard'lar için nebula-importer (v3, config formatı v2) YAML'ını, yollar ona göreli olarak üretir."""
+    vid = {"type": "int" if schema.vid_type == "INT64" else "string"}
+    files = []
+    for export in exports:
+        if export.kind == "vertex":
+            props = [_prop(name, nebula_type, index) for index, (name, nebula_type) in enumerate(schema.tags[export.name].items(), start=1)]
+            file_schema: dict[str, Any] = {"type": "vertex", "vertex": {"vid": {"index": 0, **vid}, "tags": [{"name": export.name, "props": props}]}}
+        else:
+            props = [_prop(name, nebula_type, index) for index, (name, nebula_type) in enumerate(schema.edges[export.name].items(), start=2)]
+            file_schema = {
+                "type": "edge",
+                "edge": {"name": export.name, "withRanking": False, "srcVID": {"index": 0, **vid}, "dstVID": {"index": 1, **vid}, "props": props},
+            }
+        for shard in export.shards:
+            files.append(
+                {
+                    "path": shard,
+                    "failDataPath": f"failed/{shard}",
+                    "batchSize": batch_size,
+                    "type": "csv",
+                    "csv": {"withHeader": False, "withLabel": False, "delimiter": ","},
+                    "schema": file_schema,
+                }
+            )
+    config = {
+        "version": "v2",
+        "description": f"{schema.space} bulk load",
+        "removeTempFiles": False,
+        "clientSettings": {
+            "retry": 3,
+            "concurrency": concurrency,
+            "channelBufferSize": 128,
+            "space": schema.space,
+            "connection": {"user": user, "password": password, "address": address},
+        },
+        "logPath": "failed/importer.log",
+        "files": files,
+    }
+    return "\n".join(_yaml_lines(config, 0)) + "\n"
+
+
+def _yaml_lines(value: Any, indent: int) -> list[str]:
+    # PyYAML bağımlılık değil, skalerler JSON olarak yazılır (JSON skalerleri geçerli YAML'dır)
+    pad = " " * indent
+    lines = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, dict | list) and item:
+                lines.append(f"{pad}{key}:")
+                lines.extend(_yaml_lines(item, indent + 2))
+            else:
+                lines.append(f"{pad}{key}: {json.dumps(item, ensure_ascii=False)}")
+    else:
+        for item in value:
+            nested = _yaml_lines(item, indent + 2) if isinstance(item, dict | list) and item else [f"{pad}  {json.dumps(item, ensure_ascii=False)}"]
+            lines.append(f"{pad}- {nested[0].lstrip()}")
+            lines.extend(nested[1:])
+    return lines
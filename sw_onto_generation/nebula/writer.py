@@ -0,0 +1,278 @@
+import re
+import socket
+from collections.abc import Callable, Iterable
+from typing import Any, TextIO
+
+from pydantic_core import from_json, to_json
+
+from sw_onto_generation.base.base_node import BaseNode, _iter_child_nodes
+from sw_onto_generation.base.base_relation import BaseRelation
+from sw_onto_generation.base.vid import VidAllocator, nebula_vid_type
+from sw_onto_generation.nebula.ddl import property_type, quote
+
+Sink = Callable[[str], Any]
+
+# nGQL string literal'inde kaçış gereken karakterler, diğer kontrol karakterleri boşluk olur
+# (kaçış yoksa regex metni kopyalamaz, str.translate Türkçe metinde çok daha yavaş)
+_ESCAPES = {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+_ESCAPE = re.compile(r'[\x00-\x1f"\\]')
+_RELATION_ENDPOINT_FIELDS = frozenset({"source_node", "target_node"})
+
+# property değerinin nasıl yazılacağı
+_LITERAL, _JSON, _NODE = 0, 1, 2
+
+
+def _escape(match: re.Match[str]) -> str:
+    return _ESCAPES.get(match.group(), " ")
+
+
+def property_layout(model_cls: type, vid_type: str) -> list[tuple[str, int]]:
+    """Bir node veya relation sınıfının property'leri schema sırasıyla, değerlerinin nasıl yazılacağıyla birlikte."""
+    layout = []
+    for field_name, field_info in model_cls.model_fields.items():
+        if field_name in _RELATION_ENDPOINT_FIELDS and issubclass(model_cls, BaseRelation):
+            continue
+        annotation = field_info.annotation
+        is_node = any(isinstance(arg, type) and issubclass(arg, BaseNode) for arg in (annotation, *getattr(annotation, "__args__", ())))
+        layout.append((field_name, _NODE if is_node else _JSON if property_type(annotation, vid_type) == "string" else _LITERAL))
+    return layout
+
+
+def _json_text(value: Any) -> str:
+    # date, datetime, enum gibi JSON'da string olan değerler tırnaksız yazılır, "2024-01-01" değil 2024-01-01
+    encoded = to_json(value).decode()
+    return from_json(encoded) if encoded.startswith('"') else encoded
+
+
+def ngql_string(value: str) -> str:
+    """Python string'ini nGQL string literal'i olarak tırnaklar, Türkçe gibi ASCII olmayan metin olduğu gibi yazılır."""
+    return '"' + _ESCAPE.sub(_escape, value) + '"'
+
+
+def _literal(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, str):
+        return ngql_string(value)
+    if isinstance(value, int | float):
+        return repr(value)
+    return ngql_string(_json_text(value))
+
+
+def file_sink(file: TextIO) -> Sink:
+    """Her statement'ı bir text dosyasına noktalı virgülle biten bir satır olarak yazan sink."""
+
+    def write(statement: str) -> None:
+        file.write(statement)
+        file.write(";\n")
+
+    return write
+
+
+def socket_sink(connection: socket.socket, encoding: str = "utf-8") -> Sink:
+    """Her statement'ı bağlı bir socket üzerinden noktalı virgülle biten bir satır olarak gönderen sink."""
+
+    def send(statement: str) -> None:
+        connection.sendall(statement.encode(encoding) + b";\n")
+
+    return send
+
+
+class _Buffer:
+    __slots__ = ("header", "rows", "size", "vids")
+
+    def __init__(self, header: str):
+        self.header = header
+        self.rows: list[str] = []
+        self.size = 0
+        # vertex_filter'dan geçen satırların VID'leri, statement başarılı olunca filter'a bildirilir
+        self.vids: list[str | int] = []
+
+
+class NgqlWriter:
+    """
+    Node ve relation'ları batch'li nGQL INSERT statement'larına çeviren writer.
+
+    Vertex'ler tag başına, edge'ler edge type başına buffer'lanır ve dolan her buffer tek bir çok satırlı statement olur, ör.
+    INSERT VERTEX `Insan`(`reason`, `ad`, ...) VALUES "3f2a...":("...", "Ayşe", ...), "9b1c...":(...). Statement'lar tamamlanır
+    tamamlanmaz sink'e verilir, bellek yazılan node sayısından bağımsız olarak tag ve edge type başına batch_size satırla sınırlıdır.
+    Property'ler build_space_schema'yı izler: iç içe node'lar ayrı vertex olarak yazılır ve parent'ın property'si VID'lerini tutar,
+    string olarak tutulan diğer tipler JSON yazılır.
+    """
+
+    def __init__(
+        self,
+        sink: Sink,
+        batch_size: int = 256,
+        max_statement_bytes: int = 1_000_000,
+        vid_allocator: VidAllocator | None = None,
+        space: str | None = None,
+        if_not_exists: bool = False,
+        vertex_filter: Callable[[str | int], bool] | None = None,
+    ):
+        """
+        Args:
+            sink (Sink): Her tamamlanan statement ile sonda noktalı virgül olmadan çağrılır, ör. file_sink veya socket_sink
+            batch_size (int, optional): Statement başına satır. Defaults to 256.
+            max_statement_bytes (int, optional): Satırları bu kadar karaktere ulaşan statement da gönderilir, uzun sözleşme metinleri
+                yoksa graphd'nin sorgu boyutu sınırını aşar. Defaults to 1_000_000.
+            vid_allocator (VidAllocator | None, optional): Node'ları VID'lere eşler, None ise FIXED_STRING VID (node_id). Defaults to None.
+            space (str | None, optional): Verilirse ilk insert'ten önce bu space USE edilir. Defaults to None.
+            if_not_exists (bool, optional): Var olan vertex ve edge'lerin üzerine yazmak yerine INSERT ... IF NOT EXISTS kullanır. Defaults to False.
+            vertex_filter (Callable[[str | int], bool] | None, optional): identity_fields'ı olmayan, yani VID'i bütün içeriğinden
+                türeyen node'ların VID'i ile çağrılır, True dönerse node'un kendi satırı atlanır, iç içe node'ları yine yazılır.
+                confirm ve release metodları varsa (ör. VertexDeduplicator) statement'ın VID'leri sink başarılı olunca confirm'e,
+                hata verince release'e verilir. Defaults to None.
+
+        Raises:
+            ValueError: batch_size veya max_statement_bytes pozitif değilse hata verir
+        """
+        if batch_size <= 0 or max_statement_bytes <= 0:
+            raise ValueError(f"batch_size and max_statement_bytes must be positive, got {batch_size} and {max_statement_bytes}")
+        self.sink = sink
+        self.batch_size = batch_size
+        self.max_statement_bytes = max_statement_bytes
+        self.vid_allocator = vid_allocator or VidAllocator()
+        self.space = space
+        self.if_not_exists = if_not_exists
+        self.vertex_filter = vertex_filter
+        self._confirm = getattr(vertex_filter, "confirm", None)
+        self._release = getattr(vertex_filter, "release", None)
+        self.vertices_written = 0
+        self.vertices_skipped = 0
+        self.edges_written = 0
+        self.statements_written = 0
+
+        self._vid_type = nebula_vid_type(self.vid_allocator.mode)
+        self._space_used = space is None
+        self._buffers: dict[type, _Buffer] = {}
+        # sınıf -> (field adı, yazım şekli) listesi
+        self._layouts: dict[type, list[tuple[str, int]]] = {}
+
+    def __enter__(self) -> "NgqlWriter":  # noqa: PYI034
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+    def _layout(self, model_cls: type) -> list[tuple[str, int]]:
+        layout = self._layouts.get(model_cls)
+        if layout is None:
+            layout = self._layouts[model_cls] = property_layout(model_cls, self._vid_type)
+
+            keyword = "VERTEX" if issubclass(model_cls, BaseNode) else "EDGE"
+            condition = " IF NOT EXISTS" if self.if_not_exists else ""
+            columns = ", ".join(quote(field_name) for field_name, _ in layout)
+            self._buffers[model_cls] = _Buffer(f"INSERT {keyword}{condition} {quote(model_cls.__name__)}({columns}) VALUES ")  # noqa: S608
+        return layout
+
+    def _vid(self, node: BaseNode) -> str:
+        vid = self.vid_allocator.vid(node)
+        return ngql_string(vid) if isinstance(vid, str) else str(vid)
+
+    def _values(self, model: BaseNode | BaseRelation, layout: list[tuple[str, int]]) -> str:
+        values = model.__dict__
+        rendered = []
+        for field_name, kind in layout:
+            value = values[field_name]
+            if value is None:
+                rendered.append("NULL")
+            elif kind == _NODE:
+                if isinstance(value, BaseNode):
+                    rendered.append(self._vid(value))
+                else:
+                    # list[Node] gibi alanlar VID listesinin JSON'u olarak yazılır
+                    rendered.append(ngql_string(to_json([self.vid_allocator.vid(child) for child in _iter_child_nodes(value)]).decode()))
+            elif value.__class__ is str:
+                rendered.append(ngql_string(value))
+            elif kind == _JSON:
+                rendered.append(ngql_string(_json_text(value)))
+            else:
+                rendered.append(_literal(value))
+        return ", ".join(rendered)
+
+    def _append(self, model_cls: type, row: str, vid: str | int | None = None) -> None:
+        buffer = self._buffers[model_cls]
+        buffer.rows.append(row)
+        if vid is not None:
+            buffer.vids.append(vid)
+        buffer.size += len(row) + 2
+        if len(buffer.rows) >= self.batch_size or buffer.size >= self.max_statement_bytes:
+            self._emit(buffer)
+
+    def _emit(self, buffer: _Buffer) -> None:
+        if not buffer.rows:
+            return
+        if not self._space_used:
+            self.sink(f"USE {quote(self.space)}")  # type: ignore[arg-type]
+            self._space_used = True
+        statement, vids = buffer.header + ", ".join(buffer.rows), buffer.vids
+        buffer.rows = []
+        buffer.size = 0
+        buffer.vids = []
+        self._deliver(statement, vids)
+        self.statements_written += 1
+
+    def _deliver(self, statement: str, vids: list[str | int]) -> None:
+        try:
+            self.sink(statement)
+        except BaseException:
+            self.release_vertices(vids)
+            raise
+        self.confirm_vertices(vids)
+
+    def confirm_vertices(self, vids: list[str | int]) -> None:
+        """Statement'ı kabul edilen vertex'leri vertex_filter'a yazılmış olarak bildirir."""
+        if vids and self._confirm is not None:
+            self._confirm(vids)
+
+    def release_vertices(self, vids: list[str | int]) -> None:
+        """Statement'ı başarısız olan vertex'leri vertex_filter'a bildirir, sonraki karşılaşmada tekrar yazılırlar."""
+        if vids and self._release is not None:
+            self._release(vids)
+
+    def write_node(self, node: BaseNode) -> None:
+        """Node'u vertex olarak buffer'lar, iç içe node'lar önce kendi vertex'leri olarak yazılır."""
+        for field_name in node._child_node_fields:
+            for child in _iter_child_nodes(node.__dict__[field_name]):
+                self.write_node(child)
+
+        node_cls = node.__class__
+        vid = None
+        # identity_fields'ı olan node'ların (ör. tckn'li Insan) VID'i içeriğin tamamını kapsamaz, aynı VID'li vertex'in
+        # unvan veya adres gibi alanları değişmiş olabilir, bu yüzden her zaman yazılırlar
+        if self.vertex_filter is not None and not node_cls.node_config.identity_fields:
+            vid = self.vid_allocator.vid(node)
+            if self.vertex_filter(vid):
+                self.vertices_skipped += 1
+                return
+        layout = self._layout(node_cls)
+        self._append(node_cls, f"{self._vid(node)}:({self._values(node, layout)})", vid)
+        self.vertices_written += 1
+
+    def write_nodes(self, nodes: Iterable[BaseNode]) -> None:
+        for node in nodes:
+            self.write_node(node)
+
+    def write_relation(self, relation: BaseRelation) -> None:
+        """Relation'ı source ve target node'larının VID'leri arasında edge olarak buffer'lar, node'lar yazılmaz."""
+        layout = self._layout(relation.__class__)
+        source, target = relation.__dict__["source_node"], relation.__dict__["target_node"]
+        self._append(relation.__class__, f"{self._vid(source)}->{self._vid(target)}:({self._values(relation, layout)})")
+        self.edges_written += 1
+
+    def write_relations(self, relations: Iterable[BaseRelation]) -> None:
+        for relation in relations:
+            self.write_relation(relation)
+
+    def flush(self) -> None:
+        """Her tag ve edge type'ın buffer'daki satırlarını gönderir, vertex'ler edge'lerden önce."""
+        for model_cls, buffer in self._buffers.items():
+            if issubclass(model_cls, BaseNode):
+                self._emit(buffer)
+        for buffer in self._buffers.values():
+            self._emit(buffer)
@@ -0,0 +1,112 @@
+from collections.abc import Iterable
+from functools import cache
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.base_relation import BaseRelation
+from sw_onto_generation.utils import get_ontology_registry, get_relation_endpoint_types
+
+AUTOMATIC_RELATION_REASON = "İki node da dokümanda bulunduğu için otomatik oluşturuldu"
+
+
+class RelationResolver:
+    """
+    ask_llm=False olan otomatik relation'ları çıkarılmış node'lar arasında kurar.
+
+    Bu relation'lar LLM'e sorulmaz, iki uç node da varsa oluşur. Hangi relation'ın hangi (source sınıfı, target sınıfı) çiftini
+    bağladığı ontoloji başına önceden hesaplanır. Union uçlar (Insan | Sirket) ve alt sınıflar (Acente(Sirket)) index kurulurken
+    açılır, böylece bir node kümesini çözmek sınıf çifti başına bir dict erişimidir.
+
+    Bir çifte birden fazla relation uyuyorsa uçlarını en yakın tanımlayanlar kalır: uçlarından birini Acente olarak tanımlayan
+    relation Sirket olarak tanımlayanı Acente çiftlerinde geçersiz kılar. Yine de birden fazla aday kalan çift belirsizdir, hangi
+    relation'ın doğru olduğu dokümandan anlaşılmalıdır. Belirsiz çiftler için relation oluşturulmaz, ambiguous'ta tutulur.
+    """
+
+    def __init__(self, lib_name: str, ontology_name: str):
+        """
+        Args:
+            lib_name (str): Ontolojinin lib'i, ör. "LegalContract"
+            ontology_name (str): ask_llm=False relation'ları index'lenecek ontoloji, ör. "kira"
+
+        Raises:
+            ValueError: Lib veya ontoloji yoksa hata verir
+        """
+        registry = get_ontology_registry()
+        node_classes = registry.node_classes(lib_name, ontology_name)
+        self.lib_name = lib_name
+        self.ontology_name = ontology_name
+        self.index: dict[tuple[type[BaseNode], type[BaseNode]], type[BaseRelation]] = {}
+        self.ambiguous: dict[tuple[type[BaseNode], type[BaseNode]], list[type[BaseRelation]]] = {}
+
+        # çift -> (uçların tanımlanan sınıflara uzaklığı, relation) listesi
+        matches: dict[tuple[type[BaseNode], type[BaseNode]], list[tuple[int, type[BaseRelation]]]] = {}
+        for relation_cls in registry.relation_classes(lib_name, ontology_name):
+            if relation_cls.relation_config.ask_llm:
+                continue
+            sources = _expand_subclasses(get_relation_endpoint_types(relation_cls, "source_node"), node_classes)
+            targets = _expand_subclasses(get_relation_endpoint_types(relation_cls, "target_node"), node_classes)
+            for source_cls, source_distance in sources:
+                for target_cls, target_distance in targets:
+                    matches.setdefault((source_cls, target_cls), []).append((source_distance + target_distance, relation_cls))
+
+        for pair, relations in matches.items():
+            closest = min(distance for distance, _ in relations)
+            candidates = [relation_cls for distance, relation_cls in relations if distance == closest]
+            if len(candidates) == 1:
+                self.index[pair] = candidates[0]
+            else:
+                self.ambiguous[pair] = candidates
+
+    def candidates(self, source_cls: type[BaseNode], target_cls: type[BaseNode]) -> list[type[BaseRelation]]:
+        """
+        source_cls node'unu target_cls node'una bağlayan en yakın otomatik relation sınıflarını döner.
+
+        Returns:
+            list[type[BaseRelation]]: Relation oluşturulan çiftte tek sınıf, belirsiz çiftte bütün adaylar, yoksa boş liste
+        """
+        pair = (source_cls, target_cls)
+        if pair in self.index:
+            return [self.index[pair]]
+        return self.ambiguous.get(pair, [])
+
+    def resolve(self, nodes: Iterable[BaseNode], reason: str = AUTOMATIC_RELATION_REASON) -> list[BaseRelation]:
+        """
+        Verilen node'lar arasındaki bütün otomatik relation'ları üretir.
+
+        Node'lar tek geçişte sınıflarına göre gruplanır ve sadece index'teki sınıf çiftleri gezilir, maliyet node sayısı artı üretilen
+        relation sayısıyla doğrusaldır. Uç tipleri index'le garanti olduğu için relation'lar validasyonsuz kurulur. Belirsiz çiftler
+        atlanır.
+
+        Args:
+            nodes (Iterable[BaseNode]): Bir dokümandan çıkarılan node'lar
+            reason (str): Oluşturulan relation'ların reason'ı
+
+        Returns:
+            list[BaseRelation]: Önce index sırasına, sonra source ve target'ın nodes içindeki sırasına göre relation'lar
+        """
+        nodes_by_class: dict[type[BaseNode], list[BaseNode]] = {}
+        for node in nodes:
+            nodes_by_class.setdefault(node.__class__, []).append(node)
+
+        relations: list[BaseRelation] = []
+        for (source_cls, target_cls), relation_cls in self.index.items():
+            source_nodes = nodes_by_class.get(source_cls)
+            target_nodes = nodes_by_class.get(target_cls)
+            if not source_nodes or not target_nodes:
+                continue
+            for source_node in source_nodes:
+                for target_node in target_nodes:
+                    if source_node is not target_node:
+                        # uçlar zaten doğrulanmış node'lar, validasyona gerek yok
+                        relations.append(relation_cls.model_construct(source_node=source_node, target_node=target_node, reason=reason))
+        return relations
+
+
+def _expand_subclasses(declared: tuple[type[BaseNode], ...], node_classes: list[type[BaseNode]]) -> list[tuple[type[BaseNode], int]]:
+    # her sınıf, MRO'sunda tanımlanan en yakın uç sınıfına olan uzaklığıyla, tanımlanan sınıfın kendisi 0
+    return [(node_cls, min(node_cls.__mro__.index(declared_cls) for declared_cls in declared if issubclass(node_cls, declared_cls))) for node_cls in node_classes if issubclass(node_cls, declared)]
+
+
+@cache
+def get_relation_resolver(lib_name: str, ontology_name: str) -> RelationResolver:
+    """Ontolojinin process genelindeki resolver'ını döner, ilk kullanımda kurulur."""
+    return RelationResolver(lib_name, ontology_name)
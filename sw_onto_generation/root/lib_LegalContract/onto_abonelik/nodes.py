@@ -2,7 +2,7 @@ from typing import ClassVar
 
 from pydantic import Field
 
-from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.base_node import BaseNode, ContainerNode
 from sw_onto_generation.base.configs import HowToExtract, NebulaIndexType, NodeFieldConfig, NodeModelConfig
 from sw_onto_generation.common.common_nodes import Adres
 
@@ -41,7 +41,7 @@ class Taahhutname(BaseNode):
     genel_aciklama: str | None = Field(default=None, description="Taahhütname genel açıklaması ve koşulları")
 
 
-class EkSozlesmeler(BaseNode):
+class EkSozlesmeler(ContainerNode):
     """Taahhütname ile ilişkili ek sözleşmelerin varlığını belirtir."""
 
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
@@ -74,7 +74,7 @@ class EkSozlesme(BaseNode):
     sozlesme_aciklamasi: str | None = Field(default=None, description="Ek sözleşme kapsamı ve açıklaması")
 
 
-class TaahhutKapsamiHizmetler(BaseNode):
+class TaahhutKapsamiHizmetler(ContainerNode):
     """Taahhüt kapsamında sunulan hizmetlerin varlığını belirtir."""
 
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
@@ -112,7 +112,7 @@ class TaahhutKapsamiHizmet(BaseNode):
     hizmet_aciklamasi: str | None = Field(default=None, description="Hizmet detaylı açıklaması")
 
 
-class Donanimlar(BaseNode):
+class Donanimlar(ContainerNode):
     """Taahhüt kapsamında donanım ve yatırım bilgilerinin varlığını belirtir."""
 
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
@@ -246,7 +246,7 @@ class TaksitSecenegi(BaseNode):
     toplam_tutar: str | None = Field(default=None, description="Toplam tahsil edilecek tutar (taksitli)")
 
 
-class EkUcretler(BaseNode):
+class EkUcretler(ContainerNode):
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         description="""Abonelik kapsamında ek / ilave ücret bulunup bulunmadığını gösterir.""",
         nodetag_index=False,
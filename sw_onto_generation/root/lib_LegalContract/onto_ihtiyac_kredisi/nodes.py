@@ -2,7 +2,7 @@ from typing import ClassVar
 
 from pydantic import Field
 
-from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.base_node import BaseNode, ContainerNode
 from sw_onto_generation.base.configs import (
     HowToExtract,
     NebulaIndexType,
@@ -123,7 +123,7 @@ class ErkenOdemeCezasi(BaseNode):
     aciklama: str | None = Field(default=None, description="Cezayla ilgili ek açıklama veya şartlar")
 
 
-class Sigortalar(BaseNode):
+class Sigortalar(ContainerNode):
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         nodetag_index=False,
         description="Predefined",
@@ -152,7 +152,7 @@ class Sigorta(BaseNode):
     sigorta_saglayan: str | None = Field(default=None, description="Sigorta şirketi adı")
 
 
-class Masraflar(BaseNode):
+class Masraflar(ContainerNode):
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         nodetag_index=False,
         description="Krediye ilişkin ek masraflar (ekspertiz, vergiler vb.) bulunup bulunmadığını gösterir.",
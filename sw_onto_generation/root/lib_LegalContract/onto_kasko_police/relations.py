@@ -8,9 +8,12 @@ from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import (
     Arac,
     Artirim,
     Artirimlar,
+    EkHizmet,
     EkHizmetler,
     EkKloz,
     EkKlozlar,
+    Indirim,
+    Indirimler,
     KaskoPolice,
     SigortaPrimi,
     Teminat,
@@ -37,7 +40,7 @@ class HasOncekiAcente(BaseRelation):
     relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
         edge_index=False,
         description="Sözleşme ile önceki kasko poliçesi acentesini ilişkilendirir. OncekiAcente node'u ile bağlantı sağlar.",
-        ask_llm=False,
+        ask_llm=True,
     )
 
     source_node: GeneralDocumentInfo
@@ -115,7 +118,7 @@ class HasEskiTrafikPoliceSigortaSirketi(BaseRelation):
     relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
         edge_index=False,
         description="Sözleşme ile önceki kasko poliçesi veren şirketi ilişkilendirir. EskiSigortaSirketi node'u ile bağlantı sağlar.",
-        ask_llm=False,
+        ask_llm=True,
     )
 
     source_node: GeneralDocumentInfo
@@ -246,3 +249,41 @@ class HasEkHizmetler(BaseRelation):
     )
     source_node: GeneralDocumentInfo
     target_node: EkHizmetler
+
+
+class HasIndirimler(BaseRelation):
+    """Relates contract to premium discounts."""
+
+    relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
+        edge_index=False,
+        description="Kasko priminde uygulanan indirimleri ilişkilendirir. Indirimler node'u ile bağlantı sağlar.",
+        ask_llm=False,
+    )
+    source_node: GeneralDocumentInfo
+    target_node: Indirimler
+
+
+class HasIndirim(BaseRelation):
+    """Relates discounts container to a discount."""
+
+    relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
+        edge_index=False,
+        description="Kasko priminde uygulanan indirimleri ilişkilendirir. Indirim node'u ile bağlantı sağlar.",
+        ask_llm=False,
+    )
+
+    source_node: Indirimler
+    target_node: Indirim
+
+
+class HasEkHizmet(BaseRelation):
+    """Relates additional services container to a service."""
+
+    relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
+        edge_index=False,
+        description="Kasko poliçesinde uygulanan ek hizmetleri ilişkilendirir. EkHizmet node'u ile bağlantı sağlar.",
+        ask_llm=False,
+    )
+
+    source_node: EkHizmetler
+    target_node: EkHizmet
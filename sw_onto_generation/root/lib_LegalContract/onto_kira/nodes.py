@@ -2,7 +2,7 @@ from typing import ClassVar
 
 from pydantic import Field
 
-from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.base_node import BaseNode, ContainerNode
 from sw_onto_generation.base.configs import (
     HowToExtract,
     NebulaIndexType,
@@ -57,7 +57,7 @@ class Depozito(BaseNode):
     )
 
 
-class Demirbaslar(BaseNode):
+class Demirbaslar(ContainerNode):
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         nodetag_index=False,
         description="Predefined",
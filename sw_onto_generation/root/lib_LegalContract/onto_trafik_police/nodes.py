@@ -2,7 +2,7 @@ from typing import ClassVar
 
 from pydantic import Field
 
-from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.base_node import BaseNode, ContainerNode
 from sw_onto_generation.base.configs import HowToExtract, NebulaIndexType, NodeFieldConfig, NodeModelConfig
 from sw_onto_generation.common.common_nodes import Sirket
 
@@ -90,6 +90,7 @@ class Arac(BaseNode):
         cardinality=False,
         how_to_extract=HowToExtract.CASE_0,
         nodeclass_to_be_created_automatically=None,
+        identity_fields=["sasi_no", "plaka_no"],
     )
 
     plaka_no: str | None = Field(
@@ -181,7 +182,7 @@ class Arac(BaseNode):
     )
 
 
-class Teminatlar(BaseNode):
+class Teminatlar(ContainerNode):
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
         nodetag_index=True,
         description="Predefined",
@@ -293,7 +294,7 @@ class SigortaPrimi(BaseNode):
     )
 
 
-class Indirimler(BaseNode):
+class Indirimler(ContainerNode):
     """Indirimler node."""
 
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
@@ -314,7 +315,7 @@ class Indirim(BaseNode):
         description="Sigorta priminde uygulanan indirimleri tanımlar. Hasarsızlık indirimi, meslek indirimi vb.",
         cardinality=True,
         how_to_extract=HowToExtract.CASE_0,
-        nodeclass_to_be_created_automatically=None,
+        nodeclass_to_be_created_automatically=Indirimler,
     )
 
     indirim_turu: str = Field(description="İndirim türü (HASARSIZLIK İNDİRİMİ, vb.)")
@@ -332,7 +333,7 @@ class Indirim(BaseNode):
     )
 
 
-class Artirimlar(BaseNode):
+class Artirimlar(ContainerNode):
     """Artırımlar node."""
 
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
@@ -353,7 +354,7 @@ class Artirim(BaseNode):
         description="Sigorta priminde uygulanan artırımları tanımlar. Deprem artırımı vb.",
         cardinality=True,
         how_to_extract=HowToExtract.CASE_0,
-        nodeclass_to_be_created_automatically=None,
+        nodeclass_to_be_created_automatically=Artirimlar,
     )
 
     artirim_turu: str = Field(description="Artırım türü (DEPREM ARTIRIMI, vb.)")
@@ -367,7 +368,7 @@ class Artirim(BaseNode):
     )
 
 
-class EkKlozlar(BaseNode):
+class EkKlozlar(ContainerNode):
     """Ek klozlar node. Bu klozlar poliçe için ek koşulları belirtir."""
 
     node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
@@ -388,7 +389,7 @@ class EkKloz(BaseNode):
         description="Ek klozlar node. Bu klozlar poliçe için ek koşulları belirtir. ",
         cardinality=True,
         how_to_extract=HowToExtract.CASE_0,
-        nodeclass_to_be_created_automatically=None,
+        nodeclass_to_be_created_automatically=EkKlozlar,
     )
     ek_kloz_adi: str = Field(description="Ek kloz adı")
     ek_kloz_aciklama: str | None = Field(
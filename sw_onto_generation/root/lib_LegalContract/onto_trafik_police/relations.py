@@ -10,6 +10,8 @@ from sw_onto_generation.root.lib_LegalContract.onto_trafik_police.nodes import (
     Artirimlar,
     EkKloz,
     EkKlozlar,
+    Indirim,
+    Indirimler,
     SigortaPrimi,
     Teminat,
     Teminatlar,
@@ -36,7 +38,7 @@ class HasOncekiAcente(BaseRelation):
     relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
         edge_index=False,
         description="Sözleşme ile önceki trafik poliçesi acentesini ilişkilendirir. OncekiAcente node'u ile bağlantı sağlar.",
-        ask_llm=False,
+        ask_llm=True,
     )
 
     source_node: GeneralDocumentInfo
@@ -114,7 +116,7 @@ class HasEskiTrafikPoliceSigortaSirketi(BaseRelation):
     relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
         edge_index=False,
         description="Sözleşme ile önceki trafik poliçesi veren şirketi ilişkilendirir. EskiSigortaSirketi node'u ile bağlantı sağlar.",
-        ask_llm=False,
+        ask_llm=True,
     )
 
     source_node: GeneralDocumentInfo
@@ -233,3 +235,28 @@ class HasEkKloz(BaseRelation):
     )
     source_node: EkKlozlar
     target_node: EkKloz
+
+
+class HasIndirimler(BaseRelation):
+    """Relates contract to premium discounts."""
+
+    relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
+        edge_index=False,
+        description="Trafik sigortası priminde uygulanan indirimleri ilişkilendirir. Indirimler node'u ile bağlantı sağlar.",
+        ask_llm=False,
+    )
+    source_node: GeneralDocumentInfo
+    target_node: Indirimler
+
+
+class HasIndirim(BaseRelation):
+    """Relates discounts container to a discount."""
+
+    relation_config: ClassVar[RelationModelConfig] = RelationModelConfig(
+        edge_index=False,
+        description="Trafik sigortası priminde uygulanan indirimleri ilişkilendirir. Indirim node'u ile bağlantı sağlar.",
+        ask_llm=False,
+    )
+
+    source_node: Indirimler
+    target_node: Indirim
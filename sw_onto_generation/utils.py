@@ -1,10 +1,15 @@
 import importlib
-import inspect
-from typing import Literal
+import threading
+import types
+import typing
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, Literal
 
 from sw_onto_generation import DIR_STRUCTURE
 from sw_onto_generation.base.base_node import BaseNode
 from sw_onto_generation.base.base_relation import BaseRelation
+from sw_onto_generation.base.configs import HowToExtract
 
 COMMON_NODE_MODULE_NAME = "sw_onto_generation.common.common_nodes"
 COMMON_RELATION_MODULE_NAME = "sw_onto_generation.common.common_relations"
@@ -21,55 +26,198 @@ def get_specific_module_name(lib_name: str, ontology_name: str, module_type: Lit
     return f"sw_onto_generation.root.lib_{lib_name}.onto_{ontology_name}.{module_type}"
 
 
-def find_classes_in_modules(module_names: list[str]) -> tuple[list[type[BaseNode]], list[type[BaseRelation]]]:
-    node_classes = set()
-    relation_classes = set()
-    for module_name in module_names:
-        try:
-            module = importlib.import_module(module_name)
-            for name in dir(module):
-                obj = getattr(module, name)
-                if inspect.isclass(obj):
-                    if issubclass(obj, BaseNode) and obj != BaseNode:
-                        node_classes.add(obj)
-                    elif issubclass(obj, BaseRelation) and obj != BaseRelation:
-                        relation_classes.add(obj)
-                    else:
-                        continue
-        except (ImportError, AttributeError) as e:
-            raise e
-
-    return list(node_classes), list(relation_classes)
-
-
 def get_all_common_and_specific_root_classes(lib_name: str, ontology_name: str) -> tuple[list[type[BaseNode]], list[type[BaseRelation]]]:
     check_valid_lib_and_ontology(lib_name, ontology_name)
-
-    module_names = [
-        COMMON_NODE_MODULE_NAME,
-        COMMON_RELATION_MODULE_NAME,
-        get_specific_module_name(lib_name, ontology_name, "nodes"),
-        get_specific_module_name(lib_name, ontology_name, "relations"),
-    ]
-
-    return find_classes_in_modules(module_names)
+    registry = get_ontology_registry()
+    # common ve ontology modüllerindeki bütün sınıflar, aynı isimli olanlar dahil
+    return registry.node_classes(lib_name, ontology_name, include_shadowed=True), registry.relation_classes(lib_name, ontology_name, include_shadowed=True)
 
 
 def get_all_common_and_root_classes() -> tuple[list[type[BaseNode]], list[type[BaseRelation]]]:
-    node_module_names = []
-
-    for lib_name in DIR_STRUCTURE:
-        for ontology_name in DIR_STRUCTURE[lib_name]:
-            node_module_names.append(get_specific_module_name(lib_name, ontology_name, "nodes"))
-
-    relation_module_names = []
-    for lib_name in DIR_STRUCTURE:
-        for ontology_name in DIR_STRUCTURE[lib_name]:
-            relation_module_names.append(get_specific_module_name(lib_name, ontology_name, "relations"))
-
-    module_names = [COMMON_NODE_MODULE_NAME, COMMON_RELATION_MODULE_NAME] + node_module_names + relation_module_names
-
-    return find_classes_in_modules(module_names)
-
-
-# %%
+    registry = get_ontology_registry()
+    return registry.node_classes(include_shadowed=True), registry.relation_classes(include_shadowed=True)
+
+
+def get_relation_endpoint_types(relation_cls: type[BaseRelation], field_name: Literal["source_node", "target_node"]) -> tuple[type[BaseNode], ...]:
+    """
+    Relation'ın source_node veya target_node field'ında izin verilen node tiplerini döner, Insan | Sirket gibi union'lar açılır.
+    """
+    annotation = relation_cls.model_fields[field_name].annotation
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        return tuple(arg for arg in typing.get_args(annotation) if isinstance(arg, type) and issubclass(arg, BaseNode))
+    return (annotation,)  # type: ignore[return-value]
+
+
+def _classes_defined_in(module_name: str, base_cls: type[Any]) -> list[Any]:
+    module = importlib.import_module(module_name)
+    return [obj for obj in vars(module).values() if isinstance(obj, type) and issubclass(obj, base_cls) and obj is not base_cls and obj.__module__ == module_name]
+
+
+class OntologyRegistry:
+    """
+    Lib ve ontology'lerdeki node ve relation sınıflarının indexi. get_ontology_registry ile process başına bir kere kurulur.
+
+    Ontology modülleri ilk istendiklerinde import edilir, tek bir ontology ile çalışan bir process diğer onto_* modüllerini
+    import etmez. Parametresiz çağrılar (ör. node_classes()) tüm ontology'leri yükler.
+
+    Her ontology, common sınıfları da içeren kendi görünümüne sahiptir. Aynı isimde hem common hem ontology'ye özel bir sınıf varsa
+    (ör. ihtiyac_kredisi.HasKefil) ontology'ye özel olan kullanılır, gölgede kalan common sınıf sadece include_shadowed=True ile
+    listelenir. Listeler modül ve tanım sırasını korur.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._common: tuple[list[type[BaseNode]], list[type[BaseRelation]]] | None = None
+        self._classes: dict[tuple[str, str, str], type[BaseNode | BaseRelation]] = {}
+        self._nodes: dict[tuple[str, str], list[type[BaseNode]]] = {}
+        self._relations: dict[tuple[str, str], list[type[BaseRelation]]] = {}
+        # aynı isimli ontology sınıfının gölgesinde kalan common sınıflar dahil
+        self._all_nodes: dict[tuple[str, str], list[type[BaseNode]]] = {}
+        self._all_relations: dict[tuple[str, str], list[type[BaseRelation]]] = {}
+        self._nodes_by_case: dict[tuple[str, str], dict[HowToExtract, list[type[BaseNode]]]] = {}
+        self._relations_by_endpoints: dict[tuple[str, str], dict[tuple[type[BaseNode], type[BaseNode]], list[type[BaseRelation]]]] = {}
+
+    def is_loaded(self, lib_name: str, ontology_name: str) -> bool:
+        return (lib_name, ontology_name) in self._nodes
+
+    def load(self, lib_name: str, ontology_name: str) -> None:
+        """
+        Ontology'nin nodes ve relations modüllerini import edip indexe ekler, zaten yüklüyse bir şey yapmaz.
+
+        Raises:
+            ValueError: Lib veya ontology yoksa hata verir
+        """
+        key = (lib_name, ontology_name)
+        if key in self._nodes:
+            return
+        check_valid_lib_and_ontology(lib_name, ontology_name)
+        with self._lock:
+            if key in self._nodes:
+                return
+            if self._common is None:
+                self._common = (_classes_defined_in(COMMON_NODE_MODULE_NAME, BaseNode), _classes_defined_in(COMMON_RELATION_MODULE_NAME, BaseRelation))
+            common_nodes, common_relations = self._common
+
+            all_nodes = [*common_nodes, *_classes_defined_in(get_specific_module_name(*key, "nodes"), BaseNode)]
+            all_relations = [*common_relations, *_classes_defined_in(get_specific_module_name(*key, "relations"), BaseRelation)]
+            self._all_nodes[key], self._all_relations[key] = all_nodes, all_relations
+            nodes = {cls.__name__: cls for cls in all_nodes}
+            relations = {cls.__name__: cls for cls in all_relations}
+            self._add_ontology(key, list(nodes.values()), list(relations.values()))
+
+    def _add_ontology(self, key: tuple[str, str], nodes: list[type[BaseNode]], relations: list[type[BaseRelation]]) -> None:
+        for cls in [*nodes, *relations]:
+            self._classes[(*key, cls.__name__)] = cls
+
+        by_case: dict[HowToExtract, list[type[BaseNode]]] = {case: [] for case in HowToExtract}
+        for node_cls in nodes:
+            by_case[node_cls.node_config.how_to_extract].append(node_cls)
+        self._nodes_by_case[key] = by_case
+
+        by_endpoints: dict[tuple[type[BaseNode], type[BaseNode]], list[type[BaseRelation]]] = {}
+        for relation_cls in relations:
+            for source_cls in get_relation_endpoint_types(relation_cls, "source_node"):
+                for target_cls in get_relation_endpoint_types(relation_cls, "target_node"):
+                    by_endpoints.setdefault((source_cls, target_cls), []).append(relation_cls)
+        self._relations_by_endpoints[key] = by_endpoints
+        self._relations[key] = relations
+        # _nodes en son yazılır, load() kilitsiz kontrolde bunu kullanıyor
+        self._nodes[key] = nodes
+
+    def _keys(self, lib_name: str | None, ontology_name: str | None) -> list[tuple[str, str]]:
+        if lib_name is None and ontology_name is None:
+            keys = [(str(lib), str(ontology)) for lib, ontology_names in DIR_STRUCTURE.items() for ontology in ontology_names]
+        elif lib_name is None or ontology_name is None:
+            raise ValueError("lib_name and ontology_name must be given together")
+        else:
+            keys = [(lib_name, ontology_name)]
+        for key in keys:
+            self.load(*key)
+        return keys
+
+    def get_class(self, lib_name: str, ontology_name: str, class_name: str) -> type[BaseNode | BaseRelation]:
+        """
+        Raises:
+            ValueError: Sınıf ontology'de yoksa hata verir
+        """
+        self.load(lib_name, ontology_name)
+        key = (lib_name, ontology_name, class_name)
+        if key not in self._classes:
+            raise ValueError(f"Class {class_name} not found in ontology {lib_name}.{ontology_name}")
+        return self._classes[key]
+
+    def node_classes(self, lib_name: str | None = None, ontology_name: str | None = None, include_shadowed: bool = False) -> list[type[BaseNode]]:
+        """
+        Bir ontology'nin, ya da ikisi de None ise tüm ontology'lerin node sınıflarını tekrarsız döner.
+
+        Args:
+            include_shadowed (bool, optional): Aynı isimli ontology sınıfının gölgesinde kalan common sınıfları da döner. Defaults to False.
+        """
+        index = self._all_nodes if include_shadowed else self._nodes
+        return list(dict.fromkeys(cls for key in self._keys(lib_name, ontology_name) for cls in index[key]))
+
+    def relation_classes(self, lib_name: str | None = None, ontology_name: str | None = None, include_shadowed: bool = False) -> list[type[BaseRelation]]:
+        """
+        Bir ontology'nin, ya da ikisi de None ise tüm ontology'lerin relation sınıflarını tekrarsız döner.
+
+        Args:
+            include_shadowed (bool, optional): Aynı isimli ontology sınıfının gölgesinde kalan common sınıfları da döner. Defaults to False.
+        """
+        index = self._all_relations if include_shadowed else self._relations
+        return list(dict.fromkeys(cls for key in self._keys(lib_name, ontology_name) for cls in index[key]))
+
+    def node_classes_by_case(self, case: HowToExtract, lib_name: str | None = None, ontology_name: str | None = None) -> list[type[BaseNode]]:
+        """HowToExtract case'i verilen node sınıflarını döner."""
+        return list(dict.fromkeys(cls for key in self._keys(lib_name, ontology_name) for cls in self._nodes_by_case[key][case]))
+
+    def relations_between(self, source_cls: type[BaseNode], target_cls: type[BaseNode], lib_name: str | None = None, ontology_name: str | None = None) -> list[type[BaseRelation]]:
+        """
+        source_node ve target_node tipinde tam olarak bu sınıfları (union'lar açılmış halde) tanımlayan relation sınıflarını döner.
+        Alt sınıflar (ör. Acente(Sirket)) burada genişletilmez.
+        """
+        pair = (source_cls, target_cls)
+        return list(dict.fromkeys(cls for key in self._keys(lib_name, ontology_name) for cls in self._relations_by_endpoints[key].get(pair, ())))
+
+
+@cache
+def get_ontology_registry() -> OntologyRegistry:
+    """Process genelinde tek bir OntologyRegistry döner, ilk çağrıda kurulur."""
+    return OntologyRegistry()
+
+
+def warm_up_models(
+    model_classes: Iterable[type[BaseNode | BaseRelation]] | None = None,
+    lib_name: str | None = None,
+    ontology_name: str | None = None,
+    background: bool = True,
+) -> threading.Thread | None:
+    """
+    Deferred build modunda (SW_ONTO_DEFER_BUILD=1) henüz kurulmamış modellerin validator ve serializer'larını önceden kurar.
+    Kurulmuş modeller atlanır, deferred build kapalıyken bir şey yapmaz.
+
+    Args:
+        model_classes: Kurulacak sınıflar, None ise lib_name ve ontology_name ile seçilen ontology'nin (ikisi de None ise tüm ontology'lerin) sınıfları
+        lib_name: model_classes None ise kullanılacak lib
+        ontology_name: model_classes None ise kullanılacak ontology
+        background: True ise kurulum daemon bir thread'de yapılır ve thread döner, False ise kurulum bitince None döner
+
+    Returns:
+        background True ise kurulumu yapan thread, değilse None
+    """
+    if model_classes is None:
+        registry = get_ontology_registry()
+        model_classes = [*registry.node_classes(lib_name, ontology_name), *registry.relation_classes(lib_name, ontology_name)]
+    pending = [model_cls for model_cls in model_classes if not model_cls.__pydantic_complete__]
+
+    def build() -> None:
+        for model_cls in pending:
+            # bu arada ilk kullanımda kurulmuş olabilir
+            if not model_cls.__pydantic_complete__:
+                model_cls.model_rebuild()
+
+    if not background:
+        build()
+        return None
+    thread = threading.Thread(target=build, name="sw-onto-warm-up", daemon=True)
+    thread.start()
+    return thread
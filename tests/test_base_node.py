@@ -0,0 +1,189 @@
+from hashlib import sha256
+from typing import ClassVar
+
+import pytest
+
+from sw_onto_generation.base.base_node import NODE_TYPE_KEY, BaseNode
+from sw_onto_generation.base.configs import HowToExtract, NodeModelConfig
+from sw_onto_generation.common.common_nodes import Adres, GeneralDocumentInfo, Insan
+
+
+def test_node_id_is_computed_lazily_and_cached() -> None:
+    """node_id is not computed at construction and is computed once on first access."""
+    node = Insan(reason="test", ad="Ayşe", tckn="12345678901")
+    assert node.__pydantic_private__["_node_id"] is None
+
+    first = node.node_id
+    assert len(first) == 64
+    assert node.__pydantic_private__["_node_id"] == first
+    assert node.node_id is first
+
+
+def test_node_id_is_deterministic() -> None:
+    """Equal nodes get equal ids, computed from the sorted-key UTF-8 JSON of the fields and the class path."""
+    assert Insan(reason="a", ad="Ali").node_id == Insan(reason="a", ad="Ali").node_id
+    expected = sha256('{"__node_type__":"sw_onto_generation.common.common_nodes.GeneralDocumentInfo","doküman_ismi":"Sözleşme","doküman_tipi":"Sözleşme","sozlesme_no":null}'.encode()).hexdigest()
+    assert GeneralDocumentInfo(reason="x").node_id == expected
+
+
+def test_node_id_is_invalidated_on_assignment() -> None:
+    """Assigning a field drops the cached id."""
+    node = Insan(reason="test", ad="Ali")
+    before = node.node_id
+    node.ad = "Veli"
+    assert node.node_id != before
+    assert node.node_id == Insan(reason="test", ad="Veli").node_id
+
+
+def test_equality_ignores_id_cache_and_freeze_flag() -> None:
+    """Reading node_id or interning one side does not make equal nodes unequal."""
+    first, second = Insan(reason="x", ad="Ali"), Insan(reason="x", ad="Ali")
+    _ = first.node_id
+    assert first == second
+    first.__pydantic_private__["_frozen"] = True
+    assert first == second
+    assert first != Insan(reason="x", ad="Veli")
+    assert Adres(reason="x") != Insan(reason="x")
+
+
+def test_model_copy_with_update_recomputes_node_id() -> None:
+    """model_copy(update=...) must not carry over the cached id of the original."""
+    node = Adres(reason="test", il="İstanbul")
+    original_id = node.node_id
+    assert node.model_copy().node_id == original_id
+    assert node.model_copy(update={"il": "Ankara"}).node_id == Adres(reason="test", il="Ankara").node_id
+
+
+def test_node_id_is_serialized_and_ignored_on_input() -> None:
+    """node_id is part of model_dump and a stale node_id in the input is ignored."""
+    node = Insan(reason="test", ad="Ali", adres=Adres(reason="adres", il="İzmir"))
+    dumped = node.model_dump()
+    assert dumped["node_id"] == node.node_id
+    assert dumped["adres"]["node_id"] == node.adres.node_id
+
+    dumped["node_id"] = "stale"
+    assert Insan.model_validate(dumped).node_id == node.node_id
+
+
+def test_parent_id_is_built_from_child_node_id() -> None:
+    """A parent hashes its nested node's cached id instead of re-serializing the nested node."""
+    adres = Adres(reason="adres", il="İzmir")
+    node = Insan(reason="test", ad="Ali", adres=adres)
+    assert Insan._child_node_fields == ("adres",)
+
+    original_id = node.node_id
+    assert Insan(reason="test", ad="Ali", adres=Adres(reason="adres", il="İzmir")).node_id == original_id
+
+    adres.__pydantic_private__["_node_id"] = "0" * 64
+    assert node.generate_node_id() != original_id
+
+
+def test_parent_id_follows_changes_in_nested_nodes() -> None:
+    """Assigning a field of a nested node invalidates the cached id of the parent."""
+    node = Insan(reason="test", ad="Ali", adres=Adres(reason="adres", il="İzmir"))
+    BaseNode.compute_ids([node])
+    cached = node.node_id
+    assert node.node_id is cached
+
+    node.adres.il = "Ankara"
+    assert node.node_id != cached
+    assert node.node_id == Insan(reason="test", ad="Ali", adres=Adres(reason="adres", il="Ankara")).node_id
+
+
+def test_parent_id_changes_with_child_content() -> None:
+    """Different nested nodes give different parent ids."""
+    first = Insan(reason="test", ad="Ali", adres=Adres(reason="adres", il="İzmir"))
+    second = Insan(reason="test", ad="Ali", adres=Adres(reason="adres", il="Ankara"))
+    without = Insan(reason="test", ad="Ali")
+    assert len({first.node_id, second.node_id, without.node_id}) == 3
+
+
+def test_compute_ids_matches_per_instance_path() -> None:
+    """Bulk ids equal lazily computed ids, keep input order and fill the caches."""
+    nodes = [
+        Insan(reason="a", ad="Ali", adres=Adres(reason="adres", il="İzmir")),
+        Adres(reason="b", il="Ankara"),
+        GeneralDocumentInfo(reason="c"),
+        Insan(reason="d", ad="Ayşe"),
+    ]
+    expected = [node.model_copy(deep=True).node_id for node in nodes]
+
+    assert BaseNode.compute_ids(nodes, chunk_size=1) == expected
+    assert [node.__pydantic_private__["_node_id"] for node in nodes] == expected
+    assert nodes[0].adres.__pydantic_private__["_node_id"] == nodes[0].adres.model_copy(deep=True).node_id
+
+
+def test_compute_ids_with_process_pool() -> None:
+    """The process pool path gives the same ids."""
+    nodes = [Insan(reason="test", ad=f"İsim {i}") for i in range(20)]
+    expected = [node.model_copy(deep=True).node_id for node in nodes]
+    assert BaseNode.compute_ids(nodes, chunk_size=4, max_workers=2, pool_threshold=10) == expected
+
+
+def test_reason_is_not_part_of_identity() -> None:
+    """The LLM's free-text reason does not change the id."""
+    assert Adres(reason="birinci", il="İzmir").node_id == Adres(reason="ikinci", il="İzmir").node_id
+    assert Insan(reason="birinci", ad="Ali").node_id == Insan(reason="ikinci", ad="Ali").node_id
+
+
+def test_identity_fields_decide_node_id() -> None:
+    """The first filled identity field alone identifies the node, in declared priority order."""
+    by_tckn = Insan(reason="a", ad="Ali", tckn="12345678901", role="Kiracı")
+    assert by_tckn.node_id == Insan(reason="b", ad="ALİ", tckn="12345678901", role="Kefil").node_id
+    assert by_tckn.identity_dict() == {NODE_TYPE_KEY: "sw_onto_generation.common.common_nodes.Insan", "tckn": "12345678901"}
+
+    with_passport = Insan(reason="a", tckn="12345678901", pasaport_no="U1234567")
+    assert with_passport.node_id == by_tckn.node_id
+    assert Insan(reason="a", tckn="", pasaport_no="U1234567").identity_dict()["pasaport_no"] == "U1234567"
+
+
+def test_identity_fields_fall_back_to_all_fields() -> None:
+    """Without any identity value every non-reason field is used."""
+    node = Insan(reason="a", ad="Ali", adres=Adres(reason="adres", il="İzmir"))
+    identity = node.identity_dict()
+    assert "reason" not in identity
+    assert identity["ad"] == "Ali"
+    assert identity["adres"] == node.adres.node_id
+    assert node.node_id != Insan(reason="a", ad="Veli", adres=Adres(reason="adres", il="İzmir")).node_id
+
+
+def test_same_content_in_different_classes_gets_different_ids() -> None:
+    """Same-named classes of two ontologies and same-content classes do not share a node_id."""
+    from sw_onto_generation.root.lib_LegalContract.onto_kasko_police import nodes as kasko
+    from sw_onto_generation.root.lib_LegalContract.onto_trafik_police import nodes as trafik
+
+    kasko_node, trafik_node = kasko.Teminatlar(reason="x"), trafik.Teminatlar(reason="x")
+    assert kasko_node.model_dump(exclude={"node_id", "reason"}) == trafik_node.model_dump(exclude={"node_id", "reason"})
+    assert kasko_node.node_id != trafik_node.node_id
+    assert kasko.KaskoPolice(reason="x").node_id != trafik.TrafikPolice(reason="x").node_id
+    assert BaseNode.compute_ids([kasko.Teminatlar(reason="y"), trafik.Teminatlar(reason="y")]) == [kasko_node.node_id, trafik_node.node_id]
+
+
+def test_unknown_identity_field_raises() -> None:
+    """Declaring an identity field the model does not have fails at class creation."""
+    with pytest.raises(ValueError, match="Identity field olmayan not found"):
+
+        class Broken(BaseNode):
+            node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
+                nodetag_index=False,
+                description="",
+                cardinality=False,
+                how_to_extract=HowToExtract.CASE_0,
+                nodeclass_to_be_created_automatically=None,
+                identity_fields=["olmayan"],
+            )
+
+
+def test_private_attributes_are_initialized_per_instance() -> None:
+    """Every node gets its own private dict and a subclass's own model_post_init still runs."""
+    first, second = Adres(reason="r", il="Ankara"), Adres.model_validate_json('{"reason": "r", "il": "Ankara"}')
+    first.__pydantic_private__["_node_id"] = "x"
+    assert second.__pydantic_private__ == {"_node_id": None, "_child_ids": None, "_frozen": False}
+
+    class PostInitNode(BaseNode):
+        etiket: str | None = None
+
+        def model_post_init(self, context: object, /) -> None:
+            self.__pydantic_private__["_frozen"] = True
+
+    assert PostInitNode(reason="r").__pydantic_private__["_frozen"] is True
@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+
+from sw_onto_generation.common.common_nodes import Adres, Insan
+from sw_onto_generation.extraction.bulk import dump_nodes, get_batch_model, load_node_list, load_nodes
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import Arac as KaskoArac
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import Teminat
+from sw_onto_generation.root.lib_LegalContract.onto_trafik_police.nodes import Arac as TrafikArac
+
+
+def test_batch_round_trip_keeps_content_and_ids() -> None:
+    """Dumped nodes load back grouped by class with the same node ids, nested nodes included."""
+    nodes = [
+        Insan(reason="r", ad="Ali", adres=Adres(reason="r", il="İzmir")),
+        Teminat(reason="r", teminat_adi="Çarpma"),
+        Insan(reason="r", ad="Ayşe"),
+    ]
+    loaded = load_nodes(dump_nodes(nodes), "LegalContract", "kasko_police")
+    assert list(loaded) == [Insan, Teminat]
+    assert [node.node_id for node in loaded[Insan]] == [nodes[0].node_id, nodes[2].node_id]
+    assert loaded[Insan][0].adres.il == "İzmir"
+    assert get_batch_model("LegalContract", "kasko_police") is get_batch_model("LegalContract", "kasko_police")
+
+
+def test_load_node_list_and_invalid_batches() -> None:
+    """Single-class arrays load directly, unknown classes, invalid nodes and name clashes are rejected."""
+    assert load_node_list(b'[{"reason": "r", "teminat_adi": "Yang\\u0131n"}]', Teminat)[0].teminat_adi == "Yangın"
+    with pytest.raises(ValidationError):
+        load_nodes(b'{"Demirbas": []}', "LegalContract", "kasko_police")
+    with pytest.raises(ValidationError):
+        load_nodes(b'{"Teminat": [{"reason": "r"}]}', "LegalContract", "kasko_police")
+    with pytest.raises(ValueError, match="can not share a batch"):
+        dump_nodes([KaskoArac.model_construct(reason="r"), TrafikArac.model_construct(reason="r")])
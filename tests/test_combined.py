@@ -0,0 +1,45 @@
+import pytest
+
+from sw_onto_generation.common.common_nodes import GeneralDocumentInfo, Insan
+from sw_onto_generation.extraction.combined import get_combined_model
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import Acente, Teminat
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.relations import HasSigortali
+
+
+def test_combined_model_respects_cardinality() -> None:
+    """Nodes with cardinality become lists, others optional, relations come last."""
+    model = get_combined_model("LegalContract", "kasko_police")
+    assert model is get_combined_model("LegalContract", "kasko_police")
+    assert model.node_fields["teminat"] is Teminat
+    assert model.node_fields["acente"] is Acente
+    assert list(model.model_fields)[-1] == "relations"
+    assert model().teminat == []
+    assert model().kasko_police is None
+    assert "ek_kloz" in model.model_json_schema()["properties"]
+
+
+def test_split_resolves_relation_references() -> None:
+    """References like insan[0] point at the extracted nodes."""
+    model = get_combined_model("LegalContract", "kasko_police")
+    response = model.model_validate(
+        {
+            "general_document_info": {"reason": "r"},
+            "insan": [{"reason": "r", "ad": "Ali"}, {"reason": "r", "ad": "Ayşe"}],
+            "teminat": [{"reason": "r", "teminat_adi": "Çarpma"}],
+            "relations": {"has_sigortali": [{"source_node": "general_document_info", "target_node": "insan[1]", "reason": "r"}]},
+        }
+    )
+    nodes, relations = response.split()
+    assert [type(node) for node in nodes] == [GeneralDocumentInfo, Insan, Insan, Teminat]
+    assert len(relations) == 1
+    assert isinstance(relations[0], HasSigortali)
+    assert relations[0].target_node is nodes[2]
+
+
+def test_split_rejects_unknown_references() -> None:
+    """A reference to a missing node raises unless invalid relations are skipped."""
+    model = get_combined_model("LegalContract", "kasko_police")
+    response = model.model_validate({"general_document_info": {"reason": "r"}, "relations": {"has_sigortali": [{"source_node": "general_document_info", "target_node": "insan[3]", "reason": "r"}]}})
+    with pytest.raises(ValueError, match="insan\\[3\\] not found"):
+        response.split()
+    assert response.split(skip_invalid_relations=True)[1] == []
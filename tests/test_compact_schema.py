@@ -0,0 +1,50 @@
+import copy
+
+from sw_onto_generation.base.schema_cache import cached_json_schema
+from sw_onto_generation.extraction.combined import get_combined_model
+from sw_onto_generation.extraction.compact_schema import compact_models_schema, compact_schema, estimate_tokens, fit_to_budget
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import Teminat
+
+
+def test_compact_schema_strips_keywords_but_not_field_names() -> None:
+    """title and null defaults are dropped, a field named title would stay, the input is not modified."""
+    schema = {
+        "title": "X",
+        "type": "object",
+        "properties": {"title": {"title": "Title", "anyOf": [{"type": "string"}, {"type": "null"}], "default": None}},
+    }
+    original = copy.deepcopy(schema)
+    assert compact_schema(schema) == {"type": "object", "properties": {"title": {"type": ["string", "null"]}}}
+    assert schema == original
+
+    raw = cached_json_schema(Teminat)
+    compact = compact_schema(raw)
+    assert "title" not in compact
+    assert set(compact["properties"]) == set(raw["properties"])
+    assert estimate_tokens(compact) < estimate_tokens(raw)
+
+
+def test_identical_defs_are_merged_and_renamed() -> None:
+    """Arac of kasko and trafik clash in pydantic, identical definitions are merged under short names."""
+    schema = {
+        "$defs": {"a__nodes__Arac": {"type": "string"}, "b__nodes__Arac": {"type": "string"}, "Ref__1": {"$ref": "#/$defs/b__nodes__Arac"}},
+        "items": {"$ref": "#/$defs/Ref__1"},
+    }
+    assert compact_schema(schema) == {"$defs": {"Arac": {"type": "string"}, "Ref": {"$ref": "#/$defs/Arac"}}, "items": {"$ref": "#/$defs/Ref"}}
+
+    models = [get_combined_model("LegalContract", "kasko_police"), get_combined_model("LegalContract", "trafik_police")]
+    shared = compact_models_schema(models)
+    assert not any("__" in name for name in shared["$defs"])
+    assert estimate_tokens(shared) < sum(estimate_tokens(compact_schema(cached_json_schema(model))) for model in models)
+
+
+def test_fit_to_budget_truncates_descriptions() -> None:
+    """Descriptions are cut to the longest length that fits, without budget pressure nothing changes."""
+    schema = compact_schema(cached_json_schema(get_combined_model("LegalContract", "kira")))
+    assert fit_to_budget(schema, estimate_tokens(schema)) == (schema, None)
+
+    budget = estimate_tokens(schema) * 3 // 4
+    fitted, limit = fit_to_budget(schema, budget)
+    assert limit is not None and limit > 0
+    assert estimate_tokens(fitted) <= budget
+    assert estimate_tokens(fit_to_budget(schema, budget + 200)[0]) > estimate_tokens(fitted)
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from sw_onto_generation.common.common_nodes import Adres, Insan
+from sw_onto_generation.nebula.async_sink import AsyncGraphSink
+from sw_onto_generation.nebula.dedup import VertexDeduplicator
+from sw_onto_generation.nebula.fake_graphd import FakeGraphd
+
+
+def _people(count: int) -> list[Insan]:
+    return [Insan(reason="r", ad=f"Kişi {i}") for i in range(count)]
+
+
+def test_statements_arrive_in_order_with_one_connection() -> None:
+    """With one connection and one statement in flight the server sees the batches in production order."""
+
+    async def run() -> FakeGraphd:
+        async with FakeGraphd() as server, AsyncGraphSink(server.connect, space="kasko", pool_size=1, max_in_flight=1, batch_size=3) as sink:
+            await sink.write_nodes(_people(10))
+        return server
+
+    server = asyncio.run(run())
+    statements = [recorded.statement for recorded in server.statements]
+    assert statements[0] == "USE `kasko`"
+    names = [name for statement in statements[1:] for name in statement.split('"Kişi ')[1:]]
+    assert [int(name.split('"')[0]) for name in names] == list(range(10))
+    assert len(statements) == 5 and server.connections == 1
+
+
+def test_concurrency_is_bounded_by_pool_and_in_flight_limit() -> None:
+    """Workers sharing a sink use at most pool_size connections and every row arrives once."""
+
+    async def run() -> tuple[FakeGraphd, AsyncGraphSink]:
+        async with FakeGraphd(latency=0.005) as server, AsyncGraphSink(server.connect, pool_size=3, max_in_flight=5, batch_size=2) as sink:
+            await asyncio.gather(*(sink.write_nodes(_people(20)) for _ in range(4)))
+        return server, sink
+
+    server, sink = asyncio.run(run())
+    assert server.max_concurrency == 3 and server.connections == 3
+    assert sum(recorded.statement.count('":(') for recorded in server.statements) == 80
+    assert sink.statements_sent == len(server.statements) == 40
+
+
+def test_failed_and_dropped_statements_are_retried() -> None:
+    """Error answers and dropped connections are retried on a new connection until accepted."""
+
+    async def run() -> tuple[FakeGraphd, AsyncGraphSink]:
+        async with FakeGraphd(fail_every=4, drop_every=7) as server, AsyncGraphSink(server.connect, pool_size=2, max_retries=5, backoff=0.001, batch_size=1) as sink:
+            await sink.write_nodes(_people(30))
+        return server, sink
+
+    server, sink = asyncio.run(run())
+    assert len(server.statements) == 30
+    assert sink.retries == server.failed + server.dropped > 0
+    assert server.connections == sink.connections_opened > 2
+
+
+def test_sink_fails_after_retries() -> None:
+    """A statement failing on every attempt is raised from flush."""
+
+    async def run() -> None:
+        async with FakeGraphd(fail_every=1) as server, AsyncGraphSink(server.connect, max_retries=2, backoff=0.0) as sink:
+            await sink.write_nodes(_people(1))
+
+    with pytest.raises(RuntimeError, match="after 2 retries"):
+        asyncio.run(run())
+
+
+def test_timed_out_statements_are_retried_on_a_new_connection() -> None:
+    """A statement outliving the timeout drops its connection and is retried, the sink fails when every attempt times out."""
+
+    async def run(sink_holder: list[AsyncGraphSink]) -> None:
+        async with FakeGraphd(latency=0.5) as server, AsyncGraphSink(server.connect, max_retries=1, backoff=0.0, timeout=0.05) as sink:
+            sink_holder.append(sink)
+            await sink.write_nodes(_people(1))
+
+    holder: list[AsyncGraphSink] = []
+    with pytest.raises(RuntimeError, match="after 1 retries"):
+        asyncio.run(run(holder))
+    assert holder[0].timeouts == 2 and holder[0].connections_opened == 2
+
+
+def test_vertex_filter_learns_only_accepted_vids() -> None:
+    """VIDs reach the deduplicator once graphd accepts their statement and are released when every attempt fails."""
+
+    async def run(deduplicator: VertexDeduplicator, fail_every: int) -> None:
+        async with FakeGraphd(fail_every=fail_every) as server, AsyncGraphSink(server.connect, max_retries=0, batch_size=2, vertex_filter=deduplicator) as sink:
+            await sink.write_nodes([Adres(reason="r", il=il) for il in ("Ankara", "İzmir", "Ankara")])
+
+    deduplicator = VertexDeduplicator(capacity=1_000)
+    with pytest.raises(RuntimeError, match="after 0 retries"):
+        asyncio.run(run(deduplicator, fail_every=1))
+    assert deduplicator.pending == 0 and deduplicator.bloom.count == 0
+
+    asyncio.run(run(deduplicator, fail_every=0))
+    assert deduplicator.pending == 0 and deduplicator.bloom.count == 2
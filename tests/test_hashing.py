@@ -0,0 +1,73 @@
+from typing import ClassVar
+
+import pytest
+from pydantic import Field
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import HowToExtract, NodeModelConfig
+from sw_onto_generation.base.hashing import (
+    HashAlgorithm,
+    canonical_bytes,
+    get_default_hash_algorithm,
+    get_hash_function,
+    register_hash_function,
+    set_default_hash_algorithm,
+)
+from sw_onto_generation.common.common_nodes import Adres
+
+
+class Blake2bNode(BaseNode):
+    node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
+        nodetag_index=False,
+        description="Test node",
+        cardinality=False,
+        how_to_extract=HowToExtract.CASE_0,
+        nodeclass_to_be_created_automatically=None,
+        hash_algorithm=HashAlgorithm.BLAKE2B_128,
+    )
+    açıklama: str | None = Field(default=None, description="Açıklama")
+
+
+def test_canonical_bytes_sorts_keys_and_keeps_utf8() -> None:
+    """Keys are sorted recursively and non-ASCII text is not escaped."""
+    encoded = canonical_bytes({"ilçe": "Kadıköy", "b": {"z": 1, "a": None}, "a": [True]})
+    assert encoded == '{"a":[true],"b":{"a":null,"z":1},"ilçe":"Kadıköy"}'.encode()
+
+
+def test_builtin_digest_lengths() -> None:
+    """Each built-in digest has its documented hex length."""
+    assert len(get_hash_function(HashAlgorithm.SHA256)(b"x")) == 64
+    assert len(get_hash_function(HashAlgorithm.BLAKE2B_128)(b"x")) == 32
+
+
+def test_xxh64_digest() -> None:
+    """xxh64 gives a 16 hex character digest when xxhash is installed."""
+    pytest.importorskip("xxhash")
+    assert len(get_hash_function(HashAlgorithm.XXH64)(b"x")) == 16
+
+
+def test_unknown_algorithm_raises() -> None:
+    """Selecting an unregistered digest fails loudly."""
+    with pytest.raises(ValueError, match="not found"):
+        get_hash_function("md4")
+    with pytest.raises(ValueError, match="not found"):
+        set_default_hash_algorithm("md4")
+
+
+def test_per_class_algorithm() -> None:
+    """NodeModelConfig.hash_algorithm overrides the process default."""
+    node = Blake2bNode(reason="test", açıklama="örnek")
+    assert node.identity_dict() == {"açıklama": "örnek", "__node_type__": Blake2bNode._node_type}
+    assert node.node_id == get_hash_function(HashAlgorithm.BLAKE2B_128)(canonical_bytes(node.identity_dict()))
+
+
+def test_default_algorithm_and_registered_function() -> None:
+    """A registered digest can be selected as the process default."""
+    register_hash_function("constant", lambda data: "c0ffee")
+    previous = get_default_hash_algorithm()
+    try:
+        set_default_hash_algorithm("constant")
+        assert Adres(reason="test").node_id == "c0ffee"
+        assert Blake2bNode(reason="test").node_id != "c0ffee"
+    finally:
+        set_default_hash_algorithm(previous)
@@ -0,0 +1,51 @@
+import pytest
+
+from sw_onto_generation.base.intern_pool import NodeInternPool
+from sw_onto_generation.common.common_nodes import Adres, Sirket
+
+
+def test_intern_returns_one_shared_instance() -> None:
+    """Equal nodes map to the first interned instance and duplicates are counted."""
+    pool = NodeInternPool()
+    first = pool.intern(Sirket(reason="a", unvan="Sigorta A.Ş.", vkn="1234567890"))
+    second = pool.intern(Sirket(reason="b", unvan="Sigorta A.Ş.", vkn="1234567890"))
+
+    assert second is first
+    stats = pool.stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.bytes_saved > 0
+
+
+def test_nested_nodes_are_interned() -> None:
+    """Nested nodes share the pooled instance too."""
+    pool = NodeInternPool()
+    adres = pool.intern(Adres(reason="a", il="İstanbul", ilçe="Ataşehir"))
+    sirket = pool.intern(Sirket(reason="b", unvan="Acente Ltd.", adres=Adres(reason="c", il="İstanbul", ilçe="Ataşehir")))
+    assert sirket.adres is adres
+
+
+def test_interned_nodes_are_immutable() -> None:
+    """Interned nodes reject assignment, copies of them do not."""
+    pool = NodeInternPool()
+    adres = pool.intern(Adres(reason="a", il="İzmir"))
+    with pytest.raises(ValueError, match="interned"):
+        adres.il = "Ankara"
+
+    copied = adres.model_copy(update={"il": "Ankara"})
+    copied.ilçe = "Çankaya"
+    assert copied.node_id != adres.node_id
+    assert adres.il == "İzmir"
+
+
+def test_lru_eviction() -> None:
+    """The least recently used node is evicted once max_size is exceeded."""
+    pool = NodeInternPool(max_size=2)
+    first = pool.intern(Adres(reason="a", il="İzmir"))
+    pool.intern(Adres(reason="a", il="Ankara"))
+    pool.intern(Adres(reason="a", il="İzmir"))
+    pool.intern(Adres(reason="a", il="Bursa"))
+
+    assert len(pool) == 2
+    assert pool.stats.evictions == 1
+    assert first in pool
+    assert Adres(reason="a", il="Ankara") not in pool
@@ -0,0 +1,40 @@
+from sw_onto_generation.common.common_nodes import Ek, Ekler, GeneralDocumentInfo
+from sw_onto_generation.common.common_relations import HasEk, HasSozlesmeEkler
+from sw_onto_generation.extraction.materialize import get_container_materializer
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import Indirim, Indirimler
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.relations import HasIndirim, HasIndirimler
+
+
+def test_materialize_builds_containers_and_edges() -> None:
+    """One container per container class, linked to the document and to every child."""
+    gdi = GeneralDocumentInfo(reason="r")
+    ekler = [Ek(reason="r", ek_aciklama="Ek-1"), Ek(reason="r", ek_aciklama="Ek-2")]
+    indirim = Indirim(reason="r", indirim_turu="HASARSIZLIK İNDİRİMİ")
+    containers, relations = get_container_materializer("LegalContract", "kasko_police").materialize([gdi, *ekler, indirim])
+
+    assert sorted(type(container).__name__ for container in containers) == ["Ekler", "Indirimler"]
+    edges = {(type(relation), type(relation.source_node), type(relation.target_node)) for relation in relations}
+    assert {(HasSozlesmeEkler, GeneralDocumentInfo, Ekler), (HasEk, Ekler, Ek), (HasIndirimler, GeneralDocumentInfo, Indirimler), (HasIndirim, Indirimler, Indirim)} <= edges
+    assert sum(isinstance(relation, HasEk) for relation in relations) == 2
+
+
+def test_container_id_depends_on_children() -> None:
+    """Containers of documents with different children are different nodes, the same children give the same id."""
+    materializer = get_container_materializer("LegalContract", "kira")
+    first = materializer.build_containers([Ek(reason="r", ek_aciklama="Ek-1")])[0]
+    second = materializer.build_containers([Ek(reason="r", ek_aciklama="Ek-2")])[0]
+    again = materializer.build_containers([Ek(reason="x", ek_aciklama="Ek-1")])[0]
+    assert first.node_id != second.node_id
+    assert first.node_id == again.node_id
+    assert isinstance(first, Ekler)
+    assert first.ek_var is True
+
+
+def test_container_id_survives_json_round_trip_and_copy() -> None:
+    """The member ids are a real field, so the id is kept by JSON round trips and by a copy with a new reason."""
+    materializer = get_container_materializer("LegalContract", "kira")
+    ek = Ek(reason="r", ek_aciklama="Ek-1")
+    container = materializer.build_containers([ek])[0]
+    assert container.uye_node_idleri == [ek.node_id]
+    assert Ekler.model_validate_json(container.model_dump_json()).node_id == container.node_id
+    assert container.model_copy(update={"reason": "başka"}).node_id == container.node_id
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from sw_onto_generation.base.configs import VidMode
+from sw_onto_generation.nebula.ddl import IndexDefinition, IndexField, build_space_schema, diff_schemas, load_snapshot, render_script, save_snapshot
+
+
+def test_full_schema_follows_model_configs() -> None:
+    """Tags, edges and indexes come from NodeModelConfig, NodeFieldConfig and RelationModelConfig."""
+    schema = build_space_schema("LegalContract", "kasko_police", vid_mode=VidMode.INT64_CONTENT)
+    assert schema.vid_type == "INT64"
+    assert schema.tags["Insan"]["adres"] == "int64"
+    assert schema.tags["KaskoPolice"]["toplam_sayfa_sayisi"] == "int64"
+    assert schema.tag_indexes["idx_Insan_tckn"] == IndexDefinition(schema_name="Insan", fields=[IndexField(name="tckn", length=64)])
+    assert schema.tag_indexes["idx_Insan"].fields == []
+    assert "Teminat.reason" in schema.skipped_vector_fields
+    assert "source_node" not in schema.edges["HasSigortali"]
+
+    statements = diff_schemas(None, schema)
+    assert statements[0].startswith("CREATE SPACE IF NOT EXISTS `LegalContract_kasko_police`") and statements[0].endswith("vid_type = INT64)")
+    assert "CREATE TAG INDEX IF NOT EXISTS `idx_Insan_tckn` ON `Insan`(`tckn`(64))" in statements
+    assert not any(statement.startswith("REBUILD") for statement in statements)
+    assert render_script(statements, schema).startswith("# VECTOR index of")
+
+
+def test_diff_only_touches_changes(tmp_path: Path) -> None:
+    """An unchanged schema needs nothing, a tweak only alters and rebuilds what it touches."""
+    old = build_space_schema("LegalContract", "kasko_police")
+    save_snapshot(old, tmp_path / "schema.json")
+    old = load_snapshot(tmp_path / "schema.json")
+    assert load_snapshot(tmp_path / "missing.json") is None
+    assert diff_schemas(old, build_space_schema("LegalContract", "kasko_police")) == []
+
+    new = build_space_schema("LegalContract", "kasko_police")
+    new.tags["Teminat"]["yeni_alan"] = "string"
+    new.tags["Insan"]["tckn"] = "int64"
+    new.tag_indexes["idx_Teminat_yeni_alan"] = IndexDefinition(schema_name="Teminat", fields=[IndexField(name="yeni_alan", length=64)])
+    new.tags["YeniTag"] = {"reason": "string"}
+    new.tag_indexes["idx_YeniTag"] = IndexDefinition(schema_name="YeniTag")
+    del new.tags["Istisna"]
+    assert diff_schemas(old, new) == [
+        "USE `LegalContract_kasko_police`",
+        "DROP TAG INDEX IF EXISTS `idx_Insan_tckn`",
+        "ALTER TAG `Insan` CHANGE (`tckn` int64 NULL)",
+        "ALTER TAG `Teminat` ADD (`yeni_alan` string NULL)",
+        "CREATE TAG IF NOT EXISTS `YeniTag`(`reason` string NULL)",
+        "CREATE TAG INDEX IF NOT EXISTS `idx_Insan_tckn` ON `Insan`(`tckn`(64))",
+        "CREATE TAG INDEX IF NOT EXISTS `idx_Teminat_yeni_alan` ON `Teminat`(`yeni_alan`(64))",
+        "CREATE TAG INDEX IF NOT EXISTS `idx_YeniTag` ON `YeniTag`()",
+        "REBUILD TAG INDEX `idx_Insan_tckn`, `idx_Teminat_yeni_alan`",
+    ]
+    assert "DROP TAG IF EXISTS `Istisna`" in diff_schemas(old, new, allow_drop=True)
+
+
+def test_vid_type_change_is_rejected() -> None:
+    """A space can not change its vid_type."""
+    with pytest.raises(ValueError, match="create a new space"):
+        diff_schemas(build_space_schema("LegalContract", "kira"), build_space_schema("LegalContract", "kira", vid_mode=VidMode.INT64_RANDOM))
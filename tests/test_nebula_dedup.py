@@ -0,0 +1,101 @@
+import pytest
+
+from sw_onto_generation.common.common_nodes import Adres, GeneralDocumentInfo, Insan
+from sw_onto_generation.nebula.dedup import BloomFilter, VertexDeduplicator
+from sw_onto_generation.nebula.writer import NgqlWriter
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives() -> None:
+    """Every added key is found, unknown keys are found at about the configured rate."""
+    bloom = BloomFilter(capacity=2_000, error_rate=0.01)
+    assert sum(bloom.add(f"vid-{i}") for i in range(2_000)) < 20
+    assert all(f"vid-{i}" in bloom for i in range(2_000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(20_000))
+    assert false_positives < 20_000 * 0.02
+    assert bloom.expected_error_rate == pytest.approx(0.01, rel=0.2)
+    assert 123 not in bloom and not bloom.add(123) and 123 in bloom
+
+
+def test_bloom_filter_round_trips_through_file(tmp_path) -> None:
+    """A saved filter is loaded with the same bits and settings, other files are rejected."""
+    bloom = BloomFilter(capacity=100, error_rate=0.001)
+    bloom.add("a")
+    bloom.save(tmp_path / "vids.bloom")
+    loaded = BloomFilter.load(tmp_path / "vids.bloom")
+    assert "a" in loaded and loaded.bits == bloom.bits
+    assert (loaded.capacity, loaded.hash_count, loaded.count) == (100, bloom.hash_count, 1)
+
+    (tmp_path / "other").write_bytes(b"not a filter")
+    with pytest.raises(ValueError, match="not a Bloom filter"):
+        BloomFilter.load(tmp_path / "other")
+
+
+def test_deduplicator_records_only_confirmed_vids() -> None:
+    """Pending VIDs are skipped within the run, confirmed ones hit the LRU or the Bloom filter, released ones are forgotten."""
+    deduplicator = VertexDeduplicator(capacity=100, lru_size=1)
+    assert [deduplicator(vid) for vid in ("a", "a", "b")] == [False, True, False]
+    assert deduplicator.pending == 2 and "a" not in deduplicator.bloom
+
+    deduplicator.confirm(["a", "b"])
+    deduplicator.release(["a"])
+    assert [deduplicator(vid) for vid in ("b", "a")] == [True, True]
+    assert (deduplicator.misses, deduplicator.pending_hits, deduplicator.lru_hits, deduplicator.bloom_hits, deduplicator.hits) == (2, 1, 1, 1, 3)
+
+    assert not deduplicator("c")
+    deduplicator.release(["c"])
+    assert deduplicator.pending == 0 and not deduplicator("c")
+
+
+def test_writer_skips_vertices_written_in_earlier_runs(tmp_path) -> None:
+    """Shared nodes are written once per run and not at all once the saved filter knows them, nodes with identity fields always are."""
+    path = tmp_path / "vids.bloom"
+    adres = Adres(reason="r", il="Ankara")
+
+    def run() -> tuple[list[str], NgqlWriter]:
+        statements: list[str] = []
+        deduplicator = VertexDeduplicator(path, capacity=1_000)
+        with NgqlWriter(statements.append, vertex_filter=deduplicator) as writer:
+            writer.write_nodes([GeneralDocumentInfo(reason="r"), Insan(reason="r", ad="Ali", adres=adres), Insan(reason="r", ad="Veli", adres=adres), GeneralDocumentInfo(reason="r")])
+        deduplicator.save()
+        return statements, writer
+
+    statements, writer = run()
+    assert (writer.vertices_written, writer.vertices_skipped) == (4, 2)
+    assert sum(statement.count('":(') for statement in statements) == 4
+
+    statements, writer = run()
+    assert (writer.vertices_written, writer.vertices_skipped) == (2, 4)
+    assert all(statement.startswith("INSERT VERTEX `Insan`") for statement in statements)
+
+
+def test_writer_writes_children_of_skipped_and_changed_vertices() -> None:
+    """A known VID does not hide a changed nested node, and a node with identity fields is rewritten with its new fields."""
+    deduplicator = VertexDeduplicator(capacity=1_000)
+    statements: list[str] = []
+    with NgqlWriter(statements.append, vertex_filter=deduplicator) as writer:
+        writer.write_node(Insan(reason="r", tckn="12345678901", ad="Ali", adres=Adres(reason="r", il="Ankara")))
+        writer.flush()
+        statements.clear()
+        writer.write_node(Insan(reason="r", tckn="12345678901", ad="Ali", adres=Adres(reason="r", il="İzmir")))
+    assert (writer.vertices_written, writer.vertices_skipped) == (4, 0)
+    assert any("İzmir" in statement for statement in statements)
+    assert any(statement.startswith("INSERT VERTEX `Insan`") for statement in statements)
+
+
+def test_writer_does_not_record_vids_of_failed_statements() -> None:
+    """VIDs of a statement the sink rejects are released and written again on the next attempt."""
+    deduplicator = VertexDeduplicator(capacity=1_000)
+
+    def failing_sink(statement: str) -> None:
+        raise ConnectionError("graphd is down")
+
+    writer = NgqlWriter(failing_sink, vertex_filter=deduplicator)
+    writer.write_node(Adres(reason="r", il="Ankara"))
+    with pytest.raises(ConnectionError):
+        writer.flush()
+    assert deduplicator.pending == 0 and deduplicator.bloom.count == 0
+
+    statements: list[str] = []
+    with NgqlWriter(statements.append, vertex_filter=deduplicator) as writer:
+        writer.write_node(Adres(reason="r", il="Ankara"))
+    assert writer.vertices_written == 1 and deduplicator.bloom.count == 1
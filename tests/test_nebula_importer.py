@@ -0,0 +1,85 @@
+import csv
+
+import pytest
+
+from sw_onto_generation.common.common_nodes import Adres, GeneralDocumentInfo, Insan
+from sw_onto_generation.nebula.importer import NULL_VALUE, ImporterExporter
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.relations import HasSigortali
+
+
+def _read(path) -> list[list[str]]:
+    with path.open(encoding="utf-8", newline="") as file:
+        return list(csv.reader(file))
+
+
+def test_rows_are_sharded_per_class(tmp_path) -> None:
+    """Every class gets its own shards, nested nodes are rows of their own tag and text survives CSV quoting."""
+    with ImporterExporter(tmp_path, "LegalContract", "kasko_police", rows_per_shard=2) as exporter:
+        people = [Insan(reason='satır\n"iki"', ad=f"Ayşe {i}", adres=Adres(reason="r", il="İzmir") if i == 0 else None) for i in range(3)]
+        exporter.write_nodes(people)
+        exporter.write_relation(HasSigortali(source_node=GeneralDocumentInfo(reason="r"), target_node=people[1], reason="otomatik"))
+
+    assert exporter.exports["Insan"].shards == ["Insan/Insan.00000.csv", "Insan/Insan.00001.csv"]
+    assert exporter.exports["Insan"].rows == 3 and exporter.exports["Adres"].rows == 1
+    rows = _read(tmp_path / "Insan/Insan.00000.csv") + _read(tmp_path / "Insan/Insan.00001.csv")
+    columns = ["vid", *exporter.schema.tags["Insan"]]
+    first = dict(zip(columns, rows[0], strict=True))
+    assert first["vid"] == people[0].node_id and first["reason"] == 'satır\n"iki"' and first["ad"] == "Ayşe 0"
+    assert first["adres"] == people[0].adres.node_id
+    assert dict(zip(columns, rows[1], strict=True))["adres"] == NULL_VALUE
+
+    edge = _read(tmp_path / "HasSigortali/HasSigortali.00000.csv")
+    assert edge == [[GeneralDocumentInfo(reason="r").node_id, people[1].node_id, "otomatik"]]
+
+
+def test_importer_config_maps_columns(tmp_path) -> None:
+    """The YAML config lists every shard with the VID and property columns of its tag or edge type."""
+    yaml = pytest.importorskip("yaml")
+    with ImporterExporter(tmp_path, "LegalContract", "kasko_police", rows_per_shard=1) as exporter:
+        exporter.write_nodes([Insan(reason="r", ad="Ali"), Insan(reason="r", ad="Veli")])
+        exporter.write_relation(HasSigortali(source_node=GeneralDocumentInfo(reason="r"), target_node=Insan(reason="r", ad="Ali"), reason="x"))
+    config = yaml.safe_load((tmp_path / "importer.yaml").read_text(encoding="utf-8"))
+
+    assert config["clientSettings"]["space"] == "LegalContract_kasko_police"
+    assert [file["path"] for file in config["files"]] == ["Insan/Insan.00000.csv", "Insan/Insan.00001.csv", "HasSigortali/HasSigortali.00000.csv"]
+    vertex = config["files"][0]["schema"]["vertex"]
+    assert vertex["vid"] == {"index": 0, "type": "string"}
+    assert [prop["name"] for prop in vertex["tags"][0]["props"]] == list(exporter.schema.tags["Insan"])
+    edge = config["files"][2]["schema"]["edge"]
+    assert edge["srcVID"]["index"] == 0 and edge["dstVID"]["index"] == 1 and edge["props"][0] == {"name": "reason", "type": "string", "index": 2, "nullable": True, "nullValue": NULL_VALUE}
+
+
+def test_unknown_class_is_rejected(tmp_path) -> None:
+    """Nodes of another ontology have no tag in the space."""
+    from sw_onto_generation.root.lib_LegalContract.onto_trafik_police.nodes import TrafikPolice
+
+    exporter = ImporterExporter(tmp_path, "LegalContract", "kasko_police")
+    with pytest.raises(ValueError, match="not a tag"):
+        exporter.write_node(TrafikPolice(reason="r"))
+
+
+def test_same_named_class_of_another_ontology_is_rejected(tmp_path) -> None:
+    """A class sharing its name with a tag of the space is not written into that tag's files."""
+    from sw_onto_generation.root.lib_LegalContract.onto_trafik_police.nodes import Arac
+
+    exporter = ImporterExporter(tmp_path, "LegalContract", "kasko_police")
+    with pytest.raises(ValueError, match="onto_trafik_police.nodes.Arac is not a tag"):
+        exporter.write_node(Arac(reason="r"))
+    assert "Arac" in exporter.schema.tags and exporter.exports == {}
+
+
+def test_vids_come_from_the_ontology_allocator(tmp_path) -> None:
+    """Exported int64 VIDs are the ones the ontology's shared allocator gives the writers."""
+    from sw_onto_generation.base.configs import VidMode
+    from sw_onto_generation.base.vid import get_vid_allocator, set_ontology_vid_mode
+
+    set_ontology_vid_mode("LegalContract", "kasko_police", VidMode.INT64_SNOWFLAKE)
+    try:
+        node = Insan(reason="r", ad="Ali")
+        writer_vid = get_vid_allocator("LegalContract", "kasko_police").vid(node)
+        with ImporterExporter(tmp_path, "LegalContract", "kasko_police") as exporter:
+            exporter.write_node(node)
+        assert exporter.vid_mode == VidMode.INT64_SNOWFLAKE
+        assert _read(tmp_path / "Insan/Insan.00000.csv")[0][0] == str(writer_vid)
+    finally:
+        set_ontology_vid_mode("LegalContract", "kasko_police", VidMode.FIXED_STRING)
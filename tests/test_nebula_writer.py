@@ -0,0 +1,87 @@
+import io
+import socket
+
+import pytest
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import VidMode
+from sw_onto_generation.base.vid import VidAllocator
+from sw_onto_generation.common.common_nodes import Adres, GeneralDocumentInfo, Insan
+from sw_onto_generation.nebula.writer import NgqlWriter, file_sink, ngql_string, socket_sink
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import KaskoPolice
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.relations import HasSigortali
+
+
+def test_strings_are_escaped_for_ngql() -> None:
+    """Quotes, backslashes and line breaks are escaped, Turkish characters are kept."""
+    assert ngql_string('Şirket "Ağaç"\\ İş\nçıkışı\t\x01') == '"Şirket \\"Ağaç\\"\\\\ İş\\nçıkışı\\t "'
+
+
+def test_rows_are_batched_per_tag() -> None:
+    """Full buffers are emitted right away, flush emits the rest with vertices before edges."""
+    statements: list[str] = []
+    writer = NgqlWriter(statements.append, batch_size=2, space="LegalContract_kasko_police")
+    writer.write_nodes(Insan(reason="r", ad=f"Ayşe {i}") for i in range(3))
+    assert statements[0] == "USE `LegalContract_kasko_police`"
+    assert statements[1].startswith("INSERT VERTEX `Insan`(`reason`, `ad`, ")
+    assert statements[1].count('":(') == 2
+
+    police = KaskoPolice(reason="r", toplam_sayfa_sayisi=3)
+    writer.write_relation(HasSigortali(source_node=GeneralDocumentInfo(reason="r"), target_node=Insan(reason="r", ad="Ali"), reason="otomatik"))
+    writer.write_node(police)
+    with writer:
+        pass
+    assert statements[2].startswith("INSERT VERTEX `Insan`") and statements[2].count('":(') == 1
+    assert statements[3].startswith("INSERT VERTEX `KaskoPolice`") and ", 3, " in statements[3]
+    assert statements[4].startswith('INSERT EDGE `HasSigortali`(`reason`) VALUES "') and '"->"' in statements[4]
+    assert (writer.vertices_written, writer.edges_written, writer.statements_written) == (4, 1, 4)
+
+
+def test_nested_nodes_are_written_as_vertices_with_int64_vids() -> None:
+    """Insan.adres becomes an Adres vertex, the Insan row holds its VID."""
+    output = io.StringIO()
+    allocator = VidAllocator(VidMode.INT64_CONTENT)
+    adres = Adres(reason="r", il="İzmir")
+    with NgqlWriter(file_sink(output), vid_allocator=allocator) as writer:
+        writer.write_node(Insan(reason="r", ad="Ali", adres=adres))
+    lines = output.getvalue().splitlines()
+    assert lines[0].startswith("INSERT VERTEX `Adres`(`reason`, `il`, ") and f"{allocator.vid(adres)}:(" in lines[0]
+    assert lines[1].startswith("INSERT VERTEX `Insan`") and f", {allocator.vid(adres)}, " in lines[1]
+    assert all(line.endswith(";") for line in lines)
+
+
+def test_json_scalars_are_written_without_json_quotes() -> None:
+    """Dates and enums are stored as their plain text, lists and dicts as JSON."""
+    from datetime import date
+    from enum import Enum
+
+    class Durum(Enum):
+        AKTIF = "aktif"
+
+    class Odeme(BaseNode):
+        tarih: date | None = None
+        durum: Durum | None = None
+        tutarlar: list[float] | None = None
+
+    statements: list[str] = []
+    with NgqlWriter(statements.append) as writer:
+        writer.write_node(Odeme(reason="r", tarih=date(2024, 1, 1), durum=Durum.AKTIF, tutarlar=[1.5, 2.0]))
+    assert statements[0].endswith(':("r", "2024-01-01", "aktif", "[1.5,2.0]")')
+
+
+def test_invalid_batch_size() -> None:
+    """A batch size of 0 is rejected."""
+    with pytest.raises(ValueError, match="positive"):
+        NgqlWriter(print, batch_size=0)
+
+
+def test_socket_sink_sends_one_statement_per_line() -> None:
+    """Statements arrive over the socket UTF-8 encoded and terminated by a semicolon."""
+    left, right = socket.socketpair()
+    with left, right:
+        with NgqlWriter(socket_sink(left), space="test") as writer:
+            writer.write_node(Insan(reason="r", ad="Gül"))
+        left.shutdown(socket.SHUT_WR)
+        received = b"".join(iter(lambda: right.recv(4096), b"")).decode()
+    assert received.startswith("USE `test`;\nINSERT VERTEX `Insan`")
+    assert '"Gül"' in received and received.endswith(");\n")
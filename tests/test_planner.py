@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from sw_onto_generation.extraction.planner import AUTOMATIC_RELATIONS_STEP, ExtractionPlan, ExtractionStep, StepKind, get_extraction_plan
+
+
+def test_plan_orders_containers_after_children() -> None:
+    """CASE_1 containers wait for their children, CASE_2 nodes get no step, relations wait for their endpoints."""
+    plan = get_extraction_plan("LegalContract", "kira")
+    assert plan.steps["node:Demirbaslar"].kind == StepKind.MATERIALIZE_CONTAINER
+    assert plan.steps["node:Demirbaslar"].depends_on == ("node:Demirbas",)
+    assert "node:Adres" not in plan.steps
+    assert "node:Insan" in plan.steps["relation:HasKiraci"].depends_on
+    assert plan.order.index("node:Demirbas") < plan.order.index("node:Demirbaslar")
+    assert plan.order.index(AUTOMATIC_RELATIONS_STEP) > plan.order.index("node:Demirbaslar")
+
+
+def test_critical_path_counts_llm_calls() -> None:
+    """Without durations the critical path length is the number of LLM calls on the longest chain."""
+    path, length = get_extraction_plan("LegalContract", "kasko_police").critical_path()
+    assert length == 2.0
+    assert path[-1].startswith("relation:")
+
+
+def test_run_executes_independent_steps_concurrently() -> None:
+    """Steps get their dependencies' results and the wall time follows the critical path, not the sum."""
+    plan = ExtractionPlan(
+        [
+            ExtractionStep(name="a", kind=StepKind.EXTRACT_NODE),
+            ExtractionStep(name="b", kind=StepKind.EXTRACT_NODE),
+            ExtractionStep(name="c", kind=StepKind.EXTRACT_RELATION, depends_on=("a", "b")),
+        ]
+    )
+
+    async def handler(step: ExtractionStep, dependencies: dict[str, Any]) -> str:
+        await asyncio.sleep(0.05)
+        return step.name + "".join(dependencies.values())
+
+    report = asyncio.run(plan.run({StepKind.EXTRACT_NODE: handler, StepKind.EXTRACT_RELATION: handler}))
+    assert report.results["c"] == "cab"
+    assert report.critical_path[-1] == "c"
+    assert report.wall_seconds < report.sequential_seconds
+
+
+def test_plan_rejects_unknown_dependencies_and_missing_handlers() -> None:
+    """Plans are validated before they run."""
+    with pytest.raises(ValueError, match="unknown step"):
+        ExtractionPlan([ExtractionStep(name="a", kind=StepKind.EXTRACT_NODE, depends_on=("x",))])
+    with pytest.raises(ValueError, match="cycle"):
+        ExtractionPlan([ExtractionStep(name="a", kind=StepKind.EXTRACT_NODE, depends_on=("b",)), ExtractionStep(name="b", kind=StepKind.EXTRACT_NODE, depends_on=("a",))])
+    plan = ExtractionPlan([ExtractionStep(name="a", kind=StepKind.EXTRACT_NODE)])
+    with pytest.raises(ValueError, match="No handler"):
+        asyncio.run(plan.run({}))
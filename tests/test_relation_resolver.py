@@ -0,0 +1,44 @@
+from sw_onto_generation.common.common_nodes import GeneralDocumentInfo, Sirket, SozlesmeBaslangicTarihi
+from sw_onto_generation.common.common_relations import HasBaslangicTarihi
+from sw_onto_generation.relation_resolver import RelationResolver, get_relation_resolver
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import Acente
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.relations import HasAcente, HasEskiTrafikPoliceSigortaSirketi, HasOncekiAcente, HasSigortali
+
+
+def test_index_skips_llm_relations() -> None:
+    """Relations with ask_llm=True are left out of the index."""
+    resolver = get_relation_resolver("LegalContract", "kasko_police")
+    assert resolver.candidates(GeneralDocumentInfo, Acente) == [HasAcente]
+    assert resolver.candidates(GeneralDocumentInfo, Sirket) == []
+    assert HasSigortali not in resolver.index.values() and resolver.ambiguous == {}
+
+
+def test_one_acente_gets_one_edge() -> None:
+    """An extracted agent is linked by its current-agent relation only."""
+    gdi, acente = GeneralDocumentInfo(reason="a"), Acente(reason="a", unvan="Acente A.Ş.")
+    relations = get_relation_resolver("LegalContract", "kasko_police").resolve([gdi, acente])
+    assert [type(relation) for relation in relations] == [HasAcente]
+
+
+def test_closest_endpoint_wins_and_ambiguous_pairs_are_skipped(monkeypatch) -> None:
+    """A relation declaring Acente overrides one declaring Sirket, two relations declaring Acente leave the pair unresolved."""
+    monkeypatch.setattr(HasEskiTrafikPoliceSigortaSirketi.relation_config, "ask_llm", False)
+    resolver = RelationResolver("LegalContract", "kasko_police")
+    assert resolver.candidates(GeneralDocumentInfo, Sirket) == [HasEskiTrafikPoliceSigortaSirketi]
+    assert resolver.candidates(GeneralDocumentInfo, Acente) == [HasAcente]
+
+    monkeypatch.setattr(HasOncekiAcente.relation_config, "ask_llm", False)
+    resolver = RelationResolver("LegalContract", "kasko_police")
+    assert resolver.ambiguous == {(GeneralDocumentInfo, Acente): [HasOncekiAcente, HasAcente]}
+    assert resolver.resolve([GeneralDocumentInfo(reason="a"), Acente(reason="a")]) == []
+
+
+def test_resolve_emits_edges_between_present_nodes() -> None:
+    """Only class pairs present in the node set produce relations."""
+    gdi = GeneralDocumentInfo(reason="a")
+    baslangic = SozlesmeBaslangicTarihi(reason="a", baslangic_tarihi="01.01.2025")
+    relations = get_relation_resolver("LegalContract", "kira").resolve([gdi, baslangic])
+    assert [type(relation) for relation in relations] == [HasBaslangicTarihi]
+    assert relations[0].source_node is gdi
+    assert relations[0].target_node is baslangic
+    assert get_relation_resolver("LegalContract", "kira").resolve([gdi]) == []
@@ -0,0 +1,92 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from pydantic import Field
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.common.common_nodes import GeneralDocumentInfo, Insan
+from sw_onto_generation.extraction.response_cache import ResponseCache, document_hash
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.relations import HasSigortali
+
+
+class CachedHarf(BaseNode):
+    harf: str | None = Field(default=None, description="Harf")
+
+
+class CachedRakam(BaseNode):
+    rakam: int | None = Field(default=None, description="Rakam")
+
+
+def test_response_round_trips_through_disk(tmp_path: Path) -> None:
+    """Lists and single instances come back as validated instances, also from a new cache on the same directory."""
+    doc = document_hash(b"pdf")
+    cache = ResponseCache(tmp_path)
+    assert cache.get(doc, Insan) is None
+    cache.put(doc, Insan, [Insan(reason="r", ad="Ali"), Insan(reason="r", ad="Ayşe")])
+    relation = HasSigortali(source_node=GeneralDocumentInfo(reason="r"), target_node=Insan(reason="r", ad="Ali"), reason="r")
+    cache.put(doc, HasSigortali, relation)
+
+    reopened = ResponseCache(tmp_path)
+    assert [insan.ad for insan in reopened.get(doc, Insan)] == ["Ali", "Ayşe"]
+    assert reopened.get(doc, HasSigortali).model_dump() == relation.model_dump()
+    assert (reopened.hits, reopened.misses, len(reopened)) == (2, 0, 2)
+
+
+def test_entries_written_by_another_process_are_hits(tmp_path: Path) -> None:
+    """An entry written through another cache on the same directory after start-up is found on disk."""
+    doc = document_hash(b"pdf")
+    cache, other = ResponseCache(tmp_path), ResponseCache(tmp_path)
+    other.put(doc, Insan, Insan(reason="r", ad="Ali"))
+    assert cache.get(doc, Insan).ad == "Ali"
+    assert (cache.hits, cache.misses, len(cache)) == (1, 0, 1)
+    assert cache.size_bytes == other.size_bytes
+
+
+def test_description_change_invalidates_only_that_class(tmp_path: Path) -> None:
+    """After a description tweak only the changed class misses, its stale entry can be pruned."""
+    doc = document_hash(b"pdf")
+    cache = ResponseCache(tmp_path)
+    cache.put(doc, CachedHarf, [CachedHarf(reason="r", harf="a")])
+    cache.put(doc, CachedRakam, [CachedRakam(reason="r", rakam=1)])
+
+    CachedHarf.set_field_description("harf", "Küçük harf")
+    assert cache.get(doc, CachedHarf) is None
+    assert cache.get(doc, CachedRakam)[0].rakam == 1
+    assert cache.prune_stale([CachedHarf, CachedRakam]) == 1
+    assert len(cache) == 1
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path: Path) -> None:
+    """Entries beyond max_bytes are evicted oldest first, a hit refreshes an entry."""
+    cache = ResponseCache(tmp_path, max_bytes=10_000)
+    entry_size = None
+    for i in range(3):
+        cache.put(document_hash(str(i).encode()), CachedRakam, [CachedRakam(reason="r", rakam=i)])
+        entry_size = entry_size or cache.size_bytes
+    cache.max_bytes = entry_size * 3
+    assert cache.get(document_hash(b"0"), CachedRakam) is not None
+
+    cache.put(document_hash(b"3"), CachedRakam, [CachedRakam(reason="r", rakam=3)])
+    assert cache.evictions == 1
+    assert cache.get(document_hash(b"1"), CachedRakam) is None
+    assert cache.get(document_hash(b"0"), CachedRakam) is not None
+    assert cache.size_bytes <= cache.max_bytes
+
+
+def test_get_or_extract_calls_model_once(tmp_path: Path) -> None:
+    """The second extraction of the same document is served from the cache."""
+    cache = ResponseCache(tmp_path)
+    calls = []
+
+    async def extract() -> list[BaseNode]:
+        calls.append(1)
+        return [CachedRakam(reason="r", rakam=7)]
+
+    doc = document_hash(b"pdf")
+    for _ in range(2):
+        assert asyncio.run(cache.get_or_extract(doc, CachedRakam, extract))[0].rakam == 7
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError, match="positive"):
+        ResponseCache(tmp_path, max_bytes=0)
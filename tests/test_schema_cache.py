@@ -0,0 +1,53 @@
+import json
+from typing import ClassVar
+
+from pydantic import Field
+
+from sw_onto_generation.base.base_node import BaseNode
+from sw_onto_generation.base.configs import HowToExtract, NodeModelConfig
+from sw_onto_generation.base.schema_cache import cached_json_schema, cached_json_schema_bytes
+
+
+class SchemaChild(BaseNode):
+    isim: str | None = Field(default=None, description="Çocuğun ismi")
+
+
+class SchemaParent(BaseNode):
+    node_config: ClassVar[NodeModelConfig] = NodeModelConfig(
+        nodetag_index=False,
+        description="Test için ebeveyn node",
+        cardinality=False,
+        how_to_extract=HowToExtract.CASE_0,
+        nodeclass_to_be_created_automatically=None,
+    )
+
+    cocuk: SchemaChild | None = Field(default=None, description="Ebeveynin çocuğu")
+
+
+def test_schema_is_cached_and_serialized_once() -> None:
+    """Repeated calls return the same objects, bytes match the dict."""
+    schema = cached_json_schema(SchemaParent)
+    assert cached_json_schema(SchemaParent) is schema
+    assert cached_json_schema_bytes(SchemaParent) is cached_json_schema_bytes(SchemaParent)
+    assert json.loads(cached_json_schema_bytes(SchemaParent)) == schema
+    assert schema["description"] == "Test için ebeveyn node"
+
+
+def test_description_mutation_invalidates_nested_schemas() -> None:
+    """Changing a nested model's field description shows up in the parent's cached schema."""
+    before = cached_json_schema(SchemaParent)
+    SchemaChild.set_field_description("isim", "Yeni açıklama")
+    after = cached_json_schema(SchemaParent)
+    assert after is not before
+    assert after["$defs"]["SchemaChild"]["properties"]["isim"]["description"] == "Yeni açıklama"
+
+    SchemaParent.append_field_description("cocuk", "ek bilgi")
+    assert cached_json_schema(SchemaParent)["properties"]["cocuk"]["description"] == "Ebeveynin çocuğu ek bilgi"
+
+
+def test_config_description_change_invalidates_schemas() -> None:
+    """Assigning a new node_config description in place shows up in the cached schemas of the class and its parents."""
+    cached_json_schema(SchemaParent)
+    SchemaParent.node_config.description = "Değişen açıklama"
+    assert cached_json_schema(SchemaParent)["description"] == "Değişen açıklama"
+    assert json.loads(cached_json_schema_bytes(SchemaParent))["description"] == "Değişen açıklama"
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+from pydantic import ValidationError
+
+from sw_onto_generation.common.common_nodes import Insan
+from sw_onto_generation.extraction.combined import get_combined_model
+from sw_onto_generation.extraction.streaming import NodeStreamParser, aiter_nodes, iter_nodes
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.nodes import KaskoPolice, Teminat
+
+
+def chunked(text: str, size: int) -> list[bytes]:
+    data = text.encode()
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_nodes_are_yielded_when_their_object_closes() -> None:
+    """A node comes out in the chunk that closes it, braces and escapes inside strings are ignored."""
+    parser = NodeStreamParser(Teminat)
+    assert parser.feed('{"items": [{"reason": "r", "teminat_adi": "Cam {kırılması} \\"dahil\\""}') != []
+    assert parser.feed(', {"reason": "r", "teminat_') == []
+    nodes = parser.feed('adi": "Çarpma"}]}')
+    assert [node.teminat_adi for node in nodes] == ["Çarpma"]
+    assert parser.done
+    parser.close()
+
+
+def test_chunk_boundaries_do_not_matter() -> None:
+    """Splitting the bytes anywhere, even inside a multi-byte character, yields the same nodes as one parse."""
+    payload = [{"reason": "r", "ad": f"Ayşe {i}", "adres": {"reason": "r", "il": "İstanbul"}} for i in range(5)]
+    text = json.dumps(payload, ensure_ascii=False)
+    expected = [Insan.model_validate(item).model_dump() for item in payload]
+    for size in (1, 2, 7, len(text)):
+        assert [node.model_dump() for node in iter_nodes(chunked(text, size), NodeStreamParser(Insan))] == expected
+
+
+def test_combined_response_yields_every_node_field() -> None:
+    """Arrays and single objects of a combined model are parsed, relations are skipped."""
+    model = get_combined_model("LegalContract", "kasko_police")
+    text = json.dumps(
+        {
+            "kasko_police": {"reason": "r"},
+            "teminat": [{"reason": "r", "teminat_adi": "Çarpma"}, {"reason": "r", "teminat_adi": "Yangın"}],
+            "relations": {"has_sigortali": [{"source_node": "kasko_police", "target_node": "insan[0]", "reason": "r"}]},
+        }
+    )
+
+    async def stream() -> AsyncIterator[str]:
+        for i in range(0, len(text), 10):
+            yield text[i : i + 10]
+
+    async def collect() -> list:
+        return [node async for node in aiter_nodes(stream(), NodeStreamParser.for_combined(model))]
+
+    nodes = asyncio.run(collect())
+    assert [type(node) for node in nodes] == [KaskoPolice, Teminat, Teminat]
+
+
+def test_invalid_nodes_raise_or_are_collected() -> None:
+    """Validation errors surface per node, truncated responses fail on close."""
+    text = '[{"reason": "r"}, {"reason": "r", "teminat_adi": "Çarpma"}]'
+    with pytest.raises(ValidationError):
+        NodeStreamParser(Teminat).feed(text)
+    parser = NodeStreamParser(Teminat, skip_invalid=True)
+    assert len(parser.feed(text)) == 1
+    assert len(parser.errors) == 1
+
+    parser = NodeStreamParser(Teminat)
+    parser.feed('[{"reason": "r", "teminat_adi": "Çar')
+    with pytest.raises(ValueError, match="inside a Teminat"):
+        parser.close()
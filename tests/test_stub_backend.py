@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+import pytest
+
+from sw_onto_generation import DIR_STRUCTURE
+from sw_onto_generation.common.common_nodes import Insan
+from sw_onto_generation.extraction.combined import get_combined_model
+from sw_onto_generation.extraction.stub_backend import StubLLMBackend
+
+
+def test_responses_validate_for_every_ontology() -> None:
+    """Combined responses validate and every relation reference points at a fabricated node."""
+    backend = StubLLMBackend()
+    for lib_name, ontology_names in DIR_STRUCTURE.items():
+        for ontology_name in ontology_names:
+            model = get_combined_model(lib_name, ontology_name)
+            nodes, relations = model.model_validate_json(asyncio.run(backend.complete(model, "doc"))).split()
+            assert nodes
+            assert relations
+    assert backend.calls == sum(len(ontology_names) for ontology_names in DIR_STRUCTURE.values())
+
+
+def test_responses_are_deterministic_per_document() -> None:
+    """Same seed and document give the same response, another document gives other node ids."""
+    first, second = StubLLMBackend(seed=1), StubLLMBackend(seed=1)
+    assert first.respond(Insan, "a") == second.respond(Insan, "a")
+    assert Insan.model_validate(first.fabricate(Insan, 'a "1"')).node_id != Insan.model_validate(first.fabricate(Insan, "b")).node_id
+
+
+def test_latency_and_jitter_are_simulated() -> None:
+    """A call takes at least latency - jitter, invalid settings are rejected."""
+    backend = StubLLMBackend(latency=0.03, jitter=0.01)
+    start = time.perf_counter()
+    asyncio.run(backend.complete(Insan, "a"))
+    assert time.perf_counter() - start >= 0.02
+    with pytest.raises(ValueError, match="items_per_list"):
+        StubLLMBackend(items_per_list=0)
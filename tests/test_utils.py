@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from sw_onto_generation.base.configs import HowToExtract
+from sw_onto_generation.common import common_relations
+from sw_onto_generation.common.common_nodes import GeneralDocumentInfo, Insan, Sirket
+from sw_onto_generation.root.lib_LegalContract.onto_ihtiyac_kredisi import relations as ihtiyac_kredisi_relations
+from sw_onto_generation.root.lib_LegalContract.onto_kasko_police.relations import HasSigortali
+from sw_onto_generation.utils import get_all_common_and_root_classes, get_all_common_and_specific_root_classes, get_ontology_registry, get_relation_endpoint_types
+
+
+def test_registry_is_built_once() -> None:
+    """The registry is a process-wide singleton and class lists are deterministic."""
+    assert get_ontology_registry() is get_ontology_registry()
+    assert get_all_common_and_root_classes() == get_all_common_and_root_classes()
+
+
+def test_get_class_prefers_ontology_specific_class() -> None:
+    """A class defined in an ontology shadows the common class with the same name."""
+    registry = get_ontology_registry()
+    assert registry.get_class("LegalContract", "ihtiyac_kredisi", "HasKefil") is ihtiyac_kredisi_relations.HasKefil
+    assert registry.get_class("LegalContract", "kira", "HasKefil") is common_relations.HasKefil
+    assert registry.get_class("LegalContract", "kira", "Insan") is Insan
+    with pytest.raises(ValueError, match="not found"):
+        registry.get_class("LegalContract", "kira", "Arac")
+
+
+def test_common_and_specific_classes_keep_shadowed_common_classes() -> None:
+    """get_all_common_and_specific_root_classes still lists a common class shadowed by an ontology class."""
+    _, relations = get_all_common_and_specific_root_classes("LegalContract", "ihtiyac_kredisi")
+    assert common_relations.HasKefil in relations
+    assert ihtiyac_kredisi_relations.HasKefil in relations
+    assert common_relations.HasKefil not in get_ontology_registry().relation_classes("LegalContract", "ihtiyac_kredisi")
+
+
+def test_node_classes_by_case() -> None:
+    """Nodes are indexed by their HowToExtract case."""
+    registry = get_ontology_registry()
+    case_0 = registry.node_classes_by_case(HowToExtract.CASE_0, "LegalContract", "kasko_police")
+    assert GeneralDocumentInfo in case_0
+    assert all(node_cls.node_config.how_to_extract == HowToExtract.CASE_0 for node_cls in case_0)
+
+
+def test_relations_between_expands_unions() -> None:
+    """Relations declared with a union endpoint are found under each member of the union."""
+    registry = get_ontology_registry()
+    assert get_relation_endpoint_types(HasSigortali, "target_node") == (Insan, Sirket)
+    assert HasSigortali in registry.relations_between(GeneralDocumentInfo, Insan, "LegalContract", "kasko_police")
+    assert HasSigortali in registry.relations_between(GeneralDocumentInfo, Sirket, "LegalContract", "kasko_police")
+    assert HasSigortali not in registry.relations_between(GeneralDocumentInfo, Sirket, "LegalContract", "kira")
+
+
+def test_loading_one_ontology_does_not_import_the_others() -> None:
+    """Ontology modules are imported on first use only."""
+    code = (
+        "import sys\n"
+        "from sw_onto_generation.utils import get_all_common_and_specific_root_classes\n"
+        "get_all_common_and_specific_root_classes('LegalContract', 'kira')\n"
+        "print(sorted(name for name in sys.modules if name.endswith(('.nodes', '.relations')) and '.onto_' in name))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert "onto_kira.nodes" in result.stdout
+    assert "onto_kasko_police" not in result.stdout
+
+
+def test_warm_up_builds_deferred_models() -> None:
+    """With SW_ONTO_DEFER_BUILD=1 models are built on first use or by warm_up_models."""
+    code = (
+        "from sw_onto_generation.common.common_nodes import Adres, Insan\n"
+        "from sw_onto_generation.utils import warm_up_models\n"
+        "assert not Adres.__pydantic_complete__\n"
+        "Adres(reason='a', il='İzmir')\n"
+        "assert Adres.__pydantic_complete__\n"
+        "warm_up_models([Insan]).join()\n"
+        "assert Insan.__pydantic_complete__\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "SW_ONTO_DEFER_BUILD": "1"})  # noqa: S603
@@ -0,0 +1,64 @@
+import pytest
+
+from sw_onto_generation.base.configs import VidMode
+from sw_onto_generation.base.vid import (
+    MAX_INT64_VID,
+    VidAllocator,
+    VidCollisionError,
+    content_vid,
+    get_ontology_vid_mode,
+    get_vid_allocator,
+    nebula_vid_type,
+    set_ontology_vid_mode,
+)
+from sw_onto_generation.common.common_nodes import Adres
+
+
+def test_fixed_string_vid_is_node_id() -> None:
+    """The default mode keeps the hex node id."""
+    node = Adres(reason="a", il="İzmir")
+    assert VidAllocator().vid(node) == node.node_id
+    assert nebula_vid_type(VidMode.FIXED_STRING) == "FIXED_STRING(64)"
+
+
+def test_content_vid_is_deterministic_int64() -> None:
+    """Content VIDs are stable, non-negative and fit into a signed int64."""
+    node = Adres(reason="a", il="İzmir")
+    vid = VidAllocator(VidMode.INT64_CONTENT).vid(node)
+    assert vid == VidAllocator(VidMode.INT64_CONTENT).vid(Adres(reason="b", il="İzmir"))
+    assert vid == content_vid(node.node_id)
+    assert 0 <= vid <= MAX_INT64_VID
+    assert content_vid("f" * 64) == MAX_INT64_VID
+    assert nebula_vid_type(VidMode.INT64_CONTENT) == "INT64"
+
+
+def test_content_vid_collision_is_detected() -> None:
+    """Two node ids sharing their first 63 bits raise instead of silently merging vertices."""
+    allocator = VidAllocator(VidMode.INT64_CONTENT)
+    allocator.vid_for_id("0" * 16 + "a" * 48)
+    allocator.vid_for_id("0" * 16 + "a" * 48)
+    with pytest.raises(VidCollisionError):
+        allocator.vid_for_id("0" * 15 + "1" + "b" * 48)
+
+
+@pytest.mark.parametrize("mode", [VidMode.INT64_SNOWFLAKE, VidMode.INT64_RANDOM])
+def test_generated_vids_are_stable_per_node(mode: VidMode) -> None:
+    """Generated VIDs are assigned once per node id."""
+    allocator = VidAllocator(mode)
+    first, second = Adres(reason="a", il="İzmir"), Adres(reason="a", il="Ankara")
+    vids = allocator.vids([first, second, Adres(reason="b", il="İzmir")])
+    assert vids[0] == vids[2] != vids[1]
+    assert all(0 <= vid <= MAX_INT64_VID for vid in vids)
+    assert allocator.assigned == {first.node_id: vids[0], second.node_id: vids[1]}
+
+
+def test_vid_mode_is_selected_per_ontology() -> None:
+    """Each ontology has its own mode and allocator."""
+    set_ontology_vid_mode("LegalContract", "kasko_police", VidMode.INT64_CONTENT)
+    try:
+        assert get_vid_allocator("LegalContract", "kasko_police").mode == VidMode.INT64_CONTENT
+        assert get_ontology_vid_mode("LegalContract", "kira") == VidMode.FIXED_STRING
+        with pytest.raises(ValueError, match="not found"):
+            set_ontology_vid_mode("LegalContract", "olmayan", VidMode.INT64_CONTENT)
+    finally:
+        set_ontology_vid_mode("LegalContract", "kasko_police", VidMode.FIXED_STRING)